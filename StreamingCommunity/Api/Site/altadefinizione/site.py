@@ -15,18 +15,21 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
-def title_search(query: str) -> int:
+@cached_search(site_constant, media_search_manager, table_show_manager)
+def search_titles(query: str) -> int:
     """
     Search for titles based on a search query.
       
@@ -60,10 +63,6 @@ def title_search(query: str) -> int:
             bot.send_message(f"ERRORE\n\nErrore nella richiesta di ricerca:\n\n{e}", None)
         return 0
 
-    # Prepara le scelte per l'utente
-    if site_constant.TELEGRAM_BOT:
-        choices = []
-
     # Create soup istance
     soup = BeautifulSoup(response.text, "html.parser")
 
@@ -87,13 +86,25 @@ def title_search(query: str) -> int:
             'image': f"{site_constant.FULL_URL}{movie_div.find('img', class_='layer-image').get('data-src')}"
         })
 
-        if site_constant.TELEGRAM_BOT:
-            choice_text = f"{i} - {title} ({tipo})"
-            choices.append(choice_text)
-
-    if site_constant.TELEGRAM_BOT:
-        if choices:
-            bot.send_message("Lista dei risultati:", choices)
-	
     # Return the number of titles found
-    return media_search_manager.get_length()
\ No newline at end of file
+    return media_search_manager.get_length()
+
+
+def title_search(query: str) -> int:
+    """
+    Search for titles and list them on the Telegram bot, if enabled.
+    The message is built here from the results, so cached and fresh searches send the same list.
+
+    Parameters:
+        - query (str): The query to search for.
+
+    Returns:
+        int: The number of titles found.
+    """
+    len_database = search_titles(query)
+
+    if site_constant.TELEGRAM_BOT and len_database > 0:
+        choices = [f"{i} - {media.name} ({media.type})" for i, media in enumerate(media_search_manager.media_list)]
+        get_bot_instance().send_message("Lista dei risultati:", choices)
+
+    return len_database
\ No newline at end of file
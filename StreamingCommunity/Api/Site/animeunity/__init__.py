@@ -11,7 +11,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.Api.Template import get_select_title
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
@@ -23,6 +23,7 @@ from .serie import download_series
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 indice = 1
 _useFor = "Anime"
 _priority = 0
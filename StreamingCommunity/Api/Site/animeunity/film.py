@@ -4,10 +4,14 @@
 from rich.console import Console
 
 
+# Internal utilities
+from StreamingCommunity.Util.message import start_message
+
+
 # Logic class
 from .serie import download_episode
 from .util.ScrapeSerie import ScrapeSerieAnime
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -16,6 +20,7 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSourceAnime
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
@@ -37,4 +42,5 @@ def download_film(select_title: MediaItem):
     scrape_serie.is_series = False
 
     # Start download
+    start_message()
     download_episode(0, scrape_serie, video_source)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # 11.03.24
 
 import os
+import threading
 from typing import Tuple
 
 
@@ -17,20 +18,23 @@ from StreamingCommunity.TelegramHelp.telegram_bot import TelegramSession, get_bo
 
 # Logic class
 from .util.ScrapeSerie import ScrapeSerieAnime
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Util import manage_selection, dynamic_format_number
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Player
 from StreamingCommunity import MP4_downloader
+from StreamingCommunity.Lib.Downloader import download_episodes
 from StreamingCommunity.Api.Player.vixcloud import VideoSourceAnime
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 msg = Prompt()
 KILL_HANDLER = bool(False)
+video_source_lock = threading.Lock()    # VideoSourceAnime keeps per-episode state, episodes may run in parallel
 
 
 def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_source: VideoSourceAnime) -> Tuple[str,bool]:
@@ -44,10 +48,9 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
         - str: output path
         - bool: kill handler status
     """
-    start_message()
-
     # Get episode information
-    obj_episode = scrape_serie.selectEpisode(1, index_select)
+    with video_source_lock:
+        obj_episode = scrape_serie.selectEpisode(1, index_select)
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] ([cyan]E{obj_episode.number}[/cyan]) \n")
 
     if site_constant.TELEGRAM_BOT:
@@ -60,7 +63,9 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
             TelegramSession.updateScriptId(script_id, f"{scrape_serie.series_name} - E{obj_episode.number}")
 
     # Collect mp4 url
-    video_source.get_embed(obj_episode.id)
+    with video_source_lock:
+        video_source.get_embed(obj_episode.id)
+        mp4_url = str(video_source.src_mp4).strip()
 
     # Create output path
     mp4_name = f"{scrape_serie.series_name}_EP_{dynamic_format_number(str(obj_episode.number))}.mp4"
@@ -75,7 +80,7 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
 
     # Start downloading
     path, kill_handler = MP4_downloader(
-        url=str(video_source.src_mp4).strip(),
+        url=mp4_url,
         path=os.path.join(mp4_path, mp4_name)
     )
 
@@ -133,16 +138,14 @@ def download_series(select_title: MediaItem, season_selection: str = None, episo
 
     # Download selected episodes
     if len(list_episode_select) == 1 and last_command != "*":
+        start_message()
         path, _ = download_episode(list_episode_select[0]-1, scrape_serie, video_source)
         return path
 
     # Download all other episodes selected
     else:
-        kill_handler = False
-        for i_episode in list_episode_select:
-            if kill_handler:
-                break
-            _, kill_handler = download_episode(i_episode-1, scrape_serie, video_source)
+        start_message()
+        download_episodes(list_episode_select, lambda i: download_episode(i-1, scrape_serie, video_source))
 
     if site_constant.TELEGRAM_BOT:
         bot.send_message("Finito di scaricare tutte le serie e episodi", None)
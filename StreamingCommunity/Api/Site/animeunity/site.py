@@ -15,9 +15,11 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -51,17 +53,14 @@ def get_real_title(record: dict) -> str:
         return record.get('title_it', '')
 
 
-def title_search(query: str) -> int:
+@cached_search(site_constant, media_search_manager, table_show_manager)
+def search_titles(query: str) -> int:
     """
     Perform anime search on animeunity.so.
     """
-    if site_constant.TELEGRAM_BOT:
-        bot = get_bot_instance()
-
     media_search_manager.clear()
     table_show_manager.clear()
     seen_titles = set()
-    choices = [] if site_constant.TELEGRAM_BOT else None
 
     user_agent = get_userAgent()
     data = get_token(user_agent)
@@ -88,7 +87,7 @@ def title_search(query: str) -> int:
             timeout=max_timeout
         )
         response1.raise_for_status()
-        process_results(response1.json().get('records', []), seen_titles, media_search_manager, choices)
+        process_results(response1.json().get('records', []), seen_titles, media_search_manager)
 
     except Exception as e:
         console.print(f"[red]Site: {site_constant.SITE_NAME}, request search error: {e}")
@@ -115,14 +114,11 @@ def title_search(query: str) -> int:
             timeout=max_timeout
         )
         response2.raise_for_status()
-        process_results(response2.json().get('records', []), seen_titles, media_search_manager, choices)
+        process_results(response2.json().get('records', []), seen_titles, media_search_manager)
 
     except Exception as e:
         console.print(f"Site: {site_constant.SITE_NAME}, archivio search error: {e}")
 
-    if site_constant.TELEGRAM_BOT and choices and len(choices) > 0:
-        bot.send_message("List of results:", choices)
-
     result_count = media_search_manager.get_length()
     if result_count == 0:
         console.print(f"Nothing matching was found for: {query}")
@@ -130,9 +126,29 @@ def title_search(query: str) -> int:
     return result_count
 
 
-def process_results(records: list, seen_titles: set, media_manager: MediaManager, choices: list = None) -> None:
+def title_search(query: str) -> int:
     """
-    Add unique results to the media manager and to choices.
+    Search for anime and list them on the Telegram bot, if enabled.
+    The message is built here from the results, so cached and fresh searches send the same list.
+
+    Parameters:
+        - query (str): The query to search for.
+
+    Returns:
+        int: The number of titles found.
+    """
+    len_database = search_titles(query)
+
+    if site_constant.TELEGRAM_BOT and len_database > 0:
+        choices = [f"{i} - {media.name} ({media.type}) - Episodes: {media.episodes_count}" for i, media in enumerate(media_search_manager.media_list)]
+        get_bot_instance().send_message("List of results:", choices)
+
+    return len_database
+
+
+def process_results(records: list, seen_titles: set, media_manager: MediaManager) -> None:
+    """
+    Add unique results to the media manager.
     """
     for dict_title in records:
         try:
@@ -152,9 +168,6 @@ def process_results(records: list, seen_titles: set, media_manager: MediaManager
                 'episodes_count': dict_title.get('episodes_count'),
                 'image': dict_title.get('imageurl')
             })
-            
-            if choices is not None:
-                choice_text = f"{len(choices)} - {dict_title.get('name')} ({dict_title.get('type')}) - Episodes: {dict_title.get('episodes_count')}"
-                choices.append(choice_text)
+
         except Exception as e:
             print(f"Error parsing a title entry: {e}")
\ No newline at end of file
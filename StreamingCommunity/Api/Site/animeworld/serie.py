@@ -16,17 +16,19 @@ from StreamingCommunity.Util.message import start_message
 
 # Logic class
 from .util.ScrapeSerie import ScrapSerie
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Util import manage_selection, dynamic_format_number
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Player
 from StreamingCommunity import MP4_downloader
+from StreamingCommunity.Lib.Downloader import download_episodes
 from StreamingCommunity.Api.Player.sweetpixel import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 msg = Prompt()
 KILL_HANDLER = bool(False)
@@ -43,8 +45,6 @@ def download_episode(index_select: int, scrape_serie: ScrapSerie) -> Tuple[str,b
         - str: output path
         - bool: kill handler status
     """
-    start_message()
-
     # Get episode information
     episode_data = scrape_serie.selectEpisode(1, index_select)
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] ([cyan]E{index_select+1}[/cyan]) \n")
@@ -97,13 +97,11 @@ def download_series(select_title: MediaItem, episode_selection: str = None):
 
     # Download selected episodes
     if len(list_episode_select) == 1 and last_command != "*":
+        start_message()
         path, _ = download_episode(list_episode_select[0]-1, scrape_serie)
         return path
 
     # Download all selected episodes
     else:
-        kill_handler = False
-        for i_episode in list_episode_select:
-            if kill_handler:
-                break
-            _, kill_handler = download_episode(i_episode-1, scrape_serie)
\ No newline at end of file
+        start_message()
+        download_episodes(list_episode_select, lambda i: download_episode(i-1, scrape_serie))
\ No newline at end of file
@@ -16,11 +16,13 @@ from StreamingCommunity.Util.table import TVShowManager
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -57,6 +59,7 @@ def get_session_and_csrf() -> dict:
     logging.info(f"CSRF Token: {csrf_token}")
     return session_id, csrf_token
 
+@cached_search(site_constant, media_search_manager, table_show_manager)
 def title_search(query: str) -> int:
     """
     Function to perform an anime search using a provided title.
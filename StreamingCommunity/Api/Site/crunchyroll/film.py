@@ -15,7 +15,7 @@ from StreamingCommunity.Util.os import os_manager, get_wvd_path
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -25,6 +25,7 @@ from .util.get_license import get_playback_session, get_auth_token, generate_dev
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
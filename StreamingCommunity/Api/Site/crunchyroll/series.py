@@ -24,16 +24,18 @@ from StreamingCommunity.Api.Template.Util import (
     validate_episode_selection, 
     display_episodes_list
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Player
 from StreamingCommunity import DASH_Downloader
+from StreamingCommunity.Lib.Downloader import download_episodes
 from .util.get_license import get_playback_session, get_auth_token, generate_device_id
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
@@ -51,8 +53,6 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
         - str: Path to downloaded file
         - bool: Whether download was stopped
     """
-    start_message()
-
     # Get episode information
     obj_episode = scrape_serie.selectEpisode(index_season_selected, index_episode_selected-1)
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] → [bold magenta]{obj_episode.get('name')}[/bold magenta] ([cyan]S{index_season_selected}E{index_episode_selected}[/cyan]) \n")
@@ -118,11 +118,8 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
     episodes_count = len(episodes)
 
     if download_all:
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(range(1, episodes_count + 1), lambda i: download_video(index_season_selected, i, scrape_serie))
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -139,11 +136,8 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(list_episode_select, lambda i: download_video(index_season_selected, i, scrape_serie))
 
 def download_series(select_season: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
     """
@@ -22,17 +22,19 @@ from StreamingCommunity.Api.Template.Util import (
     validate_episode_selection, 
     display_episodes_list
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Player
 from .util.ScrapeSerie import GetSerieInfo
 from StreamingCommunity import HLS_Downloader
+from StreamingCommunity.Lib.Downloader import download_episodes
 from StreamingCommunity.Api.Player.supervideo import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
@@ -50,8 +52,6 @@ def download_video(index_season_selected: int, index_episode_selected: int, scap
         - str: Path to downloaded file
         - bool: Whether download was stopped
     """
-    start_message()
-
     # Get episode information
     obj_episode = scape_info_serie.selectEpisode(index_season_selected, index_episode_selected-1)
     index_season_selected = dynamic_format_number(str(index_season_selected))
@@ -99,11 +99,8 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
     if download_all:
         
         # Download all episodes in the season
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(range(1, episodes_count + 1), lambda i: download_video(index_season_selected, i, scape_info_serie))
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -121,11 +118,8 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(list_episode_select, lambda i: download_video(index_season_selected, i, scape_info_serie))
 
 
 def download_series(dict_serie: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
@@ -12,11 +12,13 @@ from StreamingCommunity.Util.table import TVShowManager
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -24,6 +26,7 @@ max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
 
+@cached_search(site_constant, media_search_manager, table_show_manager)
 def title_search(query: str) -> int:
     """
     Search for titles based on a search query.
@@ -15,7 +15,7 @@ from StreamingCommunity.Util.headers import get_headers
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -26,6 +26,7 @@ from .util.get_license import get_bearer_token, get_playback_url, get_tracking_i
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
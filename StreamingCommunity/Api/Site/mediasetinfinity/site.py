@@ -14,8 +14,9 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.os import get_wvd_path
 from StreamingCommunity.Util.headers import get_headers
 from StreamingCommunity.Util.table import TVShowManager
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
 
 # Logic class
@@ -23,12 +24,14 @@ from .util.get_license import get_bearer_token
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
+@cached_search(site_constant, media_search_manager, table_show_manager)
 def title_search(query: str) -> int:
     """
     Search for titles based on a search query.
@@ -19,7 +19,7 @@ from StreamingCommunity.Util.message import start_message
 
 # Logic class
 from .util.get_license import generate_license_url
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -29,6 +29,7 @@ from StreamingCommunity.Api.Player.mediapolisvod import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
@@ -9,8 +9,9 @@ from rich.console import Console
 from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.headers import get_userAgent
 from StreamingCommunity.Util.table import TVShowManager
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.search_cache import cached_search
 
 
 # Logic Import
@@ -18,6 +19,7 @@ from .util.ScrapeSerie import GetSerieInfo
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -49,6 +51,7 @@ def determine_media_type(item):
         return "film"
 
 
+@cached_search(site_constant, media_search_manager, table_show_manager)
 def title_search(query: str) -> int:
     """
     Search for titles based on a search query.
@@ -11,7 +11,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.Api.Template import get_select_title
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
@@ -22,6 +22,7 @@ from .series import download_series
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 indice = 0
 _useFor = "Film_&_Serie"
 _priority = 0
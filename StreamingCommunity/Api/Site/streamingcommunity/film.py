@@ -14,7 +14,7 @@ from StreamingCommunity.TelegramHelp.telegram_bot import TelegramSession, get_bo
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -24,6 +24,7 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
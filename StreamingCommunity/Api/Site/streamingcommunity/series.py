@@ -1,6 +1,7 @@
 # 3.12.23
 
 import os
+import threading
 from typing import Tuple
 
 
@@ -23,18 +24,21 @@ from StreamingCommunity.Api.Template.Util import (
     validate_episode_selection, 
     display_episodes_list
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Player
 from StreamingCommunity import HLS_Downloader
+from StreamingCommunity.Lib.Downloader import download_episodes
 from StreamingCommunity.Api.Player.vixcloud import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
+video_source_lock = threading.Lock()    # VideoSource keeps per-episode state, episodes may run in parallel
 
 
 def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, video_source: VideoSource) -> Tuple[str,bool]:
@@ -51,8 +55,6 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
         - str: Path to downloaded file
         - bool: Whether download was stopped
     """
-    start_message()
-
     # Get episode information
     obj_episode = scrape_serie.selectEpisode(index_season_selected, index_episode_selected-1)
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] → [cyan]{scrape_serie.series_name}[/cyan] \\ [bold magenta]{obj_episode.name}[/bold magenta] ([cyan]S{index_season_selected}E{index_episode_selected}[/cyan]) \n")
@@ -76,9 +78,10 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
     mp4_path = os.path.join(site_constant.SERIES_FOLDER, scrape_serie.series_name, f"S{index_season_selected}")
 
     # Retrieve scws and if available master playlist
-    video_source.get_iframe(obj_episode.id)
-    video_source.get_content()
-    master_playlist = video_source.get_playlist()
+    with video_source_lock:
+        video_source.get_iframe(obj_episode.id)
+        video_source.get_content()
+        master_playlist = video_source.get_playlist()
 
     # Download the episode
     hls_process = HLS_Downloader(
@@ -116,11 +119,8 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, vid
 
     if download_all:
         # Download all episodes in the season
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(range(1, episodes_count + 1), lambda i: download_video(index_season_selected, i, scrape_serie, video_source))
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -137,11 +137,8 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, vid
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        start_message()
+        download_episodes(list_episode_select, lambda i: download_video(index_season_selected, i, scrape_serie, video_source))
 
 
 def download_series(select_season: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
@@ -1,23 +1,15 @@
 # 01.03.24
 
-import json
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.headers import get_userAgent
-from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import SeasonManager
 
 
-# Variable
-max_timeout = config_manager.get_int("REQUESTS", "timeout")
-ssl_verify = config_manager.get_bool("REQUESTS", "verify")
+# Logic class
+from .inertia import inertia_get
 
 
 class GetSerieInfo:
@@ -48,17 +40,10 @@ class GetSerieInfo:
             Exception: If there's an error fetching series information
         """
         try:
-            response = httpx.get(
-                url=f"{self.url}/titles/{self.media_id}-{self.series_name}",
-                headers=self.headers,
-                timeout=max_timeout,
-                verify=ssl_verify
-            )
-            response.raise_for_status()
+            response = inertia_get(f"{self.url}/titles/{self.media_id}-{self.series_name}", headers=self.headers)
 
             # Extract series info from JSON response
-            soup = BeautifulSoup(response.text, "html.parser")
-            json_response = json.loads(soup.find("div", {"id": "app"}).get("data-page"))
+            json_response = response.json()
             self.version = json_response['version']
             
             # Extract information about available seasons
@@ -99,16 +84,7 @@ class GetSerieInfo:
                 logging.error(f"Season {number_season} not found")
                 return
             
-            response = httpx.get(
-                url=f'{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}', 
-                headers={
-                    'User-Agent': self.headers['user-agent'],
-                    'x-inertia': 'true',
-                    'x-inertia-version': self.version,
-                },
-                timeout=max_timeout,
-                verify=ssl_verify
-            )
+            response = inertia_get(f'{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}', headers=self.headers)
 
             # Extract episodes from JSON response
             json_response = response.json().get('props', {}).get('loadedSeason', {}).get('episodes', [])
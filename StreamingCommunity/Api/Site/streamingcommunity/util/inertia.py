@@ -0,0 +1,115 @@
+# 18.10.26
+
+import json
+import time
+import logging
+import threading
+from urllib.parse import urlparse
+from typing import Dict, Tuple
+
+
+# External libraries
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# Internal utilities
+from StreamingCommunity.Util.headers import get_userAgent
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Variable
+max_timeout = config_manager.get_int("REQUESTS", "timeout")
+ssl_verify = config_manager.get_bool("REQUESTS", "verify")
+VERSION_TTL = 3600
+_versions: Dict[str, Tuple[str, float]] = {}
+_versions_lock = threading.Lock()
+
+
+def _get_domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def parse_page(html: str) -> dict:
+    """
+    Return the Inertia page object (component, props, url, version) embedded in the 'data-page'
+    attribute of the #app div, parsing only that element of the document.
+    """
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("div", id="app"))
+    return json.loads(soup.find("div", {"id": "app"}).get("data-page"))
+
+
+def remember_version(url: str, version: str) -> None:
+    """Store the Inertia version seen in a response for the domain of `url`."""
+    if version:
+        with _versions_lock:
+            _versions[_get_domain(url)] = (version, time.time())
+
+
+def get_inertia_version(url: str, refresh: bool = False) -> str:
+    """
+    Return the Inertia asset version of the domain of `url`.
+
+    The version is read from the '/it' home page only when it is not cached, is older than
+    VERSION_TTL seconds or `refresh` is set; otherwise no request is made.
+
+    Parameters:
+        - url (str): Any URL of the site.
+        - refresh (bool): Ignore the cached version (e.g. after a 409 from the server).
+    """
+    domain = _get_domain(url)
+
+    with _versions_lock:
+        cached = _versions.get(domain)
+        if cached is not None and not refresh and time.time() - cached[1] < VERSION_TTL:
+            return cached[0]
+
+    parsed = urlparse(url)
+    response = httpx.get(
+        f"{parsed.scheme}://{parsed.netloc}/it",
+        headers={'user-agent': get_userAgent()},
+        timeout=max_timeout,
+        verify=ssl_verify,
+        follow_redirects=True
+    )
+    response.raise_for_status()
+
+    version = parse_page(response.text)['version']
+    logging.info(f"Inertia version of {domain}: {version}")
+    remember_version(url, version)
+    return version
+
+
+def inertia_get(url: str, headers: dict = None) -> httpx.Response:
+    """
+    Request a page as Inertia JSON using the cached version.
+
+    When the site has deployed new assets it answers 409 Conflict: the version is
+    refreshed and the request is sent once more.
+
+    Parameters:
+        - url (str): URL of the page.
+        - headers (dict): Extra headers (referer, user-agent, ...).
+
+    Returns:
+        httpx.Response: The successful response, its JSON is the Inertia page object.
+    """
+    for attempt in range(2):
+        request_headers = {'user-agent': get_userAgent(), **(headers or {})}
+        request_headers['x-inertia'] = 'true'
+        request_headers['x-inertia-version'] = get_inertia_version(url, refresh=attempt > 0)
+
+        response = httpx.get(url, headers=request_headers, timeout=max_timeout, verify=ssl_verify)
+        if response.status_code != 409:
+            break
+
+        logging.info(f"Inertia version mismatch on {url}, refreshing")
+
+    response.raise_for_status()
+
+    try:
+        remember_version(url, response.json().get('version'))
+    except ValueError:
+        pass
+
+    return response
@@ -13,7 +13,7 @@ from StreamingCommunity.Util.message import start_message
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -23,6 +23,7 @@ from StreamingCommunity.Api.Player.hdplayer import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
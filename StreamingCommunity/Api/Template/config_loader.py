@@ -1,16 +1,28 @@
 # 11.02.25
 
 import os
-import inspect
+import sys
+from typing import Dict
 
 
 # Internal utilities
 from StreamingCommunity.Util.config_json import config_manager
 
 
+# Variable
+_SITE_PACKAGE = "StreamingCommunity.Api.Site."
+_site_constants: Dict[str, "SiteConstant"] = {}
+
+
 def get_site_name_from_stack():
-    for frame_info in inspect.stack():
-        file_path = frame_info.filename
+    """
+    Find the site whose __init__ is in the call stack. Walks the raw frames instead of
+    inspect.stack(), which would also read the source context of every frame.
+    """
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        file_path = frame.f_code.co_filename
         
         if "__init__" in file_path:
             parts = file_path.split(f"Site{os.sep}")
@@ -18,13 +30,24 @@ def get_site_name_from_stack():
             if len(parts) > 1:
                 site_name = parts[1].split(os.sep)[0]
                 return site_name
+
+        frame = frame.f_back
     
     return None
 
 
 class SiteConstant:
+    def __init__(self, site_name: str = None):
+        """
+        Parameters:
+            - site_name (str): Site the constants belong to, None to find it from the call stack.
+        """
+        self._site_name = site_name
+
     @property
     def SITE_NAME(self):
+        if self._site_name is not None:
+            return self._site_name
         return get_site_name_from_stack()
     
     @property
@@ -68,4 +91,21 @@ class SiteConstant:
         return config_manager.get_bool('DEFAULT', 'telegram_bot')
 
 
+def get_site_constant(module_name: str) -> SiteConstant:
+    """
+    Return the constants of the site a module belongs to, bound once to the site name.
+
+    Parameters:
+        - module_name (str): `__name__` of a module inside StreamingCommunity.Api.Site.<site>.
+    """
+    site_name = None
+    if module_name.startswith(_SITE_PACKAGE):
+        site_name = module_name[len(_SITE_PACKAGE):].split('.')[0]
+
+    if site_name not in _site_constants:
+        _site_constants[site_name] = SiteConstant(site_name)
+
+    return _site_constants[site_name]
+
+
 site_constant = SiteConstant()
\ No newline at end of file
@@ -0,0 +1,231 @@
+# 18.10.26
+
+import os
+import json
+import time
+import logging
+import sqlite3
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+from StreamingCommunity.Util.os import os_summary
+
+
+# Config
+CACHE_TTL = config_manager.get_int('DEFAULT', 'search_cache_ttl')
+CACHE_SIZE = config_manager.get_int('DEFAULT', 'search_cache_size')
+CACHE_DISK = config_manager.get_bool('DEFAULT', 'search_cache_disk')
+
+
+# Variable
+CACHE_FILE_NAME = "search_cache.sqlite3"
+_cache: Optional["SearchCache"] = None
+_cache_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Case-insensitive query with collapsed whitespace, so 'The  Office ' and 'the office' share an entry."""
+    return " ".join(str(query).split()).casefold()
+
+
+class SearchCache:
+    """
+    Search results by (site, normalized query): an in-memory LRU, optionally backed by a SQLite file
+    so results survive restarts.
+
+    Each entry remembers the site's full_url it was fetched from and is dropped when the domain changes
+    or when it is older than `ttl` seconds.
+    """
+    def __init__(self, ttl: float, max_entries: int = 128, db_path: Optional[str] = None):
+        """
+        Parameters:
+            - ttl (float): Seconds an entry stays valid.
+            - max_entries (int): Entries kept in memory, least recently used are evicted first.
+            - db_path (str): SQLite file for the on-disk store, None to keep results in memory only.
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.lock = threading.Lock()
+        self.memory: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.db = self._open_db(db_path) if db_path else None
+
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "site TEXT, query TEXT, full_url TEXT, created REAL, items TEXT, "
+                "PRIMARY KEY (site, query))"
+            )
+            db.execute("DELETE FROM search_cache WHERE created < ?", (time.time() - self.ttl,))
+            db.commit()
+            return db
+
+        except sqlite3.Error as e:
+            logging.warning(f"Search cache on disk disabled ({db_path}): {e}")
+            return None
+
+    def _is_valid(self, full_url: str, created: float, current_url: str) -> bool:
+        return full_url == current_url and time.time() - created < self.ttl
+
+    def get(self, site: str, query: str, full_url: str) -> Optional[List[dict]]:
+        """
+        Return the cached results of a search, None if missing, expired or fetched from another domain.
+
+        Parameters:
+            - site (str): Site name.
+            - query (str): The search query.
+            - full_url (str): Current full_url of the site.
+        """
+        key = (site, normalize_query(query))
+
+        with self.lock:
+            entry = self.memory.get(key)
+
+            if entry is None and self.db is not None:
+                row = self.db.execute(
+                    "SELECT full_url, created, items FROM search_cache WHERE site = ? AND query = ?", key
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1], json.loads(row[2]))
+
+            if entry is None:
+                return None
+
+            if not self._is_valid(entry[0], entry[1], full_url):
+                self._delete(key)
+                return None
+
+            self.memory[key] = entry
+            self.memory.move_to_end(key)
+            self._evict()
+            return [dict(item) for item in entry[2]]
+
+    def set(self, site: str, query: str, full_url: str, items: List[dict]) -> None:
+        """
+        Store the results of a search.
+
+        Parameters:
+            - site (str): Site name.
+            - query (str): The search query.
+            - full_url (str): full_url of the site the results come from.
+            - items (list): One dict per media item, as passed to MediaManager.add_media.
+        """
+        key = (site, normalize_query(query))
+        entry = (full_url, time.time(), [dict(item) for item in items])
+
+        with self.lock:
+            self.memory[key] = entry
+            self.memory.move_to_end(key)
+            self._evict()
+
+            if self.db is not None:
+                try:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+                        (*key, full_url, entry[1], json.dumps(entry[2]))
+                    )
+                    self.db.commit()
+
+                except (TypeError, ValueError, sqlite3.Error) as e:
+                    logging.warning(f"Cannot store search of {site} on disk: {e}")
+
+    def invalidate(self, site: Optional[str] = None) -> None:
+        """Drop every entry of `site`, or the whole cache when `site` is None."""
+        with self.lock:
+            for key in [k for k in self.memory if site is None or k[0] == site]:
+                del self.memory[key]
+
+            if self.db is not None:
+                if site is None:
+                    self.db.execute("DELETE FROM search_cache")
+                else:
+                    self.db.execute("DELETE FROM search_cache WHERE site = ?", (site,))
+                self.db.commit()
+
+    def _delete(self, key: tuple) -> None:
+        self.memory.pop(key, None)
+        if self.db is not None:
+            self.db.execute("DELETE FROM search_cache WHERE site = ? AND query = ?", key)
+            self.db.commit()
+
+    def _evict(self) -> None:
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """
+    Return the process-wide search cache, None when disabled (search_cache_ttl <= 0).
+    """
+    global _cache
+
+    if CACHE_TTL <= 0:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            db_path = None
+            if CACHE_DISK:
+                binary_dir = os_summary.get_binary_directory()
+                os.makedirs(binary_dir, exist_ok=True)
+                db_path = os.path.join(binary_dir, CACHE_FILE_NAME)
+
+            _cache = SearchCache(CACHE_TTL, CACHE_SIZE, db_path)
+
+        return _cache
+
+
+def cached_search(site_constant, media_search_manager, table_show_manager=None) -> Callable:
+    """
+    Decorator for a site's `title_search(query)`: a repeated search is answered from the cache
+    by refilling `media_search_manager`, otherwise the site is queried and its results are stored.
+
+    The decorated function must only fill the manager: messages built from the results (e.g. the
+    Telegram list of choices) belong in the caller, so they are sent on a hit as well.
+
+    Parameters:
+        - site_constant (SiteConstant): Constants of the site (name and current full_url).
+        - media_search_manager (MediaManager): Manager filled by `title_search`.
+        - table_show_manager (TVShowManager): Table cleared by `title_search`, cleared on a hit too.
+    """
+    def decorator(title_search: Callable[[str], int]) -> Callable[[str], int]:
+
+        @functools.wraps(title_search)
+        def wrapper(query: str) -> int:
+            cache = get_search_cache()
+            if cache is None:
+                return title_search(query)
+
+            site_name = site_constant.SITE_NAME
+            try:
+                full_url = site_constant.FULL_URL
+            except Exception:
+                full_url = ""
+
+            items = cache.get(site_name, query, full_url)
+            if items is not None:
+                logging.info(f"Search cache hit: {site_name} '{query}'")
+
+                media_search_manager.clear()
+                if table_show_manager is not None:
+                    table_show_manager.clear()
+                for item in items:
+                    media_search_manager.add_media(item)
+
+                return media_search_manager.get_length()
+
+            len_database = title_search(query)
+            if len_database > 0:
+                cache.set(site_name, query, full_url, [media.__dict__ for media in media_search_manager.media_list])
+
+            return len_database
+
+        return wrapper
+
+    return decorator
@@ -7,9 +7,6 @@ import logging
 # External libraries
 import httpx
 from rich.console import Console
-from pywidevine.cdm import Cdm
-from pywidevine.device import Device
-from pywidevine.pssh import PSSH
 
 
 # Variable
@@ -30,6 +27,11 @@ def get_widevine_keys(pssh, license_url, cdm_device_path, headers=None, payload=
         list: List of dicts {'kid': ..., 'key': ...} (only CONTENT keys) or None if error.
     """
 
+    # Imported here so DRM-free downloads never load pywidevine
+    from pywidevine.cdm import Cdm
+    from pywidevine.device import Device
+    from pywidevine.pssh import PSSH
+
     # Check if PSSH is a valid base64 string
     try:
         base64.b64decode(pssh)
@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 
 # External libraries
@@ -14,6 +15,7 @@ from StreamingCommunity.Lib.FFmpeg.command import join_audios, join_video
 
 
 # Logic class
+from ..autoscale import ConcurrencyBudget, get_global_budget, get_progress_offset
 from .parser import MPDParser
 from .segments import MPD_Segments
 from .decrypt import decrypt_with_mp4decrypt
@@ -24,6 +26,7 @@ from .cdm_helpher import get_widevine_keys
 DOWNLOAD_SPECIFIC_AUDIO = config_manager.get_list('M3U8_DOWNLOAD', 'specific_list_audio')
 FILTER_CUSTOM_REOLUTION = str(config_manager.get('M3U8_CONVERSION', 'force_resolution')).strip().lower()
 CLEANUP_TMP = config_manager.get_bool('M3U8_DOWNLOAD', 'cleanup_tmp_folder')
+GLOBAL_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'global_max_workers')
 
 
 # Variable
@@ -86,6 +89,57 @@ class DASH_Downloader:
             return getattr(self, "selected_audio", None)
         return None
 
+    def _download_representations(self, reps):
+        """
+        Download the encrypted video and audio representations at the same time,
+        sharing 'global_max_workers' requests in flight. Sets self.error and self.stopped.
+        Returns True if every representation was downloaded, False otherwise.
+        """
+        pending = [rep for typ, rep in reps if not os.path.exists(os.path.join(self.encrypted_dir, f"{rep['id']}_encrypted.m4s"))]
+        budget = get_global_budget() or ConcurrencyBudget(GLOBAL_MAX_WORKERS if GLOBAL_MAX_WORKERS > 0 else 10 ** 6)
+
+        downloaders = [
+            MPD_Segments(
+                tmp_folder=self.encrypted_dir,
+                representation=rep,
+                pssh=self.parser.pssh,
+                budget=budget,
+                progress_position=(get_progress_offset() or 0) + position
+            )
+            for position, rep in enumerate(pending)
+        ]
+
+        if not downloaders:
+            return True
+
+        with ThreadPoolExecutor(max_workers=len(downloaders)) as executor:
+            futures = [executor.submit(downloader.download_streams) for downloader in downloaders]
+
+            try:
+                for future in futures:
+                    try:
+                        result = future.result()
+
+                        # Check for interruption or failure
+                        if result.get("stopped"):
+                            self.stopped = True
+                            self.error = "Download interrupted"
+
+                        elif result.get("nFailed", 0) > 0 and not self.error:
+                            self.error = f"Failed segments: {result['nFailed']}"
+
+                    except Exception as ex:
+                        self.error = self.error or str(ex)
+
+            except KeyboardInterrupt:
+                self.stopped = True
+                self.error = "Download interrupted"
+                for downloader in downloaders:
+                    downloader.download_interrupted = True
+                return False
+
+        return self.error is None
+
     def download_and_decrypt(self, custom_headers=None, custom_payload=None):
         """
         Download and decrypt video/audio streams. Sets self.error, self.stopped, self.output_file.
@@ -94,70 +148,50 @@ class DASH_Downloader:
         self.error = None
         self.stopped = False
 
+        reps = []
         for typ in ["video", "audio"]:
             rep = self.get_representation_by_type(typ)
-            if rep:
-                encrypted_path = os.path.join(self.encrypted_dir, f"{rep['id']}_encrypted.m4s")
+            if not rep:
+                self.error = f"No {typ} found"
+                print(self.error)
+                return False
+            reps.append((typ, rep))
+
+        # If m4s files don't exist start downloading
+        if not self._download_representations(reps):
+            return False
+
+        if not self.parser.pssh:
+            print("No PSSH found: segments are not encrypted, skipping decryption.")
+            self.download_segments(clear=True)
+            return True
+
+        keys = get_widevine_keys(
+            pssh=self.parser.pssh,
+            license_url=self.license_url,
+            cdm_device_path=self.cdm_device,
+            headers=custom_headers,
+            payload=custom_payload
+        )
 
-                # If m4s file doesn't exist start downloading
-                if not os.path.exists(encrypted_path):
-                    downloader = MPD_Segments(
-                        tmp_folder=self.encrypted_dir,
-                        representation=rep,
-                        pssh=self.parser.pssh
-                    )
+        for typ, rep in reps:
+            if not keys:
+                self.error = f"No key found, cannot decrypt {typ}"
+                print(self.error)
+                return False
 
-                    try:
-                        result = downloader.download_streams()
+            key = keys[0]
+            KID = key['kid']
+            KEY = key['key']
 
-                        # Check for interruption or failure
-                        if result.get("stopped"):
-                            self.stopped = True
-                            self.error = "Download interrupted"
-                            return False
-                        
-                        if result.get("nFailed", 0) > 0:
-                            self.error = f"Failed segments: {result['nFailed']}"
-                            return False
-                        
-                    except Exception as ex:
-                        self.error = str(ex)
-                        return False
-
-                if not self.parser.pssh:
-                    print("No PSSH found: segments are not encrypted, skipping decryption.")
-                    self.download_segments(clear=True)
-                    return True
-
-                keys = get_widevine_keys(
-                    pssh=self.parser.pssh,
-                    license_url=self.license_url,
-                    cdm_device_path=self.cdm_device,
-                    headers=custom_headers,
-                    payload=custom_payload
-                )
-                
-                if not keys:
-                    self.error = f"No key found, cannot decrypt {typ}"
-                    print(self.error)
-                    return False
-
-                key = keys[0]
-                KID = key['kid']
-                KEY = key['key']
-
-                decrypted_path = os.path.join(self.decrypted_dir, f"{typ}.mp4")
-                result_path = decrypt_with_mp4decrypt(
-                    encrypted_path, KID, KEY, output_path=decrypted_path
-                )
-
-                if not result_path:
-                    self.error = f"Decryption of {typ} failed"
-                    print(self.error)
-                    return False
-
-            else:
-                self.error = f"No {typ} found"
+            encrypted_path = os.path.join(self.encrypted_dir, f"{rep['id']}_encrypted.m4s")
+            decrypted_path = os.path.join(self.decrypted_dir, f"{typ}.mp4")
+            result_path = decrypt_with_mp4decrypt(
+                encrypted_path, KID, KEY, output_path=decrypted_path
+            )
+
+            if not result_path:
+                self.error = f"Decryption of {typ} failed"
                 print(self.error)
                 return False
 
@@ -1,7 +1,10 @@
 # 25.07.25
 
 import os
+import time
 import asyncio
+import weakref
+from urllib.parse import urlparse
 
 
 # External libraries
@@ -14,6 +17,14 @@ from StreamingCommunity.Util.headers import get_userAgent
 from StreamingCommunity.Lib.M3U8.estimator import M3U8_Ts_Estimator
 from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.color import Colors
+from StreamingCommunity.Util.http_client import create_async_client
+from StreamingCommunity.Util.retry import RetryPolicy
+
+
+# Logic class
+from ..autoscale import AsyncWorkerGate, ConcurrencyBudget, WorkerAutoscaler, get_autoscaler, get_global_budget
+from ..stream import aread_into_buffer
+from ..reorder import SegmentReorderBuffer
 
 
 # Config
@@ -21,18 +32,43 @@ REQUEST_MAX_RETRY = config_manager.get_int('REQUESTS', 'max_retry')
 DEFAULT_VIDEO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_video_workers')
 DEFAULT_AUDIO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_audio_workers')
 SEGMENT_MAX_TIMEOUT = config_manager.get_int("M3U8_DOWNLOAD", "segment_timeout")
+ENABLE_HTTP2 = config_manager.get_bool('M3U8_DOWNLOAD', 'enable_http2')
+KEEP_ALIVE = config_manager.get_bool('M3U8_DOWNLOAD', 'keep_alive')
+ADAPTIVE_WORKERS = config_manager.get_bool('M3U8_DOWNLOAD', 'adaptive_workers')
+ADAPTIVE_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'adaptive_max_workers')
+GLOBAL_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'global_max_workers')
+REORDER_MAX_SEGMENTS = config_manager.get_int('M3U8_DOWNLOAD', 'reorder_max_segments')
+REORDER_MAX_MB = config_manager.get_int('M3U8_DOWNLOAD', 'reorder_max_mb')
+REORDER_SPILL_TO_DISK = config_manager.get_bool('M3U8_DOWNLOAD', 'reorder_spill_to_disk')
+MAX_GLOBAL_RETRIES = 5
 
 
 class MPD_Segments:
-    def __init__(self, tmp_folder: str, representation: dict, pssh: str = None):
+    # Downloads alive in this process, so they can all be stopped from the main thread
+    active_instances = weakref.WeakSet()
+
+    def __init__(self, tmp_folder: str, representation: dict, pssh: str = None, budget: ConcurrencyBudget = None, progress_position: int = None):
         """
         Initialize MPD_Segments with temp folder, representation, and optional pssh.
+        `budget` caps requests in flight shared with other representations downloading at the same time,
+        `progress_position` is the line of the progress bar when several run together.
         """
         self.tmp_folder = tmp_folder
         self.selected_representation = representation
         self.pssh = pssh
         self.download_interrupted = False
         self.info_nFailed = 0
+        self.autoscaler = None
+        self.budget = budget or get_global_budget()
+        self.progress_position = progress_position
+        self.retry_policy = RetryPolicy(REQUEST_MAX_RETRY)
+        MPD_Segments.active_instances.add(self)
+
+    @classmethod
+    def interrupt_all(cls) -> None:
+        """Stop every download of this process, used when they run outside the main thread."""
+        for instance in list(cls.active_instances):
+            instance.download_interrupted = True
 
     def get_concat_path(self, output_dir: str = None):
         """
@@ -61,9 +97,10 @@ class MPD_Segments:
             "pssh": self.pssh
         }
 
-    async def download_segments(self, output_dir: str = None, concurrent_downloads: int = 8, description: str = "DASH"):
+    async def download_segments(self, output_dir: str = None, concurrent_downloads: int = None, description: str = "DASH"):
         """
         Download and concatenate all segments (including init) asynchronously and in order.
+        `concurrent_downloads` defaults to the configured workers for the stream type.
         """
         rep = self.selected_representation
         rep_id = rep['id']
@@ -80,49 +117,69 @@ class MPD_Segments:
             desc=f"Downloading {rep_id}",
             bar_format=self._get_bar_format(stream_type),
             mininterval=0.6,
-            maxinterval=1.0
+            maxinterval=1.0,
+            position=self.progress_position
         )
 
-        # Define semaphore for concurrent downloads
-        semaphore = asyncio.Semaphore(concurrent_downloads)
+        # Concurrency gate driven by the per-host autoscaler
+        if concurrent_downloads is None:
+            concurrent_downloads = self._get_base_workers(stream_type)
+        self.autoscaler = self._get_autoscaler(stream_type, concurrent_downloads)
+        semaphore = AsyncWorkerGate(self.autoscaler)
 
         # Initialize estimator
         estimator = M3U8_Ts_Estimator(total_segments=len(segment_urls) + 1)
 
-        results = [None] * len(segment_urls)
         self.downloaded_segments = set()
         self.info_nFailed = 0
-        self.download_interrupted = False
         self.info_nRetry = 0
 
+        # Segments are written in order as soon as the ones before them are done,
+        # so only the reorder window is held in memory
+        reorder = SegmentReorderBuffer(
+            max_segments=REORDER_MAX_SEGMENTS,
+            max_bytes=REORDER_MAX_MB * 1024 * 1024,
+            spill_dir=(output_dir or self.tmp_folder) if REORDER_SPILL_TO_DISK else None
+        )
+
         try:
-            async with httpx.AsyncClient(timeout=SEGMENT_MAX_TIMEOUT) as client:
+            async with self._create_client(self._get_worker_count(stream_type)) as client:
                 # Download init segment
                 await self._download_init_segment(client, init_url, concat_path, estimator, progress_bar)
 
-                # Download all segments (first batch)
-                await self._download_segments_batch(
-                    client, segment_urls, results, semaphore, REQUEST_MAX_RETRY, estimator, progress_bar
-                )
-
-                # Retry failed segments 
-                await self._retry_failed_segments(
-                    client, segment_urls, results, semaphore, REQUEST_MAX_RETRY, estimator, progress_bar
-                )
-
-                # Write all results to file
-                self._write_results_to_file(concat_path, results)
+                # Download all segments, retrying each one up to MAX_GLOBAL_RETRIES rounds
+                with open(concat_path, 'ab') as outfile:
+                    await self._download_segments_ordered(
+                        client, segment_urls, reorder, outfile, semaphore, REQUEST_MAX_RETRY, estimator, progress_bar
+                    )
 
         except KeyboardInterrupt:
             self.download_interrupted = True
             print("\n[red]Download interrupted by user (Ctrl+C).")
 
         finally:
+            reorder.close()
             self._cleanup_resources(None, progress_bar)
 
         self._verify_download_completion()
         return self._generate_results(stream_type)
 
+    def _create_client(self, pool_size: int) -> httpx.AsyncClient:
+        """
+        Build the pooled client used for every request of this representation. Proxy and verify
+        come from config, the pool is sized to the max concurrency and one User-Agent is kept
+        for the whole session.
+        """
+        return create_async_client(
+            headers={'User-Agent': get_userAgent()},
+            timeout=SEGMENT_MAX_TIMEOUT,
+            http2=ENABLE_HTTP2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size if KEEP_ALIVE else 0
+            )
+        )
+
     async def _download_init_segment(self, client, init_url, concat_path, estimator, progress_bar):
         """
         Download the init segment and update progress/estimator.
@@ -133,8 +190,7 @@ class MPD_Segments:
             return
         
         try:
-            headers = {'User-Agent': get_userAgent()}
-            response = await client.get(init_url, headers=headers, follow_redirects=True)
+            response = await client.get(init_url)
 
             with open(concat_path, 'wb') as outfile:
                 if response.status_code == 200:
@@ -151,114 +207,118 @@ class MPD_Segments:
             progress_bar.close()
             raise RuntimeError(f"Error downloading init segment: {e}")
 
-    async def _download_segments_batch(self, client, segment_urls, results, semaphore, max_retry, estimator, progress_bar):
+    async def _download_single(self, client, url, idx, semaphore, max_retry):
         """
-        Download a batch of segments and update results.
+        Download one segment, with `max_retry` attempts per round and up to MAX_GLOBAL_RETRIES rounds.
+
+        Returns:
+            tuple: (idx, data, number of retries), data is empty if every attempt failed.
         """
-        async def download_single(url, idx):
-            async with semaphore:
-                headers = {'User-Agent': get_userAgent()}
-                for attempt in range(max_retry):
-                    try:
-                        resp = await client.get(url, headers=headers, follow_redirects=True)
+        nretry = 0
 
-                        if resp.status_code == 200:
-                            return idx, resp.content, attempt
-                        else:
-                            await asyncio.sleep(1.1 * (2 ** attempt))
-                    except Exception:
-                        await asyncio.sleep(1.1 * (2 ** attempt))
-                return idx, b'', max_retry
+        for global_retry in range(MAX_GLOBAL_RETRIES):
+            if global_retry > 0:
+                if self.download_interrupted:
+                    break
+                print(f"[yellow]Retrying segment {idx} (attempt {global_retry+1}/{MAX_GLOBAL_RETRIES})...")
 
-        # Initial download attempt
-        tasks = [download_single(url, i) for i, url in enumerate(segment_urls)]
+            for attempt in range(max_retry):
+                if self.download_interrupted:
+                    break
 
-        for coro in asyncio.as_completed(tasks):
-            try:
-                idx, data, nretry = await coro
-                results[idx] = data
-                if data and len(data) > 0:
-                    self.downloaded_segments.add(idx)
-                else:
-                    self.info_nFailed += 1
-                self.info_nRetry += nretry
-                progress_bar.update(1)
+                try:
+                    start_time = time.time()
+                    async with semaphore:
+                        if self.budget is not None:
+                            await self.budget.acquire_async()
 
-                # Update estimator with segment size
-                estimator.add_ts_file(len(data))
+                        try:
+                            async with client.stream("GET", url) as resp:
+                                data = await aread_into_buffer(resp) if resp.status_code == 200 else None
+                        finally:
+                            if self.budget is not None:
+                                self.budget.release()
+
+                    if data is not None:
+                        self.autoscaler.record_success(len(data), time.time() - start_time)
+                        return idx, data, nretry
+                    else:
+                        self.autoscaler.record_error(status_code=resp.status_code)
+                        error = None
+
+                except Exception as e:
+                    self.autoscaler.record_error(e)
+                    error, resp = e, None
 
-                # Update progress bar with estimated info
-                estimator.update_progress_bar(len(data), progress_bar)
+                nretry += 1
+                await self.retry_policy.asleep(attempt, error, resp)
 
-            except KeyboardInterrupt:
-                self.download_interrupted = True
-                print("\n[red]Download interrupted by user (Ctrl+C).")
-                break
+        return idx, b'', nretry
 
-    async def _retry_failed_segments(self, client, segment_urls, results, semaphore, max_retry, estimator, progress_bar):
+    async def _download_segments_ordered(self, client, segment_urls, reorder, outfile, semaphore, max_retry, estimator, progress_bar):
         """
-        Retry failed segments up to 5 times.
+        Download segments concurrently and append them to `outfile` in order.
+
+        A segment is scheduled only while it fits in the reorder window, so when one segment
+        stalls the others wait for it instead of piling up in memory.
         """
-        max_global_retries = 5
-        global_retry_count = 0
+        next_index = 0
+        running = set()
 
-        while self.info_nFailed > 0 and global_retry_count < max_global_retries and not self.download_interrupted:
-            failed_indices = [i for i, data in enumerate(results) if not data or len(data) == 0]
-            if not failed_indices:
-                break
+        try:
+            while next_index < len(segment_urls) or running:
 
-            print(f"[yellow]Retrying {len(failed_indices)} failed segments (attempt {global_retry_count+1}/{max_global_retries})...")
-            async def download_single(url, idx):
-                async with semaphore:
-                    headers = {'User-Agent': get_userAgent()}
+                # Fill the window
+                while next_index < len(segment_urls) and reorder.has_space(next_index) and not self.download_interrupted:
+                    running.add(asyncio.ensure_future(self._download_single(client, segment_urls[next_index], next_index, semaphore, max_retry)))
+                    next_index += 1
 
-                    for attempt in range(max_retry):
-                        try:
-                            resp = await client.get(url, headers=headers)
-                            
-                            if resp.status_code == 200:
-                                return idx, resp.content, attempt
-                            else:
-                                await asyncio.sleep(1.1 * (2 ** attempt))
-
-                        except Exception:
-                            await asyncio.sleep(1.1 * (2 ** attempt))
-                return idx, b'', max_retry
-
-            retry_tasks = [download_single(segment_urls[i], i) for i in failed_indices]
-
-            # Reset nFailed for this round
-            nFailed_this_round = 0
-            for coro in asyncio.as_completed(retry_tasks):
-                try:
-                    idx, data, nretry = await coro
+                if not running:
+                    break
+
+                # Wake up regularly so an interruption from another thread is noticed
+                done, running = await asyncio.wait(running, timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    idx, data, nretry = task.result()
 
                     if data and len(data) > 0:
-                        results[idx] = data
                         self.downloaded_segments.add(idx)
+                        reorder.put(idx, data)
                     else:
-                        nFailed_this_round += 1
+                        self.info_nFailed += 1
+                        reorder.put(idx, None)
 
                     self.info_nRetry += nretry
-                    progress_bar.update(0)  # No progress bar increment, already counted
+                    progress_bar.update(1)
+
+                    # Update estimator with segment size
                     estimator.add_ts_file(len(data))
-                    estimator.update_progress_bar(len(data), progress_bar)
 
-                except KeyboardInterrupt:
-                    self.download_interrupted = True
-                    print("\n[red]Download interrupted by user (Ctrl+C).")
+                    # Update progress bar with estimated info
+                    estimator.update_progress_bar(len(data), progress_bar, self.autoscaler.limit)
+
+                self._write_ready_segments(reorder, outfile)
+
+                if self.download_interrupted:
+                    for task in running:
+                        task.cancel()
                     break
-            self.info_nFailed = nFailed_this_round
-            global_retry_count += 1
 
-    def _write_results_to_file(self, concat_path, results):
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            self.download_interrupted = True
+            print("\n[red]Download interrupted by user (Ctrl+C).")
+
+            for task in running:
+                task.cancel()
+
+    def _write_ready_segments(self, reorder, outfile):
         """
-        Write all downloaded segments to the output file.
+        Write every segment that is next in order, skipping the ones that failed.
         """
-        with open(concat_path, 'ab') as outfile:
-            for data in results:
-                if data:
-                    outfile.write(data)
+        for _, data in reorder.pop_ready():
+            if data:
+                outfile.write(data)
 
     def _get_bar_format(self, description: str) -> str:
         """
@@ -271,15 +331,39 @@ class MPD_Segments:
             f"{Colors.YELLOW}{{elapsed}}{Colors.WHITE} < {Colors.CYAN}{{remaining}}{Colors.WHITE}{{postfix}}{Colors.WHITE}"
         )
 
-    def _get_worker_count(self, stream_type: str) -> int:
+    def _get_autoscaler(self, stream_type: str, initial: int) -> WorkerAutoscaler:
+        """
+        Get the concurrency controller for this stream type and CDN host.
+        With 'adaptive_workers' it moves between 1 and 'adaptive_max_workers', otherwise it stays at `initial`.
+        """
+        segment_urls = self.selected_representation['segment_urls']
+        host = urlparse(segment_urls[0]).netloc if segment_urls else ""
+        max_workers = max(initial, ADAPTIVE_MAX_WORKERS) if ADAPTIVE_WORKERS else initial
+        if GLOBAL_MAX_WORKERS > 0:
+            max_workers = min(max_workers, GLOBAL_MAX_WORKERS)
+
+        return get_autoscaler(f"dash:{stream_type.lower()}:{host}", initial=initial, max_workers=max_workers, enabled=ADAPTIVE_WORKERS)
+
+    def _get_base_workers(self, stream_type: str) -> int:
         """
-        Calculate optimal parallel workers based on stream type and infrastructure.
+        Configured workers for the stream type ('default_video_workers' / 'default_audio_workers'),
+        capped by 'global_max_workers'.
         """
         base_workers = {
             'video': DEFAULT_VIDEO_WORKERS,
             'audio': DEFAULT_AUDIO_WORKERS
         }.get(stream_type.lower(), 1)
-        return base_workers
+
+        if GLOBAL_MAX_WORKERS > 0:
+            base_workers = min(base_workers, GLOBAL_MAX_WORKERS)
+        return max(1, base_workers)
+
+    def _get_worker_count(self, stream_type: str) -> int:
+        """
+        Calculate parallel workers based on stream type: the configured count,
+        or the ceiling the autoscaler may grow to when 'adaptive_workers' is on.
+        """
+        return self._get_autoscaler(stream_type, self._get_base_workers(stream_type)).max_workers
 
     def _generate_results(self, stream_type: str) -> dict:
         """
@@ -329,5 +413,8 @@ class MPD_Segments:
               f"[white]Total retries: [green]{getattr(self, 'info_nRetry', 0)} "
               f"[white]Failed segments: [red]{getattr(self, 'info_nFailed', 0)}")
         
-        if getattr(self, 'info_nRetry', 0) > len(self.selected_representation['segment_urls']) * 0.3:
+        if self.autoscaler is not None and self.autoscaler.enabled:
+            print(f"[cyan]Workers settled at: [green]{self.autoscaler.limit}")
+
+        elif getattr(self, 'info_nRetry', 0) > len(self.selected_representation['segment_urls']) * 0.3:
             print("[yellow]Warning: High retry count detected. Consider reducing worker count in config.")
\ No newline at end of file
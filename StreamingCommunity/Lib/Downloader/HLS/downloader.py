@@ -2,10 +2,12 @@
 
 import os
 import re
-import time
 import logging
 import shutil
-from typing import Any, Dict, List, Optional
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
 
 
 # External libraries
@@ -18,6 +20,7 @@ from rich.panel import Panel
 from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.headers import get_userAgent
 from StreamingCommunity.Util.http_client import create_client
+from StreamingCommunity.Util.retry import RetryPolicy, get_request_budget
 from StreamingCommunity.Util.os import os_manager, internet_manager
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
@@ -25,12 +28,15 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 # Logic class
 from ...FFmpeg import (
     print_duration_table,
+    get_video_duration,
     join_video,
-    join_audios,
-    join_subtitle
+    join_all,
+    open_stream_remux
 )
 from ...M3U8 import M3U8_Parser, M3U8_UrlFix
-from .segments import M3U8_Segments
+from ..journal import SegmentJournal
+from ..autoscale import ConcurrencyBudget, get_global_budget, get_progress_offset
+from .segments import M3U8_Segments, M3U8_Segments_Async
 
 
 # Config
@@ -43,6 +49,10 @@ FILTER_CUSTOM_RESOLUTION = str(config_manager.get('M3U8_CONVERSION', 'force_reso
 RETRY_LIMIT = config_manager.get_int('REQUESTS', 'max_retry')
 MAX_TIMEOUT = config_manager.get_int("REQUESTS", "timeout")
 TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
+SEGMENT_ENGINE = str(config_manager.get('M3U8_DOWNLOAD', 'segment_engine')).strip().lower()
+PARALLEL_RENDITIONS = config_manager.get_bool('M3U8_DOWNLOAD', 'parallel_renditions')
+GLOBAL_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'global_max_workers')
+STREAM_TO_FFMPEG = config_manager.get_bool('M3U8_DOWNLOAD', 'stream_to_ffmpeg')
 
 console = Console()
 
@@ -66,16 +76,17 @@ class HLSClient:
         # Use unified HTTP client (inherits timeout/verify/proxy from config)
         client = create_client(headers=self.headers)
 
-        for attempt in range(RETRY_LIMIT):
-            try:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.content if return_content else response.text
+        def _request():
+            response = client.get(url)
+            response.raise_for_status()
+            return response.content if return_content else response.text
+
+        try:
+            return RetryPolicy(RETRY_LIMIT, base=1.0, budget=get_request_budget()).call(_request)
 
-            except Exception as e:
-                logging.error(f"Attempt {attempt+1} failed: {str(e)}")
-                time.sleep(1.5 ** attempt)
-        return None
+        except Exception as e:
+            logging.error(f"All {RETRY_LIMIT} attempts failed for {url}: {str(e)}")
+            return None
 
 
 class PathManager:
@@ -247,16 +258,54 @@ class DownloadManager:
         self.client = client
         self.url_fixer = url_fixer
         self.missing_segments = []
+        self.durations: Dict[str, float] = {}     # Playlist duration of every downloaded track, by file path
         self.stopped = False
+        self.segments_class = M3U8_Segments_Async if SEGMENT_ENGINE == "async" else M3U8_Segments
+
+        # Parallel renditions
+        self.budget: Optional[ConcurrencyBudget] = None
+        self.active_downloaders: List[M3U8_Segments] = []
+        self.next_position = 0
+        self.progress_offset = get_progress_offset()     # Lines of this episode when several run together
+        self.lock = threading.Lock()
+
+    def _is_track_complete(self, track_dir: str) -> bool:
+        """
+        A track is done when its segment journal was closed as complete.
+        Tmp folders without a journal (older runs) fall back to the presence of 0.ts.
+        """
+        if os.path.exists(os.path.join(track_dir, SegmentJournal.FILE_NAME)):
+            return SegmentJournal.is_complete(track_dir)
+        
+        return os.path.exists(os.path.join(track_dir, '0.ts'))
+
+    def _new_downloader(self, url: str, tmp_folder: str) -> M3U8_Segments:
+        """
+        Build the segment downloader of one rendition. While renditions (or episodes) run
+        in parallel it gets its own progress bar line, and shares the global budget.
+        """
+        downloader = self.segments_class(url=url, tmp_folder=tmp_folder)
+
+        with self.lock:
+            if self.budget is not None or self.progress_offset is not None:
+                downloader.progress_position = (self.progress_offset or 0) + self.next_position
+                self.next_position += 1
+
+            if self.budget is not None:
+                downloader.budget = self.budget
+                self.active_downloaders.append(downloader)
+
+        return downloader
 
     def download_video(self, video_url: str):
         """Downloads video segments from the M3U8 playlist."""
         video_full_url = self.url_fixer.generate_full_url(video_url)
         video_tmp_dir = os.path.join(self.temp_dir, 'video')
 
-        downloader = M3U8_Segments(url=video_full_url, tmp_folder=video_tmp_dir)
+        downloader = self._new_downloader(video_full_url, video_tmp_dir)
         result = downloader.download_streams("Video", "video")
         self.missing_segments.append(result)
+        self.durations[os.path.join(video_tmp_dir, '0.ts')] = downloader.expected_real_time_s
 
         if result.get('stopped', False):
             self.stopped = True
@@ -271,9 +320,10 @@ class DownloadManager:
         audio_full_url = self.url_fixer.generate_full_url(audio['uri'])
         audio_tmp_dir = os.path.join(self.temp_dir, 'audio', audio['language'])
 
-        downloader = M3U8_Segments(url=audio_full_url, tmp_folder=audio_tmp_dir)
+        downloader = self._new_downloader(audio_full_url, audio_tmp_dir)
         result = downloader.download_streams(f"Audio {audio['language']}", "audio")
         self.missing_segments.append(result)
+        self.durations[os.path.join(audio_tmp_dir, '0.ts')] = downloader.expected_real_time_s
 
         if result.get('stopped', False):
             self.stopped = True
@@ -298,40 +348,128 @@ class DownloadManager:
 
         return self.stopped
 
-    def download_all(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict]):
+    def _get_pending_jobs(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict], include_video: bool = True) -> List[Callable[[], bool]]:
         """
-        Downloads all selected streams (video, audio, subtitles).
+        List the downloads still to do, skipping tracks completed by a previous run.
         """
-        return_stopped = False
-        video_file = os.path.join(self.temp_dir, 'video', '0.ts')
-        
-        if not os.path.exists(video_file):
-            if self.download_video(video_url):
-                if not return_stopped:
-                    return_stopped = True
+        jobs = []
 
-        for audio in audio_streams:
-            #if self.stopped:
-            #    break
+        if include_video and not self._is_track_complete(os.path.join(self.temp_dir, 'video')):
+            jobs.append(partial(self.download_video, video_url))
 
-            audio_file = os.path.join(self.temp_dir, 'audio', audio['language'], '0.ts')
-            if not os.path.exists(audio_file):
-                if self.download_audio(audio):
-                    if not return_stopped:
-                        return_stopped = True
+        for audio in audio_streams:
+            if not self._is_track_complete(os.path.join(self.temp_dir, 'audio', audio['language'])):
+                jobs.append(partial(self.download_audio, audio))
 
         for sub in sub_streams:
-            #if self.stopped:
-            #    break
-
             sub_file = os.path.join(self.temp_dir, 'subs', f"{sub['language']}.vtt")
             if not os.path.exists(sub_file):
-                if self.download_subtitle(sub):
-                    if not return_stopped:
-                        return_stopped = True
+                jobs.append(partial(self.download_subtitle, sub))
+
+        return jobs
+
+    def _download_parallel(self, jobs: List[Callable[[], bool]]) -> bool:
+        """
+        Run every rendition at the same time, all sharing 'global_max_workers' requests in flight.
+        """
+        return_stopped = False
+        self.budget = get_global_budget() or ConcurrencyBudget(GLOBAL_MAX_WORKERS if GLOBAL_MAX_WORKERS > 0 else 10 ** 6)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(job) for job in jobs]
+
+                try:
+                    for future in as_completed(futures):
+                        if future.result():
+                            return_stopped = True
+
+                except KeyboardInterrupt:
+                    console.print("\n[red]Download interrupted by user (Ctrl+C).")
+                    self.stopped = True
+                    return_stopped = True
+
+                    with self.lock:
+                        for downloader in self.active_downloaders:
+                            downloader.download_interrupted = True
+                            downloader.interrupt_flag.set()
+
+        finally:
+            self.budget = None
+            self.active_downloaders = []
+            self.next_position = 0
+
+        return return_stopped
+
+    def _run_jobs(self, jobs: List[Callable[[], bool]]) -> bool:
+        """Run download jobs, in parallel with 'parallel_renditions'."""
+        if PARALLEL_RENDITIONS and len(jobs) > 1:
+            return self._download_parallel(jobs)
+
+        return_stopped = False
+        for job in jobs:
+            if job():
+                return_stopped = True
 
         return return_stopped
 
+    def download_streaming(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict], merge_manager: 'MergeManager', out_path: str) -> bool:
+        """
+        Streaming mode: download audio and subtitles first, then pipe the ordered video segments
+        straight into an FFmpeg remux writing `out_path`, so the video never lands in 0.ts
+        and no merge step follows the download.
+        """
+        return_stopped = self._run_jobs(self._get_pending_jobs(video_url, audio_streams, sub_streams, include_video=False))
+
+        # Load the video playlist first: its duration decides -shortest like in MergeManager.merge
+        video_file = os.path.join(self.temp_dir, 'video', '0.ts')
+        downloader = self._new_downloader(self.url_fixer.generate_full_url(video_url), os.path.join(self.temp_dir, 'video'))
+        downloader.get_info()
+        self.durations[video_file] = downloader.expected_real_time_s
+
+        # Audio kept from a previous run has no playlist duration, probe the file once
+        durations = dict(self.durations)
+        for audio_track in merge_manager.get_audio_tracks()[:1]:
+            if not durations.get(audio_track['path']):
+                durations[audio_track['path']] = get_video_duration(audio_track['path'])
+
+        process = open_stream_remux(
+            out_path=out_path,
+            audio_tracks=merge_manager.get_audio_tracks() or None,
+            subtitles_list=merge_manager.get_subtitle_tracks() if MERGE_SUBTITLE else None,
+            codec=merge_manager.parser.codec,
+            shortest=bool(merge_manager.use_shortest(video_file, durations))
+        )
+        downloader.output_stream = process.stdin
+
+        try:
+            result = downloader.download_streams("Video", "video")
+            self.missing_segments.append(result)
+
+            if result.get('stopped', False):
+                self.stopped = True
+                return_stopped = True
+
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            return_code = process.wait()
+
+        if return_code != 0:
+            raise RuntimeError(f"FFmpeg stream remux failed with code {return_code}, see {out_path}.log")
+
+        os.remove(f"{out_path}.log")
+        return return_stopped
+
+    def download_all(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict]):
+        """
+        Downloads all selected streams (video, audio, subtitles).
+        With 'parallel_renditions' they are fetched at the same time, otherwise one after another.
+        """
+        return self._run_jobs(self._get_pending_jobs(video_url, audio_streams, sub_streams))
+
 
 class MergeManager:
     """Handles merging of video, audio, and subtitle streams."""
@@ -348,20 +486,56 @@ class MergeManager:
         self.audio_streams = audio_streams
         self.sub_streams = sub_streams
 
-    def merge(self) -> str:
+    def get_audio_tracks(self) -> List[Dict[str, str]]:
+        """Paths and names of the downloaded audio tracks."""
+        return [{
+            'path': os.path.join(self.temp_dir, 'audio', a['language'], '0.ts'),
+            'name': a['language']
+        } for a in self.audio_streams]
+
+    def get_subtitle_tracks(self) -> List[Dict[str, str]]:
+        """Paths and languages of the downloaded subtitles."""
+        return [{
+            'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
+            'language': s['language']
+        } for s in self.sub_streams]
+
+    def use_shortest(self, video_file: str, durations: Dict[str, float]) -> Optional[bool]:
+        """
+        Whether the video and the first audio track differ by more than a second, from the playlist
+        durations. None when one of them is unknown (track kept from a previous run), so FFmpeg probes the files.
+        """
+        audio_tracks = self.get_audio_tracks()
+        if not audio_tracks:
+            return False
+
+        video_duration = durations.get(video_file)
+        audio_duration = durations.get(audio_tracks[0]['path'])
+        if not video_duration or not audio_duration:
+            return None
+
+        duration_diff = abs(video_duration - audio_duration)
+        if duration_diff > 1.0:
+            console.log(f"[red]Use shortest input (Duration difference: {duration_diff:.2f} seconds)...")
+            return True
+
+        return False
+
+    def merge(self, durations: Optional[Dict[str, float]] = None) -> str:
         """
         Merges downloaded streams into final video file.
         Returns path to the final merged file.
 
         Process:
         1. If no audio/subs, just process video
-        2. If audio exists, merge with video
-        3. If subtitles exist, add them to the video
+        2. Otherwise remux video, audio tracks and subtitles with a single FFmpeg pass
+
+        Args:
+            durations: Playlist duration of the downloaded tracks by file path, spares probing them
         """
         video_file = os.path.join(self.temp_dir, 'video', '0.ts')
-        merged_file = video_file
 
-        if not self.audio_streams and not self.sub_streams:
+        if not self.audio_streams and not (MERGE_SUBTITLE and self.sub_streams):
             merged_file = join_video(
                 video_path=video_file,
                 out_path=os.path.join(self.temp_dir, 'video.mp4'),
@@ -369,32 +543,14 @@ class MergeManager:
             )
 
         else:
-            if self.audio_streams:
-                audio_tracks = [{
-                    'path': os.path.join(self.temp_dir, 'audio', a['language'], '0.ts'),
-                    'name': a['language']
-                } for a in self.audio_streams]
-
-                merged_audio_path = os.path.join(self.temp_dir, 'merged_audio.mp4')
-                merged_file = join_audios(
-                    video_path=video_file,
-                    audio_tracks=audio_tracks,
-                    out_path=merged_audio_path,
-                    codec=self.parser.codec
-                )
-
-            if MERGE_SUBTITLE and self.sub_streams:
-                sub_tracks = [{
-                    'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
-                    'language': s['language']
-                } for s in self.sub_streams]
-
-                merged_subs_path = os.path.join(self.temp_dir, 'final.mp4')
-                merged_file = join_subtitle(
-                    video_path=merged_file,
-                    subtitles_list=sub_tracks,
-                    out_path=merged_subs_path
-                )
+            merged_file = join_all(
+                video_path=video_file,
+                out_path=os.path.join(self.temp_dir, 'final.mp4'),
+                audio_tracks=self.get_audio_tracks() if self.audio_streams else None,
+                subtitles_list=self.get_subtitle_tracks() if MERGE_SUBTITLE else None,
+                codec=self.parser.codec,
+                shortest=self.use_shortest(video_file, durations or {})
+            )
 
         return merged_file
 
@@ -453,13 +609,6 @@ class HLS_Downloader:
                 url_fixer=self.m3u8_manager.url_fixer
             )
 
-            # Check if download was stopped
-            download_stopped = self.download_manager.download_all(
-                video_url=self.m3u8_manager.video_url,
-                audio_streams=self.m3u8_manager.audio_streams,
-                sub_streams=self.m3u8_manager.sub_streams
-            )
-
             self.merge_manager = MergeManager(
                 temp_dir=self.path_manager.temp_dir,
                 parser=self.m3u8_manager.parser,
@@ -467,7 +616,26 @@ class HLS_Downloader:
                 sub_streams=self.m3u8_manager.sub_streams
             )
 
-            final_file = self.merge_manager.merge()
+            if STREAM_TO_FFMPEG:
+                final_file = os.path.join(self.path_manager.temp_dir, 'final.mp4')
+
+                # Video segments go straight into FFmpeg, there is nothing left to merge
+                download_stopped = self.download_manager.download_streaming(
+                    video_url=self.m3u8_manager.video_url,
+                    audio_streams=self.m3u8_manager.audio_streams,
+                    sub_streams=self.m3u8_manager.sub_streams,
+                    merge_manager=self.merge_manager,
+                    out_path=final_file
+                )
+
+            else:
+                # Check if download was stopped
+                download_stopped = self.download_manager.download_all(
+                    video_url=self.m3u8_manager.video_url,
+                    audio_streams=self.m3u8_manager.audio_streams,
+                    sub_streams=self.m3u8_manager.sub_streams
+                )
+                final_file = self.merge_manager.merge(self.download_manager.durations)
             self.path_manager.move_final_file(final_file)
             self._print_summary()
             self.path_manager.cleanup()
@@ -5,11 +5,14 @@ import sys
 import time
 import queue
 import signal
+import asyncio
 import logging
-import binascii
+import weakref
 import threading
+from contextlib import nullcontext
 from queue import PriorityQueue
 from urllib.parse import urljoin, urlparse
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict
 
@@ -23,13 +26,19 @@ from rich.console import Console
 # Internal utilities
 from StreamingCommunity.Util.color import Colors
 from StreamingCommunity.Util.headers import get_userAgent
-from StreamingCommunity.Util.http_client import create_client
+from StreamingCommunity.Util.http_client import create_client, create_async_client, get_shared_client
 from StreamingCommunity.Util.config_json import config_manager
+from StreamingCommunity.Util.retry import RetryPolicy
 
 
 # Logic class
+from ..reorder import SegmentReorderBuffer
+from ..journal import SegmentJournal
+from ..autoscale import AsyncWorkerGate, ConcurrencyBudget, WorkerAutoscaler, get_autoscaler, get_global_budget
+from ..stream import read_into_buffer, aread_into_buffer
 from ...M3U8 import (
     M3U8_Decryption,
+    M3U8_KeyCache,
     M3U8_Ts_Estimator,
     M3U8_Parser,
     M3U8_UrlFix
@@ -43,6 +52,17 @@ DEFAULT_VIDEO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_video_w
 DEFAULT_AUDIO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_audio_workers')
 MAX_TIMEOOUT = config_manager.get_int("REQUESTS", "timeout")
 SEGMENT_MAX_TIMEOUT = config_manager.get_int("M3U8_DOWNLOAD", "segment_timeout")
+ENABLE_HTTP2 = config_manager.get_bool('M3U8_DOWNLOAD', 'enable_http2')
+KEEP_ALIVE = config_manager.get_bool('M3U8_DOWNLOAD', 'keep_alive')
+SHARE_CONNECTION_POOL = config_manager.get_bool('M3U8_DOWNLOAD', 'share_connection_pool')
+REORDER_MAX_SEGMENTS = config_manager.get_int('M3U8_DOWNLOAD', 'reorder_max_segments')
+REORDER_MAX_MB = config_manager.get_int('M3U8_DOWNLOAD', 'reorder_max_mb')
+REORDER_SPILL_TO_DISK = config_manager.get_bool('M3U8_DOWNLOAD', 'reorder_spill_to_disk')
+ADAPTIVE_WORKERS = config_manager.get_bool('M3U8_DOWNLOAD', 'adaptive_workers')
+ADAPTIVE_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'adaptive_max_workers')
+DECRYPT_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'decrypt_workers')
+KEY_CACHE_TTL = config_manager.get_int('M3U8_DOWNLOAD', 'key_cache_ttl')
+GLOBAL_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'global_max_workers')
 TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
 MAX_INTERRUPT_COUNT = 3
 
@@ -50,7 +70,27 @@ MAX_INTERRUPT_COUNT = 3
 console = Console()
 
 
+def _fetch_key(key_uri: str) -> bytes:
+    """Download raw key bytes through a pooled client shared by every key request."""
+    client = get_shared_client(
+        "hls:keys",
+        headers={'User-Agent': get_userAgent()},
+        timeout=MAX_TIMEOOUT,
+        verify=REQUEST_VERIFY
+    )
+    response = client.get(key_uri)
+    response.raise_for_status()
+    return response.content
+
+
+# Keys are shared by every rendition and episode downloaded by this process
+key_cache = M3U8_KeyCache(fetch=_fetch_key, ttl=KEY_CACHE_TTL)
+
+
 class M3U8_Segments:
+    # Downloads alive in this process, so they can all be stopped from the main thread
+    active_instances = weakref.WeakSet()
+
     def __init__(self, url: str, tmp_folder: str, is_index_url: bool = True):
         """
         Initializes the M3U8_Segments object.
@@ -64,18 +104,44 @@ class M3U8_Segments:
         self.tmp_folder = tmp_folder
         self.is_index_url = is_index_url
         self.expected_real_time = None
+        self.expected_real_time_s = None
+        self.segments = []
         self.tmp_file_path = os.path.join(self.tmp_folder, "0.ts")
         os.makedirs(self.tmp_folder, exist_ok=True)
 
         # Util class
         self.decryption: M3U8_Decryption = None 
+        self.decryptions = []
+        self.media_sequence = 0
+        self.decrypt_pool: ThreadPoolExecutor = None
+        self.decrypt_pending = 0
+        self.decrypt_condition = threading.Condition()
         self.class_ts_estimator = M3U8_Ts_Estimator(0, self) 
         self.class_url_fixer = M3U8_UrlFix(url)
 
+        # Http
+        self.client: httpx.Client = None
+        self.owns_client = False
+
         # Sync
         self.queue = PriorityQueue()
-        self.buffer = {}
-        self.expected_index = 0 
+        self.reorder = SegmentReorderBuffer(
+            max_segments=REORDER_MAX_SEGMENTS,
+            max_bytes=REORDER_MAX_MB * 1024 * 1024,
+            spill_dir=self.tmp_folder if REORDER_SPILL_TO_DISK else None
+        )
+        self.journal = SegmentJournal(self.tmp_folder)
+        self.resume_index = 0
+        self.autoscaler = None
+
+        # Shared with other renditions / episodes downloading at the same time
+        self.budget: ConcurrencyBudget = get_global_budget()
+        self.retry_policy = RetryPolicy(REQUEST_MAX_RETRY)
+        self.progress_position = None
+        M3U8_Segments.active_instances.add(self)
+
+        # Binary stream receiving the ordered segments instead of 0.ts (e.g. FFmpeg stdin)
+        self.output_stream = None
 
         self.stop_event = threading.Event()
         self.downloaded_segments = set()
@@ -88,6 +154,7 @@ class M3U8_Segments:
         self.interrupt_count = 0
         self.force_stop = False
         self.interrupt_lock = threading.Lock()
+        self.previous_sigint_handler = None
 
         # OTHER INFO
         self.info_maxRetry = 0
@@ -96,30 +163,31 @@ class M3U8_Segments:
         self.active_retries = 0 
         self.active_retries_lock = threading.Lock()
 
-    def __get_key__(self, m3u8_parser: M3U8_Parser) -> bytes:
+    def load_keys(self, m3u8_parser: M3U8_Parser) -> None:
         """
-        Fetches the encryption key from the M3U8 playlist.
+        Resolve the key of every segment through the shared key cache.
+        Playlists that rotate #EXT-X-KEY get one decryptor per distinct URI + IV.
 
         Args:
             m3u8_parser (M3U8_Parser): An instance of M3U8_Parser containing parsed M3U8 data.
-
-        Returns:
-            bytes: The decryption key in byte format.
         """
-        key_uri = urljoin(self.url, m3u8_parser.keys.get('uri'))
-        parsed_url = urlparse(key_uri)
-        self.key_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-        
-        try:
-            client_params = {'headers': {'User-Agent': get_userAgent()}, 'timeout': MAX_TIMEOOUT, 'verify': REQUEST_VERIFY}
-            response = httpx.get(url=key_uri, **client_params)
-            response.raise_for_status()
+        segment_keys = [
+            dict(key_info, uri=urljoin(self.url, key_info.get('uri'))) if key_info else None
+            for key_info in m3u8_parser.segment_keys
+        ]
 
-            hex_content = binascii.hexlify(response.content).decode('utf-8')
-            return bytes.fromhex(hex_content)
-            
-        except Exception as e:
-            raise Exception(f"Failed to fetch key: {e}")
+        # Fetch every distinct key up front, in parallel
+        key_cache.prefetch(key_info['uri'] for key_info in segment_keys if key_info)
+
+        self.decryptions = [
+            key_cache.get_decryption(key_info['uri'], key_info.get('iv'), key_info.get('method')) if key_info else None
+            for key_info in segment_keys
+        ]
+        self.decryption = next((d for d in self.decryptions if d is not None), None)
+
+        n_keys = len({key_info['uri'] for key_info in segment_keys if key_info})
+        if n_keys > 1:
+            logging.info(f"Playlist rotates between {n_keys} keys")
     
     def parse_data(self, m3u8_content: str) -> None:
         """
@@ -132,14 +200,10 @@ class M3U8_Segments:
         m3u8_parser.parse_data(uri=self.url, raw_content=m3u8_content)
 
         self.expected_real_time_s = m3u8_parser.duration
+        self.media_sequence = m3u8_parser.media_sequence
 
         if m3u8_parser.keys:
-            key = self.__get_key__(m3u8_parser)    
-            self.decryption = M3U8_Decryption(
-                key, 
-                m3u8_parser.keys.get('iv'), 
-                m3u8_parser.keys.get('method')
-            )
+            self.load_keys(m3u8_parser)
 
         self.segments = [
             self.class_url_fixer.generate_full_url(seg)
@@ -170,9 +234,38 @@ class M3U8_Segments:
             except Exception as e:
                 raise RuntimeError(f"M3U8 info retrieval failed: {e}")
     
+    def prepare_resume(self) -> int:
+        """
+        Load the segment journal so segments a previous run already wrote to 0.ts are skipped.
+
+        Returns:
+            int: Index of the first segment to download.
+        """
+        if self.output_stream is not None:
+            return 0
+
+        signature = SegmentJournal.signature(self.segments)
+        self.resume_index = self.journal.load(signature, self.tmp_file_path)
+        self.journal.open(signature)
+
+        if self.resume_index > 0:
+            console.print(f"[cyan]Resuming from segment [green]{self.resume_index}[white]/[green]{len(self.segments)}")
+            self.reorder.expected_index = self.resume_index
+            self.downloaded_segments.update(range(self.resume_index))
+
+        return self.resume_index
+
+    @classmethod
+    def interrupt_all(cls) -> None:
+        """Stop every download of this process, used when they run outside the main thread."""
+        for instance in list(cls.active_instances):
+            instance.download_interrupted = True
+            instance.interrupt_flag.set()
+
     def setup_interrupt_handler(self):
         """
-        Set up a signal handler for graceful interruption.
+        Set up a signal handler for graceful interruption, remembering the previous one
+        so restore_interrupt_handler() can put it back when the download ends.
         """
         def interrupt_handler(signum, frame):
             with self.interrupt_lock:
@@ -194,14 +287,50 @@ class M3U8_Segments:
 
                     
         if threading.current_thread() is threading.main_thread():
+            self.previous_sigint_handler = signal.getsignal(signal.SIGINT)
             signal.signal(signal.SIGINT, interrupt_handler)
         else:
-            print("Signal handler must be set in the main thread")
+            logging.info("Signal handler must be set in the main thread")
+
+    def restore_interrupt_handler(self):
+        """
+        Put back the SIGINT handler active before setup_interrupt_handler(), so a finished download
+        does not keep catching Ctrl+C meant for the next one (or for parallel episodes).
+        """
+        if self.previous_sigint_handler is not None and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.previous_sigint_handler)
+            self.previous_sigint_handler = None
+
+    def _get_http_client(self, stream_type: str) -> httpx.Client:
+        """
+        Build the pooled client shared by all workers of one download_streams run.
+        With 'share_connection_pool' the pool is registered per CDN host, so video and
+        audio runs against the same host keep reusing the same connections.
+        """
+        if SHARE_CONNECTION_POOL:
+            pool_size = max(self._get_worker_count('video') + self._get_worker_count('audio'), GLOBAL_MAX_WORKERS)
+        else:
+            pool_size = self._get_worker_count(stream_type)
+
+        client_params = {
+            'headers': {'User-Agent': get_userAgent()},
+            'http2': ENABLE_HTTP2,
+            'follow_redirects': True,
+            'limits': httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size if KEEP_ALIVE else 0
+            )
+        }
+
+        if SHARE_CONNECTION_POOL:
+            self.owns_client = False
+            host = urlparse(self.segments[0] if self.segments else self.url).netloc
+            return get_shared_client(f"hls:{host}", **client_params)
 
-    def _get_http_client(self):
-        return create_client(headers={'User-Agent': get_userAgent()}, follow_redirects=True)
+        self.owns_client = True
+        return create_client(**client_params)
                             
-    def download_segment(self, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1) -> None:
+    def download_segment(self, ts_url: str, index: int, progress_bar: tqdm) -> None:
         """
         Downloads a TS segment and adds it to the segment queue with retry logic.
 
@@ -209,40 +338,55 @@ class M3U8_Segments:
             - ts_url (str): The URL of the TS segment.
             - index (int): The index of the segment.
             - progress_bar (tqdm): Progress counter for tracking download progress.
-            - backoff_factor (float): The backoff factor for exponential backoff (default is 1.5 seconds).
         """
         for attempt in range(REQUEST_MAX_RETRY):
             if self.interrupt_flag.is_set():
                 return
             
+            if not self.autoscaler.acquire(self.interrupt_flag):
+                return
+
+            if self.budget is not None and not self.budget.acquire(self.interrupt_flag):
+                self.autoscaler.release()
+                return
+
             try:
-                with self._get_http_client() as client:
-                    response = client.get(ts_url)
-        
-                    # Validate response and content
-                    response.raise_for_status()
-                    segment_content = response.content
-                    content_size = len(segment_content)
-
-                    # Decrypt if needed and verify decrypted content
-                    if self.decryption is not None:
-                        try:
-                            segment_content = self.decryption.decrypt(segment_content)
-                            
-                        except Exception as e:
-                            logging.error(f"Decryption failed for segment {index}: {str(e)}")
-                            self.interrupt_flag.set()   # Interrupt the download process
-                            self.stop_event.set()       # Trigger the stopping event for all threads
-                            break                       # Stop the current task immediately
-
-                    self.class_ts_estimator.update_progress_bar(content_size, progress_bar)
-                    self.queue.put((index, segment_content))
-                    self.downloaded_segments.add(index)  
-                    progress_bar.update(1)
+                start_time = time.time()
+                try:
+                    # Stream the body into one buffer instead of building response.content
+                    with self.client.stream("GET", ts_url) as response:
+                        response.raise_for_status()
+                        segment_content = read_into_buffer(response)
+                finally:
+                    self.autoscaler.release()
+                    if self.budget is not None:
+                        self.budget.release()
+    
+                content_size = len(segment_content)
+                self.autoscaler.record_success(content_size, time.time() - start_time)
+
+                # Hand encrypted segments to the decryption pool, the network worker moves on
+                decryption = self._get_decryption(index)
+                if decryption is not None and self.decrypt_pool is not None:
+                    with self.decrypt_condition:
+                        self.decrypt_pending += 1
+
+                    future = self.decrypt_pool.submit(self._decrypt_segment, index, segment_content)
+                    future.add_done_callback(partial(self._on_segment_decrypted, index, content_size, progress_bar))
                     return
 
+                # Decrypt inline ('decrypt_workers': 0)
+                if decryption is not None:
+                    segment_content = self._decrypt_segment(index, segment_content)
+                    if segment_content is None:
+                        break
+
+                self._finish_segment(index, segment_content, content_size, progress_bar)
+                return
+
             except Exception as e:
                 logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {e}")
+                self.autoscaler.record_error(e)
                 
                 if attempt > self.info_maxRetry:
                     self.info_maxRetry = ( attempt + 1 )
@@ -258,19 +402,89 @@ class M3U8_Segments:
                 with self.active_retries_lock:
                     self.active_retries += 1
                 
-                #sleep_time = backoff_factor * (2 ** attempt)
-                sleep_time = backoff_factor * (attempt + 1)
-                logging.info(f"Retrying segment {index} in {sleep_time} seconds...")
-                time.sleep(sleep_time)
+                logging.info(f"Retrying segment {index}...")
+                self.retry_policy.sleep(attempt, e, stop_event=self.interrupt_flag)
                 
                 with self.active_retries_lock:
                     self.active_retries -= 1
 
+    def _get_decryption(self, index: int) -> M3U8_Decryption:
+        """Return the decryptor of segment `index`, None if it is not encrypted."""
+        if index < len(self.decryptions):
+            return self.decryptions[index]
+        return None
+
+    def _decrypt_segment(self, index: int, segment_content: bytearray):
+        """
+        Decrypt one segment in place with its own cipher (IV from the key or the media sequence number).
+        On failure the whole download is stopped, since every other segment would fail the same way.
+
+        Returns:
+            memoryview: The plaintext, or None if decryption failed.
+        """
+        try:
+            return self._get_decryption(index).decrypt_into(segment_content, self.media_sequence + index)
+
+        except Exception as e:
+            logging.error(f"Decryption failed for segment {index}: {str(e)}")
+            self.interrupt_flag.set()   # Interrupt the download process
+            self.stop_event.set()       # Trigger the stopping event for all threads
+            return None
+
+    def _on_segment_decrypted(self, index: int, content_size: int, progress_bar: tqdm, future) -> None:
+        """Done callback of the decryption pool: pass the plaintext on to the writer."""
+        try:
+            segment_content = future.result()
+            if segment_content is not None:
+                self._finish_segment(index, segment_content, content_size, progress_bar)
+
+        finally:
+            with self.decrypt_condition:
+                self.decrypt_pending -= 1
+                self.decrypt_condition.notify_all()
+
+    def _finish_segment(self, index: int, segment_content, content_size: int, progress_bar: tqdm) -> None:
+        """Queue a ready segment for the writer and update progress."""
+        self.class_ts_estimator.update_progress_bar(content_size, progress_bar, self.autoscaler.limit)
+        self.queue.put((index, segment_content))
+        self.downloaded_segments.add(index)  
+        progress_bar.update(1)
+
+    def _wait_for_decryption(self) -> None:
+        """Block until every segment handed to the decryption pool has been queued."""
+        with self.decrypt_condition:
+            self.decrypt_condition.wait_for(lambda: self.decrypt_pending == 0)
+
+    def _write_ready_segments(self, f) -> None:
+        """
+        Write every segment that is now in order, then journal it once it is flushed.
+        Failed segments (None) are skipped and leave a gap in the journal.
+        """
+        ready_segments = [(index, data) for index, data in self.reorder.pop_ready() if data is not None]
+        if not ready_segments:
+            return
+
+        for _, data in ready_segments:
+            f.write(data)
+        f.flush()
+
+        for index, data in ready_segments:
+            self.journal.record(index, len(data))
+
+    def _open_output(self):
+        """
+        Open where the ordered segments go: 0.ts (appending when resuming), or `output_stream` as is.
+        """
+        if self.output_stream is not None:
+            return nullcontext(self.output_stream)
+
+        return open(self.tmp_file_path, 'ab' if self.resume_index else 'wb')
+
     def write_segments_to_file(self):
         """
         Writes segments to file with additional verification.
         """
-        with open(self.tmp_file_path, 'wb') as f:
+        with self._open_output() as f:
             while not self.stop_event.is_set() or not self.queue.empty():
                 if self.interrupt_flag.is_set():
                     break
@@ -281,30 +495,9 @@ class M3U8_Segments:
                     # Successful queue retrieval: reduce timeout
                     self.current_timeout = max(self.base_timeout, self.current_timeout / 2)
 
-                    # Handle failed segments
-                    if segment_content is None:
-                        if index == self.expected_index:
-                            self.expected_index += 1
-                        continue
-
-                    # Write segment if it's the next expected one
-                    if index == self.expected_index:
-                        f.write(segment_content)
-                        f.flush()
-                        self.expected_index += 1
-
-                        # Write any buffered segments that are now in order
-                        while self.expected_index in self.buffer:
-                            next_segment = self.buffer.pop(self.expected_index)
-
-                            if next_segment is not None:
-                                f.write(next_segment)
-                                f.flush()
-
-                            self.expected_index += 1
-                    
-                    else:
-                        self.buffer[index] = segment_content
+                    # Park the segment (failed ones are None) and write everything now in order
+                    self.reorder.put(index, segment_content)
+                    self._write_ready_segments(f)
 
                 except queue.Empty:
                     self.current_timeout = min(MAX_TIMEOOUT, self.current_timeout * 1.1)
@@ -313,6 +506,11 @@ class M3U8_Segments:
                     if self.stop_event.is_set():
                         break
 
+                except OSError as e:
+                    logging.error(f"Can't write segment {index}, stopping download: {str(e)}")
+                    self.interrupt_flag.set()
+                    break
+
                 except Exception as e:
                     logging.error(f"Error writing segment {index}: {str(e)}")
     
@@ -329,36 +527,42 @@ class M3U8_Segments:
           # Viene usato per lo screen 
           console.log("####")
           
-        self.get_info()
-        self.setup_interrupt_handler()
+        # The caller may have loaded the playlist already (streaming mode needs its duration first)
+        if not self.segments:
+            self.get_info()
+        self.prepare_resume()
 
-        progress_bar = tqdm(
-            total=len(self.segments), 
-            unit='s',
-            ascii='░▒█',
-            bar_format=self._get_bar_format(description),
-            mininterval=0.6,
-            maxinterval=1.0,
-            file=sys.stdout,        # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.
-        )
+        progress_bar = self._get_progress_bar(description)
+
+        # One connection pool for every worker of this run
+        self.autoscaler = self._get_autoscaler(type)
+        self.client = self._get_http_client(type)
+        self.decrypt_pool = self._get_decrypt_pool()
+        self.setup_interrupt_handler()
 
         try:
             writer_thread = threading.Thread(target=self.write_segments_to_file)
             writer_thread.daemon = True
             writer_thread.start()
 
-            # Configure workers and delay
+            # Spawn enough threads for the autoscaler ceiling, the autoscaler decides how many run at once
             max_workers = self._get_worker_count(type)
             
             # Download segments with completion verification
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = []
                 for index, segment_url in enumerate(self.segments):
+                    if index < self.resume_index:
+                        continue
 
                     # Check for interrupt before submitting each task
                     if self.interrupt_flag.is_set():
                         break
 
+                    # Backpressure: wait while the reorder window is full
+                    if not self.reorder.wait_for_space(index, self.interrupt_flag):
+                        break
+
                     time.sleep(TQDM_DELAY_WORKER)
                     futures.append(executor.submit(self.download_segment, segment_url, index, progress_bar))
 
@@ -371,6 +575,8 @@ class M3U8_Segments:
                     except Exception as e:
                         logging.error(f"Error in download thread: {str(e)}")
 
+                self._wait_for_decryption()
+
                 # Interrupt handling for missing segments
                 if not self.interrupt_flag.is_set():
                     total_segments = len(self.segments)
@@ -391,7 +597,10 @@ class M3U8_Segments:
                             except Exception as e:
                                 logging.error(f"Failed to retry segment {index}: {str(e)}")
 
+                        self._wait_for_decryption()
+
         finally:
+            self.restore_interrupt_handler()
             self._cleanup_resources(writer_thread, progress_bar)
 
         if not self.interrupt_flag.is_set():
@@ -399,6 +608,22 @@ class M3U8_Segments:
 
         return self._generate_results(type)
     
+    def _get_progress_bar(self, description: str) -> tqdm:
+        """
+        Create the tqdm progress bar for this download.
+        """
+        return tqdm(
+            total=len(self.segments), 
+            initial=self.resume_index,
+            position=self.progress_position,
+            unit='s',
+            ascii='░▒█',
+            bar_format=self._get_bar_format(description),
+            mininterval=0.6,
+            maxinterval=1.0,
+            file=sys.stdout,        # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.
+        )
+
     def _get_bar_format(self, description: str) -> str:
         """
         Generate platform-appropriate progress bar format.
@@ -410,16 +635,27 @@ class M3U8_Segments:
             f"{Colors.YELLOW}{{elapsed}}{Colors.WHITE} < {Colors.CYAN}{{remaining}}{Colors.WHITE}{{postfix}}{Colors.WHITE}"
         )
     
-    def _get_worker_count(self, stream_type: str) -> int:
+    def _get_autoscaler(self, stream_type: str) -> WorkerAutoscaler:
         """
-        Calculate optimal parallel workers based on stream type and infrastructure.
+        Get the concurrency controller for this stream type and CDN host. It starts from the
+        configured worker count and, with 'adaptive_workers', moves between 1 and 'adaptive_max_workers'.
         """
         base_workers = {
             'video': DEFAULT_VIDEO_WORKERS,
             'audio': DEFAULT_AUDIO_WORKERS
         }.get(stream_type.lower(), 1)
 
-        return base_workers
+        max_workers = max(base_workers, ADAPTIVE_MAX_WORKERS) if ADAPTIVE_WORKERS else base_workers
+        host = urlparse(self.segments[0] if self.segments else self.url).netloc
+
+        return get_autoscaler(f"hls:{stream_type.lower()}:{host}", initial=base_workers, max_workers=max_workers, enabled=ADAPTIVE_WORKERS)
+
+    def _get_worker_count(self, stream_type: str) -> int:
+        """
+        Calculate parallel workers based on stream type: the configured count,
+        or the ceiling the autoscaler may grow to when 'adaptive_workers' is on.
+        """
+        return self._get_autoscaler(stream_type).max_workers
     
     def _generate_results(self, stream_type: str) -> Dict:
         """Package final download results."""
@@ -436,17 +672,43 @@ class M3U8_Segments:
             missing = sorted(set(range(total)) - self.downloaded_segments)
             raise RuntimeError(f"Download incomplete ({len(self.downloaded_segments)/total:.1%}). Missing segments: {missing}")
         
+    def _get_decrypt_pool(self) -> ThreadPoolExecutor:
+        """
+        Thread pool for the decryption stage, None when the stream is not encrypted
+        or 'decrypt_workers' is 0 (decrypt inline on the download worker).
+        """
+        if self.decryption is None or DECRYPT_WORKERS <= 0:
+            return None
+
+        return ThreadPoolExecutor(max_workers=DECRYPT_WORKERS, thread_name_prefix="decrypt")
+
+    def _shutdown_decrypt_pool(self) -> None:
+        """Let queued decryptions finish, then release the pool."""
+        if self.decrypt_pool is not None:
+            self.decrypt_pool.shutdown(wait=True)
+            self.decrypt_pool = None
+
     def _cleanup_resources(self, writer_thread: threading.Thread, progress_bar: tqdm) -> None:
         """Ensure resource cleanup and final reporting."""
+        self._shutdown_decrypt_pool()
         self.stop_event.set()
         writer_thread.join(timeout=30)
         progress_bar.close()
+
+        if self.owns_client and self.client is not None:
+            self.client.close()
+        self.client = None
         
         if self.info_nFailed > 0:
             self._display_error_summary()
 
-        self.buffer = {}
-        self.expected_index = 0
+        self.reorder.close()
+        self._close_journal()
+
+    def _close_journal(self) -> None:
+        """Close the journal, marking the track complete only if nothing failed or was interrupted."""
+        complete = self.info_nFailed == 0 and not self.download_interrupted and not self.interrupt_flag.is_set()
+        self.journal.close(complete=complete)
 
     def _display_error_summary(self) -> None:
         """Generate final error report."""
@@ -455,5 +717,191 @@ class M3U8_Segments:
                      f"[white]Total retries: [green]{self.info_nRetry} "
                      f"[white]Failed segments: [red]{self.info_nFailed}")
         
-        if self.info_nRetry > len(self.segments) * 0.3:
+        if self.autoscaler is not None and self.autoscaler.enabled:
+            console.print(f"[cyan]Workers settled at: [green]{self.autoscaler.limit}")
+
+        elif self.info_nRetry > len(self.segments) * 0.3:
             console.print("[yellow]Warning: High retry count detected. Consider reducing worker count in config.")
+
+
+class M3U8_Segments_Async(M3U8_Segments):
+    """
+    asyncio backend for M3U8_Segments, selected with 'segment_engine': "async".
+
+    All segments of a run are fetched on one event loop through a single httpx.AsyncClient,
+    with at most `worker count` requests in flight, and written in order as soon as the next
+    expected index is available. Writes go through one writer thread, so a slow disk or
+    FFmpeg pipe never blocks the event loop.
+    """
+    def download_streams(self, description: str, type: str):
+        """
+        Downloads all TS segments concurrently and writes them to a file.
+
+        Parameters:
+            - description: Description to insert on tqdm bar
+            - type (str): Type of download: 'video' or 'audio'
+        """
+        if TELEGRAM_BOT:
+
+          # Viene usato per lo screen 
+          console.log("####")
+
+        if not self.segments:
+            self.get_info()
+        self.prepare_resume()
+        progress_bar = self._get_progress_bar(description)
+
+        self.autoscaler = self._get_autoscaler(type)
+        self.decrypt_pool = self._get_decrypt_pool()
+        self.write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer")
+        self.setup_interrupt_handler()
+
+        try:
+            asyncio.run(self._download_all(progress_bar, self._get_worker_count(type)))
+
+        except KeyboardInterrupt:
+            self.download_interrupted = True
+            self.interrupt_flag.set()
+            console.print("\n[red]Download interrupted by user (Ctrl+C).")
+
+        finally:
+            self.restore_interrupt_handler()
+            self._shutdown_decrypt_pool()
+            self.write_pool.shutdown(wait=True)
+            progress_bar.close()
+            if self.info_nFailed > 0:
+                self._display_error_summary()
+
+            self.reorder.close()
+            self._close_journal()
+
+        if not self.interrupt_flag.is_set():
+            self._verify_download_completion()
+
+        return self._generate_results(type)
+
+    async def _download_all(self, progress_bar: tqdm, max_workers: int) -> None:
+        """
+        Run `max_workers` coroutines that share one index iterator; the autoscaler
+        gate decides how many of them have a request in flight at any time.
+        """
+        limits = httpx.Limits(
+            max_connections=max_workers,
+            max_keepalive_connections=max_workers if KEEP_ALIVE else 0
+        )
+        pending_indices = iter(range(self.resume_index, len(self.segments)))
+        self.reorder_space = asyncio.Condition()
+        self.worker_gate = AsyncWorkerGate(self.autoscaler)
+
+        async with create_async_client(headers={'User-Agent': get_userAgent()}, http2=ENABLE_HTTP2, limits=limits) as client:
+            with self._open_output() as f:
+                workers = [
+                    self._worker(client, pending_indices, f, progress_bar)
+                    for _ in range(max_workers)
+                ]
+                await asyncio.gather(*workers)
+
+    async def _worker(self, client: httpx.AsyncClient, pending_indices, f, progress_bar: tqdm) -> None:
+        """
+        Pull the next segment index, download it and hand it to the in-order writer.
+        Waits (without blocking the loop) while the reorder window is full.
+        """
+        for index in pending_indices:
+            async with self.reorder_space:
+                await self.reorder_space.wait_for(
+                    lambda: self.interrupt_flag.is_set() or self.reorder.has_space(index)
+                )
+
+            if self.interrupt_flag.is_set():
+                break
+
+            segment_content = await self._fetch_segment(client, self.segments[index], index, progress_bar)
+            await self._write_in_order(f, index, segment_content)
+
+            async with self.reorder_space:
+                self.reorder_space.notify_all()
+
+        # Wake up workers still waiting on the window so they can see the interrupt
+        async with self.reorder_space:
+            self.reorder_space.notify_all()
+
+    async def _fetch_segment(self, client: httpx.AsyncClient, ts_url: str, index: int, progress_bar: tqdm):
+        """
+        Downloads (and decrypts) a single TS segment with retry logic.
+
+        Returns:
+            bytes: The segment content, or None if every attempt failed.
+        """
+        for attempt in range(REQUEST_MAX_RETRY):
+            if self.interrupt_flag.is_set():
+                return None
+
+            try:
+                start_time = time.time()
+                async with self.worker_gate:
+                    if self.budget is not None:
+                        await self.budget.acquire_async()
+
+                    try:
+                        async with client.stream("GET", ts_url) as response:
+                            response.raise_for_status()
+                            segment_content = await aread_into_buffer(response)
+                    finally:
+                        if self.budget is not None:
+                            self.budget.release()
+
+                content_size = len(segment_content)
+                self.autoscaler.record_success(content_size, time.time() - start_time)
+
+                # Decrypt on the decryption pool so the event loop keeps serving other downloads
+                if self._get_decryption(index) is not None:
+                    if self.decrypt_pool is not None:
+                        loop = asyncio.get_event_loop()
+                        segment_content = await loop.run_in_executor(self.decrypt_pool, self._decrypt_segment, index, segment_content)
+                    else:
+                        segment_content = self._decrypt_segment(index, segment_content)
+
+                    if segment_content is None:
+                        return None
+
+                self.class_ts_estimator.update_progress_bar(content_size, progress_bar, self.autoscaler.limit)
+                self.downloaded_segments.add(index)
+                progress_bar.update(1)
+                return segment_content
+
+            except Exception as e:
+                logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {e}")
+                self.autoscaler.record_error(e)
+
+                if attempt > self.info_maxRetry:
+                    self.info_maxRetry = ( attempt + 1 )
+                self.info_nRetry += 1
+
+                if attempt + 1 == REQUEST_MAX_RETRY:
+                    console.log(f"[red]Final retry failed for segment: {index}")
+                    progress_bar.update(1)
+                    self.info_nFailed += 1
+                    return None
+
+                logging.info(f"Retrying segment {index}...")
+                await self.retry_policy.asleep(attempt, e)
+
+        return None
+
+    async def _write_in_order(self, f, index: int, segment_content) -> None:
+        """
+        Store a finished segment and write every contiguous segment now in order, on the writer thread.
+        Failed segments (None) are skipped, and a write error stops the download, exactly like the threaded writer does.
+        """
+        loop = asyncio.get_event_loop()
+
+        try:
+            await loop.run_in_executor(self.write_pool, self._store_and_write, f, index, segment_content)
+
+        except OSError as e:
+            logging.error(f"Can't write segment {index}, stopping download: {str(e)}")
+            self.interrupt_flag.set()
+
+    def _store_and_write(self, f, index: int, segment_content) -> None:
+        self.reorder.put(index, segment_content)
+        self._write_ready_segments(f)
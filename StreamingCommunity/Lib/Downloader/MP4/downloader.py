@@ -6,6 +6,7 @@ import sys
 import time
 import signal
 import logging
+import weakref
 from functools import partial
 import threading
 
@@ -28,6 +29,7 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 # Logic class
 from ...FFmpeg import print_duration_table
+from ..autoscale import get_progress_offset
 
 
 # Config
@@ -42,11 +44,22 @@ console = Console()
 
 
 class InterruptHandler:
+    # Downloads alive in this process, so they can all be stopped from the main thread
+    active_instances = weakref.WeakSet()
+
     def __init__(self):
         self.interrupt_count = 0
         self.last_interrupt_time = 0
         self.kill_download = False
         self.force_quit = False
+        InterruptHandler.active_instances.add(self)
+
+    @classmethod
+    def interrupt_all(cls) -> None:
+        """Stop every MP4 download of this process, used when they run outside the main thread."""
+        for instance in list(cls.active_instances):
+            instance.kill_download = True
+            instance.force_quit = True
 
 
 def signal_handler(signum, frame, interrupt_handler, original_handler):
@@ -147,6 +160,7 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
                     unit_scale=True,
                     desc='Downloading',
                     mininterval=0.05,
+                    position=get_progress_offset(),
                     file=sys.stdout                         # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.  
                 )
 
@@ -1,13 +1,35 @@
 # 23.06.24
 
-from .HLS.downloader import HLS_Downloader
-from .MP4.downloader import MP4_downloader
-from .TOR.downloader import TOR_downloader
-from .DASH.downloader import DASH_Downloader
+import importlib
+
+
+# Exported name -> module defining it, imported on first access
+_LAZY_EXPORTS = {
+    "HLS_Downloader": ".HLS.downloader",
+    "MP4_downloader": ".MP4.downloader",
+    "TOR_downloader": ".TOR.downloader",
+    "DASH_Downloader": ".DASH.downloader",
+    "download_episodes": ".scheduler",
+}
 
 __all__ = [
     "HLS_Downloader",
     "MP4_downloader",
     "TOR_downloader",
-    "DASH_Downloader"
-]
\ No newline at end of file
+    "DASH_Downloader",
+    "download_episodes"
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
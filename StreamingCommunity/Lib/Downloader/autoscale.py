@@ -0,0 +1,258 @@
+# 18.10.26
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+
+# External library
+import httpx
+
+
+# Variable
+_autoscalers: Dict[str, "WorkerAutoscaler"] = {}
+_autoscalers_lock = threading.Lock()
+_global_budget: Optional["ConcurrencyBudget"] = None
+_progress_slot = threading.local()
+
+
+def is_throttle_status(status_code: int) -> bool:
+    """Return True for status codes that mean the server is overloaded (429, 5xx)."""
+    return status_code == 429 or status_code >= 500
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """
+    Return True for errors that mean the server is overloaded (429, 5xx, timeouts)
+    rather than a problem with the single request (404, 403, ...).
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return is_throttle_status(error.response.status_code)
+
+    return False
+
+
+class WorkerAutoscaler:
+    """
+    AIMD (additive increase / multiplicative decrease) controller for the number of concurrent requests.
+
+    Completed requests are grouped in windows of `limit` samples. At the end of a window the limit
+    grows by one if throughput did not drop and latency stayed flat; a 429, 5xx or timeout halves it
+    right away (at most once per cooldown, so a burst of errors counts as one congestion signal).
+    """
+    def __init__(self, initial: int, max_workers: int, min_workers: int = 1, enabled: bool = True,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 1.5, cooldown: float = 2.0):
+        """
+        Parameters:
+            - initial (int): Concurrency to start with.
+            - max_workers (int): Upper bound for the limit.
+            - min_workers (int): Lower bound for the limit.
+            - enabled (bool): When False the limit stays fixed at `initial`.
+            - decrease_factor (float): Multiplier applied to the limit on a throttle signal.
+            - latency_tolerance (float): Max ratio between the average latency of two windows to keep growing.
+            - cooldown (float): Seconds during which further throttle signals are ignored after a decrease.
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.min_workers = max(1, min(int(min_workers), self.max_workers))
+        self.limit = max(self.min_workers, min(int(initial), self.max_workers))
+        self.enabled = enabled
+
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.active = 0
+
+        self._cooldown_until = 0.0
+        self._last_throughput: Optional[float] = None
+        self._last_latency: Optional[float] = None
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._window_bytes = 0
+        self._window_latency = 0.0
+
+    def record_success(self, nbytes: int, latency: float) -> None:
+        """Register a completed request and grow the limit at the end of a healthy window."""
+        if not self.enabled:
+            return
+
+        with self.condition:
+            self._window_count += 1
+            self._window_bytes += nbytes
+            self._window_latency += latency
+
+            if self._window_count < self.limit:
+                return
+
+            elapsed = max(time.monotonic() - self._window_start, 1e-6)
+            throughput = self._window_bytes / elapsed
+            avg_latency = self._window_latency / self._window_count
+
+            if self._last_throughput is None or (
+                throughput >= self._last_throughput * 0.95
+                and avg_latency <= self._last_latency * self.latency_tolerance
+            ):
+                if self.limit < self.max_workers:
+                    self.limit += 1
+                    self.condition.notify_all()
+
+            self._last_throughput = throughput
+            self._last_latency = avg_latency
+            self._reset_window()
+
+    def record_error(self, error: Optional[Exception] = None, status_code: Optional[int] = None) -> None:
+        """
+        Register a failed request, shrinking the limit if the server is pushing back.
+
+        Parameters:
+            - error (Exception): Exception raised by the request, if any.
+            - status_code (int): Status code of a response that was not raised as an exception.
+        """
+        throttled = (error is not None and is_throttle_error(error)) or (status_code is not None and is_throttle_status(status_code))
+        if not self.enabled or not throttled:
+            return
+
+        with self.condition:
+            now = time.monotonic()
+            if now < self._cooldown_until:
+                return
+
+            new_limit = max(self.min_workers, int(self.limit * self.decrease_factor))
+            if new_limit != self.limit:
+                logging.info(f"Throttle signal ({error or status_code}), reducing workers {self.limit} -> {new_limit}")
+                self.limit = new_limit
+
+            self._cooldown_until = now + self.cooldown
+            self._last_throughput = None
+            self._last_latency = None
+            self._reset_window()
+
+    def acquire(self, stop_event: Optional[threading.Event] = None, timeout: float = 0.5) -> bool:
+        """
+        Block the calling thread until a slot under the current limit is free.
+
+        Returns:
+            bool: False if `stop_event` was set while waiting, True otherwise.
+        """
+        with self.condition:
+            while self.active >= self.limit:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                self.condition.wait(timeout)
+
+            self.active += 1
+
+        return True
+
+    def release(self) -> None:
+        """Free a slot taken with `acquire`."""
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+
+
+class AsyncWorkerGate:
+    """
+    asyncio counterpart of `WorkerAutoscaler.acquire/release`, used as `async with gate:`.
+    Every coroutine must share the same event loop.
+    """
+    def __init__(self, autoscaler: WorkerAutoscaler):
+        self.autoscaler = autoscaler
+        self.active = 0
+        self.condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.active < self.autoscaler.limit)
+            self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+
+
+class ConcurrencyBudget:
+    """
+    Cap on requests in flight shared by several downloads running at the same time
+    (e.g. video and audio renditions), on top of each download's own worker limit.
+    """
+    def __init__(self, size: int):
+        """
+        Parameters:
+            - size (int): Max requests in flight across every download sharing the budget.
+        """
+        self.size = max(1, int(size))
+        self.semaphore = threading.BoundedSemaphore(self.size)
+
+    def acquire(self, stop_event: Optional[threading.Event] = None, timeout: float = 0.5) -> bool:
+        """
+        Block the calling thread until a slot is free.
+
+        Returns:
+            bool: False if `stop_event` was set while waiting, True otherwise.
+        """
+        while not self.semaphore.acquire(timeout=timeout):
+            if stop_event is not None and stop_event.is_set():
+                return False
+
+        return True
+
+    async def acquire_async(self, poll_interval: float = 0.02) -> None:
+        """
+        Wait for a slot without blocking the event loop. The budget is shared with other
+        threads and loops, so a contended slot is re-checked every `poll_interval` seconds.
+        """
+        while not self.semaphore.acquire(blocking=False):
+            await asyncio.sleep(poll_interval)
+
+    def release(self) -> None:
+        """Free a slot taken with `acquire` or `acquire_async`."""
+        self.semaphore.release()
+
+
+def get_autoscaler(key: str, initial: int, max_workers: int, enabled: bool = True) -> WorkerAutoscaler:
+    """
+    Return the autoscaler registered under `key` (usually stream type + CDN host),
+    so the limit learned on one episode carries over to the next one on the same host.
+    """
+    with _autoscalers_lock:
+        autoscaler = _autoscalers.get(key)
+
+        if autoscaler is None or autoscaler.max_workers != max(1, int(max_workers)) or autoscaler.enabled != enabled:
+            autoscaler = WorkerAutoscaler(initial=initial, max_workers=max_workers, enabled=enabled)
+            _autoscalers[key] = autoscaler
+
+        return autoscaler
+
+
+def set_global_budget(budget: Optional[ConcurrencyBudget]) -> None:
+    """Install (or remove with None) the budget shared by every download started from now on."""
+    global _global_budget
+    _global_budget = budget
+
+
+def get_global_budget() -> Optional[ConcurrencyBudget]:
+    """Return the process-wide budget, None when downloads are not sharing one."""
+    return _global_budget
+
+
+def set_progress_offset(offset: Optional[int]) -> None:
+    """Set (or clear with None) the first progress bar line used by the downloads of the current thread."""
+    _progress_slot.offset = offset
+
+
+def get_progress_offset() -> Optional[int]:
+    """Return the first progress bar line of the current thread, None when downloads run one at a time."""
+    return getattr(_progress_slot, 'offset', None)
@@ -0,0 +1,129 @@
+# 18.10.26
+
+import os
+import hashlib
+import logging
+from typing import List, Tuple
+from urllib.parse import urlparse
+
+
+class SegmentJournal:
+    """
+    On-disk log of the segments already written to a track's output file, kept in its tmp folder.
+
+    The first line identifies the playlist, then every segment flushed to disk appends
+    "<index> <offset> <size>". On restart `load` finds the longest contiguous run of segments
+    that are really on disk, truncates the output file there and returns the index to resume from.
+    """
+    FILE_NAME = "segments.journal"
+    COMPLETE_MARK = "# complete"
+
+    def __init__(self, tmp_folder: str):
+        """
+        Parameters:
+            - tmp_folder (str): Folder of the track (the one holding playlist.m3u8 and 0.ts).
+        """
+        self.path = os.path.join(tmp_folder, self.FILE_NAME)
+        self.entries: List[Tuple[int, int, int]] = []
+        self.next_offset = 0
+        self.file = None
+
+    @staticmethod
+    def signature(segment_urls: List[str]) -> str:
+        """
+        Identify a playlist by its segment paths, ignoring query strings (tokens usually change between runs).
+        """
+        digest = hashlib.sha1()
+        for url in segment_urls:
+            digest.update(urlparse(url).path.encode('utf-8', 'ignore'))
+            digest.update(b"\n")
+
+        return f"{len(segment_urls)}:{digest.hexdigest()}"
+
+    @classmethod
+    def is_complete(cls, tmp_folder: str) -> bool:
+        """Return True if the journal in `tmp_folder` was closed after a complete download."""
+        path = os.path.join(tmp_folder, cls.FILE_NAME)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            return bool(lines) and lines[-1] == cls.COMPLETE_MARK
+
+        except OSError:
+            return False
+
+    def load(self, signature: str, output_path: str) -> int:
+        """
+        Read the journal and truncate `output_path` after the last contiguous segment on disk.
+
+        Returns:
+            int: Index of the first segment still to download (0 when nothing can be resumed).
+        """
+        self.entries = []
+        self.next_offset = 0
+
+        if not os.path.exists(self.path) or not os.path.exists(output_path):
+            return 0
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+
+        except OSError as e:
+            logging.error(f"Can't read segment journal {self.path}: {e}")
+            return 0
+
+        if not lines or lines[0] != f"# {signature}":
+            logging.info("Segment journal belongs to a different playlist, starting over")
+            return 0
+
+        file_size = os.path.getsize(output_path)
+        for line in lines[1:]:
+            parts = line.split()
+            if len(parts) != 3 or not all(p.isdigit() for p in parts):
+                break
+
+            index, offset, size = (int(p) for p in parts)
+            if index != len(self.entries) or offset != self.next_offset or offset + size > file_size:
+                break
+
+            self.entries.append((index, offset, size))
+            self.next_offset = offset + size
+
+        with open(output_path, 'r+b') as f:
+            f.truncate(self.next_offset)
+
+        logging.info(f"Resuming after {len(self.entries)} segments ({self.next_offset} bytes) from {self.path}")
+        return len(self.entries)
+
+    def open(self, signature: str) -> None:
+        """Rewrite the journal with the entries kept by `load` and keep it open for appends."""
+        self.file = open(self.path, 'w', encoding='utf-8')
+        self.file.write(f"# {signature}\n")
+
+        for index, offset, size in self.entries:
+            self.file.write(f"{index} {offset} {size}\n")
+        self.file.flush()
+
+    def record(self, index: int, size: int) -> None:
+        """Append a segment that has just been flushed to the output file."""
+        if self.file is None:
+            return
+
+        self.file.write(f"{index} {self.next_offset} {size}\n")
+        self.file.flush()
+        self.next_offset += size
+
+    def close(self, complete: bool = False) -> None:
+        """Close the journal, marking it complete when every segment made it to disk."""
+        if self.file is None:
+            return
+
+        if complete:
+            self.file.write(f"{self.COMPLETE_MARK}\n")
+
+        self.file.close()
+        self.file = None
@@ -0,0 +1,148 @@
+# 18.10.26
+
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class SegmentReorderBuffer:
+    """
+    Bounded reorder window used to write segments sequentially while they complete out of order.
+
+    Out-of-order segments are kept in memory up to `max_bytes`; past that they are appended to a
+    spill file (when a spill folder is given) and read back when their turn comes.
+    Producers call `has_space` / `wait_for_space` before scheduling a new index, so submission is
+    throttled while the window is full instead of letting segments pile up behind a stalled one.
+    """
+    def __init__(self, max_segments: int, max_bytes: int, spill_dir: Optional[str] = None):
+        """
+        Parameters:
+            - max_segments (int): Max distance between the next index to write and a newly scheduled index.
+            - max_bytes (int): Max bytes of out-of-order segments held in memory.
+            - spill_dir (str): Folder for the overflow file, None to disable spilling to disk.
+        """
+        self.max_segments = max(1, int(max_segments))
+        self.max_bytes = max(0, int(max_bytes))
+        self.spill_path = os.path.join(spill_dir, "reorder.spill") if spill_dir else None
+
+        self.expected_index = 0
+        self.memory: Dict[int, Optional[bytes]] = {}
+        self.memory_bytes = 0
+        self.spilled: Dict[int, Tuple[int, int]] = {}
+        self.spill_file = None
+        self.condition = threading.Condition()
+
+        # Stats
+        self.peak_bytes = 0
+        self.n_spilled = 0
+
+    def __len__(self) -> int:
+        return len(self.memory) + len(self.spilled)
+
+    def has_space(self, index: int) -> bool:
+        """
+        Return True if segment `index` can be scheduled without overflowing the window.
+        The next index to write is always allowed, otherwise the window could never drain.
+        """
+        if index <= self.expected_index:
+            return True
+
+        if index - self.expected_index >= self.max_segments:
+            return False
+
+        return self.spill_path is not None or self.memory_bytes < self.max_bytes
+
+    def wait_for_space(self, index: int, stop_event: Optional[threading.Event] = None, timeout: float = 0.5) -> bool:
+        """
+        Block the calling thread until `index` can be scheduled.
+
+        Returns:
+            bool: False if `stop_event` was set while waiting, True otherwise.
+        """
+        with self.condition:
+            while not self.has_space(index):
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                self.condition.wait(timeout)
+
+        return True
+
+    def put(self, index: int, data: Optional[bytes]) -> None:
+        """
+        Store a finished segment. `None` marks a failed segment that will be skipped.
+        """
+        with self.condition:
+            if index < self.expected_index:
+                return
+
+            size = len(data) if data else 0
+            if data and self.spill_path and index != self.expected_index and self.memory_bytes + size > self.max_bytes:
+                self._spill(index, data)
+                return
+
+            self.memory[index] = data
+            self.memory_bytes += size
+            self.peak_bytes = max(self.peak_bytes, self.memory_bytes)
+
+    def pop_ready(self) -> List[Tuple[int, Optional[bytes]]]:
+        """
+        Remove and return every contiguous (index, segment) starting at the next index to write.
+        """
+        ready = []
+
+        with self.condition:
+            while True:
+                if self.expected_index in self.memory:
+                    data = self.memory.pop(self.expected_index)
+                    self.memory_bytes -= len(data) if data else 0
+
+                elif self.expected_index in self.spilled:
+                    data = self._read_spilled(self.expected_index)
+
+                else:
+                    break
+
+                ready.append((self.expected_index, data))
+                self.expected_index += 1
+
+            if ready:
+                self.condition.notify_all()
+
+        return ready
+
+    def _spill(self, index: int, data: bytes) -> None:
+        """Append a segment to the spill file and remember where it is."""
+        if self.spill_file is None:
+            self.spill_file = open(self.spill_path, 'w+b')
+            logging.info(f"Reorder window full, spilling segments to: {self.spill_path}")
+
+        self.spill_file.seek(0, os.SEEK_END)
+        offset = self.spill_file.tell()
+        self.spill_file.write(data)
+        self.spilled[index] = (offset, len(data))
+        self.n_spilled += 1
+
+    def _read_spilled(self, index: int) -> bytes:
+        """Read a spilled segment back from disk."""
+        offset, length = self.spilled.pop(index)
+        self.spill_file.seek(offset)
+        return self.spill_file.read(length)
+
+    def close(self) -> None:
+        """Drop buffered segments and remove the spill file."""
+        with self.condition:
+            self.memory.clear()
+            self.spilled.clear()
+            self.memory_bytes = 0
+
+            if self.spill_file is not None:
+                self.spill_file.close()
+                self.spill_file = None
+
+                try:
+                    os.remove(self.spill_path)
+                except OSError as e:
+                    logging.error(f"Can't remove spill file {self.spill_path}: {e}")
+
+            self.condition.notify_all()
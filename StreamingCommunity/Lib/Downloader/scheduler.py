@@ -0,0 +1,115 @@
+# 18.10.26
+
+import logging
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Iterable, Tuple
+
+
+# External library
+from rich.console import Console
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Logic class
+from .autoscale import ConcurrencyBudget, set_global_budget, set_progress_offset
+from .HLS.segments import M3U8_Segments
+from .DASH.segments import MPD_Segments
+from .MP4.downloader import InterruptHandler
+
+
+# Config
+MAX_PARALLEL_EPISODES = config_manager.get_int('M3U8_DOWNLOAD', 'max_parallel_episodes')
+GLOBAL_MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'global_max_workers')
+
+
+# Variable
+console = Console()
+EPISODE_PROGRESS_LINES = 4      # Progress bar lines reserved to each episode (video, audio tracks)
+
+
+def _download_in_slot(slot: int, download_fn: Callable[[int], Tuple[str, bool]], i_episode: int) -> Tuple[str, bool]:
+    """Run one episode with its progress bars on the lines of `slot`, below the other running episodes."""
+    set_progress_offset(slot * EPISODE_PROGRESS_LINES)
+    try:
+        return download_fn(i_episode)
+    finally:
+        set_progress_offset(None)
+
+
+def interrupt_all() -> None:
+    """Stop every HLS, DASH and MP4 download running in this process."""
+    M3U8_Segments.interrupt_all()
+    MPD_Segments.interrupt_all()
+    InterruptHandler.interrupt_all()
+
+
+def download_episodes(episode_indices: Iterable[int], download_fn: Callable[[int], Tuple[str, bool]]) -> None:
+    """
+    Download a list of episodes, up to 'max_parallel_episodes' at a time.
+
+    With more than one slot, episode N+1 is already downloading while episode N is
+    being merged by FFmpeg, and every download shares 'global_max_workers' requests
+    in flight. Each running episode draws its progress bars on its own lines.
+    As soon as one episode reports it was stopped, no new episode is started.
+
+    Parameters:
+        - episode_indices (Iterable[int]): Episodes to download, in order.
+        - download_fn (Callable): Site function downloading one episode, returning (path, stopped).
+    """
+    episode_indices = list(episode_indices)
+
+    if MAX_PARALLEL_EPISODES <= 1 or len(episode_indices) <= 1:
+        for i_episode in episode_indices:
+            path, stopped = download_fn(i_episode)
+
+            if stopped:
+                break
+        return
+
+    pending = iter(episode_indices)
+    free_slots = list(range(MAX_PARALLEL_EPISODES))
+    running = {}
+    stopped = False
+
+    set_global_budget(ConcurrencyBudget(GLOBAL_MAX_WORKERS) if GLOBAL_MAX_WORKERS > 0 else None)
+    executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_EPISODES, thread_name_prefix="episode")
+
+    def submit_next(count: int) -> None:
+        for i_episode in islice(pending, count):
+            slot = free_slots.pop(0)
+            running[executor.submit(_download_in_slot, slot, download_fn, i_episode)] = slot
+
+    try:
+        submit_next(MAX_PARALLEL_EPISODES)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                free_slots.append(running.pop(future))
+
+                try:
+                    path, episode_stopped = future.result()
+                    stopped = stopped or episode_stopped
+
+                except Exception as e:
+                    logging.error(f"Episode download failed: {e}", exc_info=True)
+                    console.print(f"[red]Episode download failed: {e}")
+
+            # Refill the free slots with the next episodes
+            free_slots.sort()
+            if not stopped:
+                submit_next(len(done))
+
+    except KeyboardInterrupt:
+        console.print("\n[red]Stopping every running episode...")
+        interrupt_all()
+        raise
+
+    finally:
+        executor.shutdown(wait=True)
+        set_global_budget(None)
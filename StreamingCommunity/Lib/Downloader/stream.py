@@ -0,0 +1,54 @@
+# 18.10.26
+
+# External library
+import httpx
+
+
+def _new_buffer(response: httpx.Response) -> bytearray:
+    """
+    Preallocate the segment buffer from Content-Length when the body is not compressed
+    (otherwise the decoded size is unknown and the buffer grows while reading).
+    """
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return bytearray()
+
+    try:
+        return bytearray(int(response.headers.get('Content-Length', 0)))
+    except ValueError:
+        return bytearray()
+
+
+def _store_chunk(buffer: bytearray, position: int, chunk: bytes) -> int:
+    """Copy `chunk` at `position`, growing the buffer only if the server sent more than announced."""
+    end = position + len(chunk)
+    buffer[position:end] = chunk
+    return end
+
+
+def read_into_buffer(response: httpx.Response) -> bytearray:
+    """
+    Read a streamed response (client.stream(...)) into a single bytearray.
+
+    Unlike `response.content`, chunks are copied once into a preallocated buffer instead of being
+    joined into a new bytes object, and the result is mutable so it can be decrypted in place.
+    """
+    buffer = _new_buffer(response)
+    position = 0
+
+    for chunk in response.iter_bytes():
+        position = _store_chunk(buffer, position, chunk)
+
+    del buffer[position:]
+    return buffer
+
+
+async def aread_into_buffer(response: httpx.Response) -> bytearray:
+    """Async version of `read_into_buffer` for responses from an httpx.AsyncClient stream."""
+    buffer = _new_buffer(response)
+    position = 0
+
+    async for chunk in response.aiter_bytes():
+        position = _store_chunk(buffer, position, chunk)
+
+    del buffer[position:]
+    return buffer
@@ -1,13 +1,17 @@
 # 18.04.24
 
-from .command import join_video, join_audios, join_subtitle
+from .command import join_video, join_audios, join_subtitle, join_all, open_stream_remux
 from .util import print_duration_table, get_video_duration
+from .capabilities import get_ffmpeg_capabilities
 
 
 __all__ = [
     "join_video",
     "join_audios",
     "join_subtitle",
+    "join_all",
+    "open_stream_remux",
     "print_duration_table",
     "get_video_duration",
+    "get_ffmpeg_capabilities",
 ]
\ No newline at end of file
@@ -0,0 +1,208 @@
+# 18.10.26
+
+import os
+import json
+import shutil
+import logging
+import threading
+import subprocess
+from typing import Dict, List, Optional
+
+
+# Internal utilities
+from StreamingCommunity.Util.os import os_summary, get_ffmpeg_path
+
+
+# Variable
+CACHE_FILE_NAME = "ffmpeg_capabilities.json"
+_SECTIONS = {
+    'encoders': ['-encoders'],
+    'decoders': ['-decoders'],
+    'muxers': ['-muxers'],
+    'hwaccels': ['-hwaccels'],
+    'version': ['-version'],
+}
+_registry: Optional["FFmpegCapabilities"] = None
+_registry_lock = threading.Lock()
+
+
+def _parse_codec_list(output: str) -> List[str]:
+    """Names from '-encoders' / '-decoders' output: lines after the ' ------' separator, name in the second column."""
+    names, started = [], False
+
+    for line in output.splitlines():
+        if not started:
+            started = line.strip().startswith('------')
+            continue
+
+        parts = line.split()
+        if len(parts) >= 2:
+            names.append(parts[1])
+
+    return names
+
+
+def _parse_muxers(output: str) -> List[str]:
+    """Names from '-muxers' output: lines after the ' --' separator, name in the second column (may be 'a,b')."""
+    names, started = [], False
+
+    for line in output.splitlines():
+        if not started:
+            started = line.strip() == '--'
+            continue
+
+        parts = line.split()
+        if len(parts) >= 2:
+            names.extend(parts[1].split(','))
+
+    return names
+
+
+def _parse_hwaccels(output: str) -> List[str]:
+    """Names from '-hwaccels' output: one per line after the header."""
+    return [line.strip() for line in output.splitlines()[1:] if line.strip()]
+
+
+def _parse_version(output: str) -> str:
+    """First line of '-version', e.g. 'ffmpeg version 6.1 Copyright ...'."""
+    return output.splitlines()[0].strip() if output else ""
+
+
+_PARSERS = {
+    'encoders': _parse_codec_list,
+    'decoders': _parse_codec_list,
+    'muxers': _parse_muxers,
+    'hwaccels': _parse_hwaccels,
+    'version': _parse_version,
+}
+
+
+class FFmpegCapabilities:
+    """
+    Lazily built registry of what the FFmpeg binary supports (encoders, decoders, muxers, hwaccels, version).
+
+    Each section runs its 'ffmpeg -<section>' command only the first time it is needed, and the
+    results are saved to a small JSON file next to the FFmpeg binaries, keyed by the binary path and
+    mtime, so later runs skip the subprocess entirely until FFmpeg is replaced.
+    """
+    def __init__(self, ffmpeg_path: str, cache_path: Optional[str] = None):
+        """
+        Parameters:
+            - ffmpeg_path (str): Path of the FFmpeg binary.
+            - cache_path (str): JSON file where sections are persisted, None to keep them in memory only.
+        """
+        self.ffmpeg_path = ffmpeg_path
+        self.cache_path = cache_path
+        self.signature = self._get_signature()
+
+        self.lock = threading.Lock()
+        self.sections: Dict[str, object] = self._load()
+
+    def _get_signature(self) -> str:
+        """Binary path + mtime + size, so an upgraded FFmpeg invalidates the cache file."""
+        resolved = shutil.which(self.ffmpeg_path) or self.ffmpeg_path
+
+        try:
+            stat = os.stat(resolved)
+            return f"{os.path.realpath(resolved)}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            return str(resolved)
+
+    def _load(self) -> Dict[str, object]:
+        if not self.cache_path or not os.path.isfile(self.cache_path):
+            return {}
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring FFmpeg capabilities cache: {e}")
+            return {}
+
+        if data.get('signature') != self.signature:
+            return {}
+
+        return data.get('sections', {})
+
+    def _save(self) -> None:
+        if not self.cache_path or not os.path.isdir(os.path.dirname(self.cache_path)):
+            return
+
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'signature': self.signature, 'sections': self.sections}, f)
+            os.replace(tmp_path, self.cache_path)
+
+        except OSError as e:
+            logging.warning(f"Cannot write FFmpeg capabilities cache: {e}")
+
+    def get(self, section: str):
+        """
+        Return one section, running FFmpeg only if it is not cached yet.
+
+        Returns:
+            list[str] | str | None: The parsed section, None if FFmpeg failed.
+        """
+        with self.lock:
+            if section in self.sections:
+                return self.sections[section]
+
+            try:
+                result = subprocess.run(
+                    [self.ffmpeg_path, '-hide_banner', *_SECTIONS[section]],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.error(f"Error executing 'ffmpeg {_SECTIONS[section][0]}': {e}")
+                return None
+
+            self.sections[section] = _PARSERS[section](result.stdout)
+            logging.info(f"FFmpeg capabilities: loaded '{section}'")
+            self._save()
+
+            return self.sections[section]
+
+    def has_encoder(self, name: str) -> Optional[bool]:
+        """True if FFmpeg has the encoder, None if the list could not be read."""
+        encoders = self.get('encoders')
+        return None if encoders is None else name in encoders
+
+    def has_decoder(self, name: str) -> Optional[bool]:
+        """True if FFmpeg has the decoder, None if the list could not be read."""
+        decoders = self.get('decoders')
+        return None if decoders is None else name in decoders
+
+    def has_muxer(self, name: str) -> Optional[bool]:
+        """True if FFmpeg has the muxer, None if the list could not be read."""
+        muxers = self.get('muxers')
+        return None if muxers is None else name in muxers
+
+    def has_hwaccel(self, name: str) -> Optional[bool]:
+        """True if FFmpeg supports the hardware acceleration method, None if the list could not be read."""
+        hwaccels = self.get('hwaccels')
+        return None if hwaccels is None else name in hwaccels
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.get('version')
+
+
+def get_ffmpeg_capabilities() -> FFmpegCapabilities:
+    """
+    Return the process-wide capabilities registry for the current FFmpeg binary,
+    building it the first time (or again if the FFmpeg path changed).
+    """
+    global _registry
+    ffmpeg_path = get_ffmpeg_path()
+
+    with _registry_lock:
+        if _registry is None or _registry.ffmpeg_path != ffmpeg_path:
+            cache_path = os.path.join(os_summary.get_binary_directory(), CACHE_FILE_NAME)
+            _registry = FFmpegCapabilities(ffmpeg_path, cache_path)
+
+        return _registry
@@ -1,9 +1,11 @@
 # 16.04.24
 
-import re
+import time
 import logging
 import threading
 import subprocess
+from collections import deque
+from typing import Dict, Optional
 
 
 # External library
@@ -14,62 +16,112 @@ from rich.console import Console
 from StreamingCommunity.Util.os import internet_manager
 
 
+# Logic class
+from .util import format_duration
+
+
 # Variable
 console = Console()
-terminate_flag = threading.Event()
+UPDATE_INTERVAL = 0.5
 
 
-def capture_output(process: subprocess.Popen, description: str) -> None:
+def parse_speed(value: str) -> Optional[float]:
     """
-    Function to capture and print output from a subprocess.
+    Convert FFmpeg's speed field ('1.5x', 'N/A') to a float multiplier.
 
     Parameters:
-        - process (subprocess.Popen): The subprocess whose output is captured.
+        - value (str): The 'speed' value from the progress output.
+
+    Returns:
+        float: The speed multiplier, None if not available yet.
+    """
+    try:
+        speed = float(value.rstrip('x'))
+        return speed if speed > 0 else None
+    except (AttributeError, ValueError):
+        return None
+
+
+def format_progress(data: Dict[str, str], description: str, duration: Optional[float] = None) -> str:
+    """
+    Build the progress line from one '-progress' block.
+
+    Parameters:
+        - data (dict): Key/value pairs of the block (out_time_us, total_size, speed, ...).
         - description (str): Description of the command being executed.
+        - duration (float): Duration of the input in seconds, used for percentage and ETA.
+
+    Returns:
+        str: The formatted progress string.
     """
     try:
-        max_length = 0
+        byte_size = int(data.get('total_size', 0))
+    except ValueError:
+        byte_size = 0
 
-        for line in iter(process.stdout.readline, ''):          
-            try:
-                line = line.strip()
-                logging.info(f"CAPTURE ffmpeg line: {line}")
+    progress_string = (f" {description}[white]: "
+                       f"([green]'speed': [yellow]{data.get('speed', 'N/A').strip()}[white], "
+                       f"[green]'size': [yellow]{internet_manager.format_file_size(byte_size)}[white]")
 
-                if not line:
-                    continue
+    try:
+        out_time = int(data.get('out_time_us', data.get('out_time_ms', 0))) / 1_000_000
+    except ValueError:
+        out_time = 0
 
-                # Check if termination is requested
-                if terminate_flag.is_set():
-                    break
+    if duration and out_time > 0:
+        percentage = min(out_time / duration * 100, 100.0)
+        progress_string += f", [green]'progress': [yellow]{percentage:.1f}%[white]"
 
-                if "size=" in line:
-                    try:
+        speed = parse_speed(data.get('speed'))
+        if speed and data.get('progress') != 'end':
+            hours, minutes, seconds = format_duration(max(duration - out_time, 0) / speed)
+            progress_string += f", [green]'eta': [yellow]{hours:02d}:{minutes:02d}:{seconds:02d}[white]"
 
-                        # Parse the output line to extract relevant information
-                        data = parse_output_line(line)
+    return progress_string + ")"
 
-                        if 'q' in data:
-                            is_end = (float(data.get('q', -1.0)) == -1.0)
-                            size_key = 'Lsize' if is_end else 'size'
-                            byte_size = int(re.findall(r'\d+', data.get(size_key, '0'))[0]) * 1000
-                        else:
-                            byte_size = int(re.findall(r'\d+', data.get('size', '0'))[0]) * 1000
 
+def capture_output(process: subprocess.Popen, description: str, duration: Optional[float] = None, terminate_flag: Optional[threading.Event] = None) -> None:
+    """
+    Function to read FFmpeg's '-progress' channel and print the progress.
 
-                        # Construct the progress string with formatted output information
-                        progress_string = (f" {description}[white]: "
-                                           f"([green]'speed': [yellow]{data.get('speed', 'N/A')}[white], "
-                                           f"[green]'size': [yellow]{internet_manager.format_file_size(byte_size)}[white])")
-                        max_length = max(max_length, len(progress_string))
+    The channel is a stream of 'key=value' lines grouped in blocks closed by 'progress=continue'
+    (or 'progress=end'); the console is refreshed at most every UPDATE_INTERVAL seconds.
 
-                        # Print the progress string to the console, overwriting the previous line
-                        console.print(progress_string.ljust(max_length), end="\r")
+    Parameters:
+        - process (subprocess.Popen): The subprocess whose output is captured.
+        - description (str): Description of the command being executed.
+        - duration (float): Duration of the input in seconds, used for percentage and ETA.
+        - terminate_flag (threading.Event): Set to stop the capture.
+    """
+    try:
+        max_length = 0
+        last_update = 0.0
+        data: Dict[str, str] = {}
+
+        for line in iter(process.stdout.readline, ''):
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+
+            key, value = key.strip(), value.strip()
+            data[key] = value
+            if key != 'progress':
+                continue
+
+            # Check if termination is requested
+            if terminate_flag is not None and terminate_flag.is_set():
+                break
 
-                    except Exception as e:
-                        logging.error(f"Error parsing output line: {line} - {e}")
+            now = time.monotonic()
+            if value == 'end' or now - last_update >= UPDATE_INTERVAL:
+                last_update = now
 
-            except Exception as e:
-                logging.error(f"Error processing line from subprocess: {e}")
+                # Print the progress string to the console, overwriting the previous line
+                progress_string = format_progress(data, description, duration)
+                max_length = max(max_length, len(progress_string))
+                console.print(progress_string.ljust(max_length), end="\r")
+
+            data = {}
 
     except Exception as e:
         logging.error(f"Error in capture_output: {e}")
@@ -81,33 +133,14 @@ def capture_output(process: subprocess.Popen, description: str) -> None:
             logging.error(f"Error terminating process: {e}")
 
 
-def parse_output_line(line: str) -> dict:
-    """
-    Function to parse the output line and extract relevant information.
-
-    Parameters:
-        - line (str): The output line to parse.
-
-    Returns:
-        dict: A dictionary containing parsed information.
-    """
+def drain_stderr(process: subprocess.Popen, lines: deque) -> None:
+    """Keep the last lines written by FFmpeg on stderr, so the pipe never fills up and errors can be logged."""
     try:
-        data = {}
-        parts = line.replace("  ", "").replace("= ", "=").split()
-
-        for part in parts:
-            key_value = part.split('=')
-
-            if len(key_value) == 2:
-                key = key_value[0]
-                value = key_value[1]
-                data[key] = value
-
-        return data
-    
+        for line in iter(process.stderr.readline, ''):
+            if line.strip():
+                lines.append(line.rstrip())
     except Exception as e:
-        logging.error(f"Error parsing line: {line} - {e}")
-        return {}
+        logging.error(f"Error reading ffmpeg stderr: {e}")
 
 
 def terminate_process(process):
@@ -124,27 +157,31 @@ def terminate_process(process):
         logging.error(f"Failed to terminate process: {e}")
 
 
-def capture_ffmpeg_real_time(ffmpeg_command: list, description: str) -> None:
+def capture_ffmpeg_real_time(ffmpeg_command: list, description: str, duration: Optional[float] = None) -> None:
     """
-    Function to capture real-time output from ffmpeg process.
+    Function to capture real-time progress from ffmpeg process.
+
+    Progress is read from '-progress pipe:1 -nostats' instead of the human-readable stderr lines.
 
     Parameters:
         - ffmpeg_command (list): The command to execute ffmpeg.
         - description (str): Description of the command being executed.
+        - duration (float): Duration of the input in seconds, enables percentage and ETA.
     """
-    global terminate_flag
-
-    # Clear the terminate_flag before starting a new capture
-    terminate_flag.clear()
+    terminate_flag = threading.Event()
+    ffmpeg_command = [ffmpeg_command[0], '-progress', 'pipe:1', '-nostats'] + list(ffmpeg_command[1:])
+    stderr_lines = deque(maxlen=50)
 
     try:
 
         # Start the ffmpeg process with subprocess.Popen
-        process = subprocess.Popen(ffmpeg_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        process = subprocess.Popen(ffmpeg_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
 
-        # Start a thread to capture and print output
-        output_thread = threading.Thread(target=capture_output, args=(process, description))
+        # Start threads to capture the progress and drain stderr
+        output_thread = threading.Thread(target=capture_output, args=(process, description, duration, terminate_flag))
+        stderr_thread = threading.Thread(target=drain_stderr, args=(process, stderr_lines), daemon=True)
         output_thread.start()
+        stderr_thread.start()
 
         try:
             # Wait for ffmpeg process to complete
@@ -152,13 +189,20 @@ def capture_ffmpeg_real_time(ffmpeg_command: list, description: str) -> None:
 
         except KeyboardInterrupt:
             logging.error("Terminating ffmpeg process...")
+            terminate_process(process)
 
         except Exception as e:
             logging.error(f"Error in ffmpeg process: {e}")
-            
+
         finally:
             terminate_flag.set()
             output_thread.join()
+            stderr_thread.join(timeout=1)
+
+        if process.returncode:
+            logging.error(f"FFmpeg exited with code {process.returncode}: " + "\n".join(stderr_lines))
+        elif stderr_lines:
+            logging.info("FFmpeg output: " + "\n".join(stderr_lines))
 
     except Exception as e:
-        logging.error(f"Failed to start ffmpeg process: {e}")
\ No newline at end of file
+        logging.error(f"Failed to start ffmpeg process: {e}")
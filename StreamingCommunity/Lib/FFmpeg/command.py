@@ -15,8 +15,9 @@ from StreamingCommunity.Util.os import os_manager, suppress_output, get_ffmpeg_p
 
 
 # Logic class
-from .util import need_to_force_to_ts, check_duration_v_a
+from .util import need_to_force_to_ts, check_duration_v_a, get_video_duration
 from .capture import capture_ffmpeg_real_time
+from .capabilities import get_ffmpeg_capabilities
 from ..M3U8 import M3U8_Codec
 
 
@@ -37,30 +38,15 @@ console = Console()
 
 def check_subtitle_encoders() -> Tuple[Optional[bool], Optional[bool]]:
     """
-    Executes 'ffmpeg -encoders' and checks if 'mov_text' and 'webvtt' encoders are available.
+    Checks if 'mov_text' and 'webvtt' encoders are available, reading 'ffmpeg -encoders'
+    from the capabilities registry (the command runs once, then it is cached).
     
     Returns:
         Tuple[Optional[bool], Optional[bool]]: A tuple containing (mov_text_supported, webvtt_supported)
             Returns (None, None) if the FFmpeg command fails
     """
-    try:
-        result = subprocess.run(
-            [get_ffmpeg_path(), '-encoders'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Check for encoder presence in output
-        output = result.stdout
-        mov_text_supported = "mov_text" in output
-        webvtt_supported = "webvtt" in output
-        
-        return mov_text_supported, webvtt_supported
-        
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing 'ffmpeg -encoders': {e}")
-        return None, None
+    capabilities = get_ffmpeg_capabilities()
+    return capabilities.has_encoder("mov_text"), capabilities.has_encoder("webvtt")
 
 
 def select_subtitle_encoder() -> Optional[str]:
@@ -90,30 +76,15 @@ def select_subtitle_encoder() -> Optional[str]:
     return None
 
 
-def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
+def _add_codec_params(ffmpeg_cmd: List[str], codec: M3U8_Codec = None, caller: str = "join") -> None:
     """
-    Joins single ts video file to mp4
-    
+    Append the output codec parameters ('-c copy' unless re-encoding is enabled in config) and the preset.
+
     Parameters:
-        - video_path (str): The path to the video file.
-        - out_path (str): The path to save the output file.
-        - codec (M3U8_Codec): The video codec to use. Defaults to 'copy'.
+        - ffmpeg_cmd (list[str]): The FFmpeg command to extend.
+        - codec (M3U8_Codec): Codec information used when re-encoding.
+        - caller (str): Name of the join, shown when a codec is missing.
     """
-    ffmpeg_cmd = [get_ffmpeg_path()]
-
-    # Enabled the use of gpu
-    if USE_GPU:
-        ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
-
-    # Add mpegts to force to detect input file as ts file
-    if need_to_force_to_ts(video_path):
-        #console.log("[red]Force input file to 'mpegts'.")
-        ffmpeg_cmd.extend(['-f', 'mpegts'])
-
-    # Insert input video path
-    ffmpeg_cmd.extend(['-i', video_path])
-
-    # Add output Parameters
     if USE_CODEC and codec is not None:
         if USE_VCODEC:
             if codec.video_codec_name: 
@@ -122,17 +93,16 @@ def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
                 else: 
                     ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
             else: 
-                console.log("[red]Cant find vcodec for 'join_audios'")
+                console.log(f"[red]Cant find vcodec for '{caller}'")
         else:
             if USE_GPU:
                 ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
 
-
         if USE_ACODEC:
             if codec.audio_codec_name: 
                 ffmpeg_cmd.extend(['-c:a', codec.audio_codec_name])
             else: 
-                console.log("[red]Cant find acodec for 'join_audios'")
+                console.log(f"[red]Cant find acodec for '{caller}'")
 
         if USE_BITRATE:
             ffmpeg_cmd.extend(['-b:v',  f'{codec.video_bitrate // 1000}k'])
@@ -147,6 +117,33 @@ def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
     else:
         ffmpeg_cmd.extend(['-preset', 'fast'])
 
+
+def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
+    """
+    Joins single ts video file to mp4
+    
+    Parameters:
+        - video_path (str): The path to the video file.
+        - out_path (str): The path to save the output file.
+        - codec (M3U8_Codec): The video codec to use. Defaults to 'copy'.
+    """
+    ffmpeg_cmd = [get_ffmpeg_path()]
+
+    # Enabled the use of gpu
+    if USE_GPU:
+        ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
+
+    # Add mpegts to force to detect input file as ts file
+    if need_to_force_to_ts(video_path):
+        #console.log("[red]Force input file to 'mpegts'.")
+        ffmpeg_cmd.extend(['-f', 'mpegts'])
+
+    # Insert input video path
+    ffmpeg_cmd.extend(['-i', video_path])
+
+    # Add output Parameters
+    _add_codec_params(ffmpeg_cmd, codec, 'join_video')
+
     # Overwrite
     ffmpeg_cmd += [out_path, "-y"]
 
@@ -156,13 +153,13 @@ def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
     else:
 
         if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video")
+            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video", get_video_duration(video_path))
             print()
 
         else:
             console.log("[purple]FFmpeg [white][[cyan]Join video[white]] ...")
             with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video")
+                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video", get_video_duration(video_path))
                 print()
 
     return out_path
@@ -206,37 +203,7 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
         ffmpeg_cmd.append(f'{i}:a')     # Map audio streams from subsequent inputs
 
     # Add output Parameters
-    if USE_CODEC:
-        if USE_VCODEC:
-            if codec.video_codec_name: 
-                if not USE_GPU: 
-                    ffmpeg_cmd.extend(['-c:v', codec.video_codec_name])
-                else: 
-                    ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
-            else: 
-                console.log("[red]Cant find vcodec for 'join_audios'")
-        else:
-            if USE_GPU:
-                ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
-
-        if USE_ACODEC:
-            if codec.audio_codec_name: 
-                ffmpeg_cmd.extend(['-c:a', codec.audio_codec_name])
-            else: 
-                console.log("[red]Cant find acodec for 'join_audios'")
-
-        if USE_BITRATE:
-            ffmpeg_cmd.extend(['-b:v',  f'{codec.video_bitrate // 1000}k'])
-            ffmpeg_cmd.extend(['-b:a',  f'{codec.audio_bitrate // 1000}k'])
-
-    else:
-        ffmpeg_cmd.extend(['-c', 'copy'])
-
-    # Ultrafast preset always or fast for gpu
-    if not USE_GPU:
-        ffmpeg_cmd.extend(['-preset', FFMPEG_DEFAULT_PRESET])
-    else:
-        ffmpeg_cmd.extend(['-preset', 'fast'])
+    _add_codec_params(ffmpeg_cmd, codec, 'join_audios')
 
     # Use shortest input path for video and audios
     if not video_audio_same_duration:
@@ -252,13 +219,13 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
         
     else:
         if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio")
+            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio", get_video_duration(video_path))
             print()
 
         else:
             console.log("[purple]FFmpeg [white][[cyan]Join audio[white]] ...")
             with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio")
+                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio", get_video_duration(video_path))
                 print()
 
     return out_path
@@ -307,13 +274,164 @@ def join_subtitle(video_path: str, subtitles_list: List[Dict[str, str]], out_pat
 
     else:
         if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle")
+            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle", get_video_duration(video_path))
             print()
 
         else:
             console.log("[purple]FFmpeg [white][[cyan]Join subtitle[white]] ...")
             with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle")
+                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle", get_video_duration(video_path))
                 print()
 
-    return out_path
\ No newline at end of file
+    return out_path
+
+
+def build_merge_command(video_path: str, out_path: str, audio_tracks: List[Dict[str, str]] = None, subtitles_list: List[Dict[str, str]] = None, 
+                        codec: M3U8_Codec = None, force_ts: bool = False, shortest: bool = False) -> List[str]:
+    """
+    Build one FFmpeg command mapping the video, every audio track and every subtitle into a single output.
+    
+    Parameters:
+        - video_path (str): The path to the video file ('pipe:0' to read it from stdin).
+        - out_path (str): The path to save the output file.
+        - audio_tracks (list[dict[str, str]]): Audio tracks with the 'path' key, None to keep the audio muxed in the video.
+        - subtitles_list (list[dict[str, str]]): Subtitles with the 'path' and 'language' keys.
+        - codec (M3U8_Codec): Codec information used when re-encoding is enabled in config.
+        - force_ts (bool): Read the video input as MPEG-TS.
+        - shortest (bool): Stop at the end of the shortest input.
+
+    Returns:
+        list[str]: The FFmpeg command.
+    """
+    audio_tracks = [a for a in (audio_tracks or []) if os_manager.check_file(a.get('path'))]
+    subtitles_list = [s for s in (subtitles_list or []) if os_manager.check_file(s.get('path'))]
+
+    ffmpeg_cmd = [get_ffmpeg_path()]
+
+    # Enabled the use of gpu
+    if USE_GPU:
+        ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
+
+    # Add mpegts to force to detect input file as ts file
+    if force_ts:
+        ffmpeg_cmd.extend(['-f', 'mpegts'])
+
+    # Inputs: video, then audio tracks, then subtitles
+    ffmpeg_cmd.extend(['-i', video_path])
+    for audio_track in audio_tracks:
+        ffmpeg_cmd.extend(['-i', audio_track.get('path')])
+    for subtitle in subtitles_list:
+        ffmpeg_cmd.extend(['-i', subtitle.get('path')])
+
+    # Video from the first input, audio from the separate tracks or from the video itself
+    ffmpeg_cmd.extend(['-map', '0:v'])
+    if audio_tracks:
+        for i in range(1, len(audio_tracks) + 1):
+            ffmpeg_cmd.extend(['-map', f'{i}:a'])
+    else:
+        ffmpeg_cmd.extend(['-map', '0:a?'])
+
+    first_sub_input = len(audio_tracks) + 1
+    for idx, subtitle in enumerate(subtitles_list):
+        ffmpeg_cmd.extend(['-map', f'{first_sub_input + idx}:s'])
+        ffmpeg_cmd.extend([f'-metadata:s:s:{idx}', f"title={subtitle['language']}"])
+
+    # Add output Parameters
+    _add_codec_params(ffmpeg_cmd, codec, 'join_all')
+    if subtitles_list:
+        ffmpeg_cmd.extend(['-c:s', select_subtitle_encoder()])
+
+    if shortest:
+        ffmpeg_cmd.extend(['-shortest', '-strict', 'experimental'])
+
+    # Overwrite
+    ffmpeg_cmd += [out_path, "-y"]
+    return ffmpeg_cmd
+
+
+def join_all(video_path: str, out_path: str, audio_tracks: List[Dict[str, str]] = None, subtitles_list: List[Dict[str, str]] = None, 
+             codec: M3U8_Codec = None, shortest: Optional[bool] = None):
+    """
+    Joins video, audio tracks and subtitles with a single FFmpeg remux.
+    
+    Parameters:
+        - video_path (str): The path to the video file.
+        - out_path (str): The path to save the output file.
+        - audio_tracks (list[dict[str, str]]): Audio tracks with the 'path' key.
+        - subtitles_list (list[dict[str, str]]): Subtitles with the 'path' and 'language' keys.
+        - codec (M3U8_Codec): The codec information, used only when re-encoding.
+        - shortest (bool): Stop at the end of the shortest input. None to decide by probing the video
+            and the first audio track, when the durations are not already known by the caller.
+    """
+    if shortest is None:
+        shortest = False
+
+        if audio_tracks:
+            video_audio_same_duration, duration_diff = check_duration_v_a(video_path, audio_tracks[0].get('path'))
+
+            # Use shortest input path for video and audios
+            if not video_audio_same_duration:
+                console.log(f"[red]Use shortest input (Duration difference: {duration_diff:.2f} seconds)...")
+                shortest = True
+
+    ffmpeg_cmd = build_merge_command(
+        video_path=video_path,
+        out_path=out_path,
+        audio_tracks=audio_tracks,
+        subtitles_list=subtitles_list,
+        codec=codec,
+        force_ts=need_to_force_to_ts(video_path),
+        shortest=shortest
+    )
+    logging.info(f"FFmpeg command: {ffmpeg_cmd}")
+
+    # Run join
+    if DEBUG_MODE:
+        subprocess.run(ffmpeg_cmd, check=True)
+
+    else:
+        if get_use_large_bar():
+            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join all", get_video_duration(video_path))
+            print()
+
+        else:
+            console.log("[purple]FFmpeg [white][[cyan]Join all[white]] ...")
+            with suppress_output():
+                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join all", get_video_duration(video_path))
+                print()
+
+    return out_path
+
+
+def open_stream_remux(out_path: str, audio_tracks: List[Dict[str, str]] = None, subtitles_list: List[Dict[str, str]] = None, 
+                      codec: M3U8_Codec = None, shortest: bool = False) -> subprocess.Popen:
+    """
+    Start an FFmpeg remux that reads the MPEG-TS video from stdin and writes the final file in one pass,
+    adding audio tracks and subtitles already on disk. The caller writes the video segments in order
+    to `process.stdin`, closes it and waits for the process.
+    
+    Parameters:
+        - out_path (str): The path to save the output file.
+        - audio_tracks (list[dict[str, str]]): Audio tracks with the 'path' key, None to keep the audio muxed in the video.
+        - subtitles_list (list[dict[str, str]]): Subtitles with the 'path' and 'language' keys.
+        - codec (M3U8_Codec): Codec information used when re-encoding is enabled in config.
+        - shortest (bool): Stop at the end of the shortest input, decided by the caller since the video cannot be probed.
+
+    Returns:
+        subprocess.Popen: The running FFmpeg process, its log is written next to `out_path`.
+    """
+    ffmpeg_cmd = build_merge_command(
+        video_path='pipe:0',
+        out_path=out_path,
+        audio_tracks=audio_tracks,
+        subtitles_list=subtitles_list,
+        codec=codec,
+        force_ts=True,
+        shortest=shortest
+    )
+    ffmpeg_cmd[1:1] = ['-loglevel', DEBUG_FFMPEG]
+    logging.info(f"FFmpeg stream command: {ffmpeg_cmd}")
+    console.log("[purple]FFmpeg [white][[cyan]Stream remux[white]] ...")
+
+    with open(f"{out_path}.log", 'wb') as log_file:
+        return subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log_file)
@@ -1,11 +1,12 @@
 # 16.04.24
 
 import os
-import sys
 import json
 import subprocess
 import logging
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 
 # External library
@@ -18,6 +19,95 @@ from StreamingCommunity.Util.os import get_ffprobe_path
 
 # Variable
 console = Console()
+PROBE_CACHE_SIZE = 128
+_probe_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+
+def _probe_cache_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """Cache key of a file: absolute path, mtime and size, so a rewritten file is probed again."""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    return os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size
+
+
+def clear_probe_cache() -> None:
+    """Drop every cached ffprobe result."""
+    with _probe_cache_lock:
+        _probe_cache.clear()
+
+
+def probe_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Run ffprobe once on a file and return its streams and format, reusing the result
+    while the file is unchanged (same path, mtime and size).
+
+    Parameters:
+        - file_path (str): Path to the media file.
+
+    Returns:
+        dict: The ffprobe output with the 'streams' and 'format' keys, None if the file cannot be probed.
+    """
+    cache_key = _probe_cache_key(file_path)
+    if cache_key is None:
+        logging.error(f"File not found: {file_path}")
+        return None
+
+    with _probe_cache_lock:
+        if cache_key in _probe_cache:
+            _probe_cache.move_to_end(cache_key)
+            return _probe_cache[cache_key]
+
+    # Get ffprobe path and verify it exists
+    ffprobe_path = get_ffprobe_path()
+    if not ffprobe_path or not os.path.exists(ffprobe_path):
+        logging.error(f"FFprobe not found at path: {ffprobe_path}")
+        return None
+
+    if not os.access(file_path, os.R_OK):
+        logging.error(f"No read permission for file: {file_path}")
+        return None
+
+    try:
+        cmd = [ffprobe_path, '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path]
+        logging.info(f"Running FFprobe command: {' '.join(cmd)}")
+        
+        # Use subprocess.run instead of Popen for better error handling
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=False  # Don't raise exception on non-zero exit
+        )
+
+        if result.returncode != 0:
+            logging.error(f"FFprobe failed with return code {result.returncode}")
+            logging.error(f"FFprobe stderr: {result.stderr}")
+            logging.error(f"Command: {' '.join(cmd)}")
+            return None
+
+        info = json.loads(result.stdout)
+
+    except json.JSONDecodeError as e:
+        logging.error(f"Failed to parse FFprobe output: {e}")
+        return None
+
+    except Exception as e:
+        logging.error(f"FFprobe execution failed: {e}")
+        return None
+
+    info.setdefault('streams', [])
+    info.setdefault('format', {})
+
+    with _probe_cache_lock:
+        _probe_cache[cache_key] = info
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+
+    return info
 
 
 def has_audio_stream(video_path: str) -> bool:
@@ -30,22 +120,12 @@ def has_audio_stream(video_path: str) -> bool:
     Returns:
         has_audio (bool): True if the input video has an audio stream, False otherwise.
     """
-    try:
-        ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-print_format', 'json', '-select_streams', 'a', '-show_streams', video_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            if stderr:
-                logging.error(f"Error: {stderr}")
-            else:
-                probe_result = json.loads(stdout)
-                return bool(probe_result.get('streams', []))
-            
-    except Exception as e:
-        logging.error(f"Error: {e}")
+    probe_result = probe_file(video_path)
+    if probe_result is None:
         return False
 
+    return any(stream.get('codec_type') == 'audio' for stream in probe_result['streams'])
+
 
 def get_video_duration(file_path: str) -> float:
     """
@@ -57,31 +137,16 @@ def get_video_duration(file_path: str) -> float:
     Returns:
         (float): The duration of the video in seconds if successful, None if there's an error.
     """
-    try:
-        ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-show_format', '-print_format', 'json', file_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        # Use a with statement to ensure the subprocess is cleaned up properly
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            
-            if proc.returncode != 0:
-                logging.error(f"Error: {stderr}")
-                return None
-            
-            # Parse JSON output
-            probe_result = json.loads(stdout)
-
-            # Extract duration from the video information
-            try:
-                return float(probe_result['format']['duration'])
-            
-            except Exception:
-                return 1
+    probe_result = probe_file(file_path)
+    if probe_result is None:
+        return None
 
-    except Exception as e:
-        logging.error(f"Get video duration error: {e}")
-        sys.exit(0)
+    # Extract duration from the video information
+    try:
+        return float(probe_result['format']['duration'])
+    
+    except Exception:
+        return 1
 
 
 def format_duration(seconds: float) -> Tuple[int, int, int]:
@@ -138,61 +203,14 @@ def get_ffprobe_info(file_path):
         dict: A dictionary containing the format name and a list of codec names.
               Returns None if file does not exist or ffprobe crashes.
     """
-    if not os.path.exists(file_path):
-        logging.error(f"File not found: {file_path}")
-        return None
-
-    # Get ffprobe path and verify it exists
-    ffprobe_path = get_ffprobe_path()
-    if not ffprobe_path or not os.path.exists(ffprobe_path):
-        logging.error(f"FFprobe not found at path: {ffprobe_path}")
-        return None
-
-    # Verify file permissions
-    try:
-        file_stat = os.stat(file_path)
-        logging.info(f"File permissions: {oct(file_stat.st_mode)}")
-        if not os.access(file_path, os.R_OK):
-            logging.error(f"No read permission for file: {file_path}")
-            return None
-    except OSError as e:
-        logging.error(f"Cannot access file {file_path}: {e}")
+    info = probe_file(file_path)
+    if info is None:
         return None
 
-    try:
-        cmd = [ffprobe_path, '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path]
-        logging.info(f"Running FFprobe command: {' '.join(cmd)}")
-        
-        # Use subprocess.run instead of Popen for better error handling
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
-        )
-
-        if result.returncode != 0:
-            logging.error(f"FFprobe failed with return code {result.returncode}")
-            logging.error(f"FFprobe stderr: {result.stderr}")
-            logging.error(f"FFprobe stdout: {result.stdout}")
-            logging.error(f"Command: {' '.join(cmd)}")
-            logging.error(f"FFprobe path permissions: {oct(os.stat(ffprobe_path).st_mode)}")
-            return None
-
-        # Parse JSON output
-        try:
-            info = json.loads(result.stdout)
-            return {
-                'format_name': info.get('format', {}).get('format_name'),
-                'codec_names': [stream.get('codec_name') for stream in info.get('streams', [])]
-            }
-        except json.JSONDecodeError as e:
-            logging.error(f"Failed to parse FFprobe output: {e}")
-            return None
-
-    except Exception as e:
-        logging.error(f"FFprobe execution failed: {e}")
-        return None
+    return {
+        'format_name': info['format'].get('format_name'),
+        'codec_names': [stream.get('codec_name') for stream in info['streams']]
+    }
 
 
 def is_png_format_or_codec(file_info):
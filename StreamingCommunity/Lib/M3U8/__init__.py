@@ -1,14 +1,38 @@
 # 02.04.24
 
-from .decryptor import M3U8_Decryption
-from .estimator import M3U8_Ts_Estimator
-from .parser import M3U8_Parser, M3U8_Codec
-from .url_fixer import M3U8_UrlFix
+import importlib
+
+
+# Exported name -> module defining it, imported on first access so that M3U8_Codec
+# (used by FFmpeg for every engine) does not load Cryptodome, psutil and tqdm
+_LAZY_EXPORTS = {
+    "M3U8_Decryption": ".decryptor",
+    "M3U8_KeyCache": ".key_cache",
+    "M3U8_Ts_Estimator": ".estimator",
+    "M3U8_Parser": ".parser",
+    "M3U8_Codec": ".parser",
+    "M3U8_UrlFix": ".url_fixer",
+}
 
 __all__ = [
     "M3U8_Decryption",
+    "M3U8_KeyCache",
     "M3U8_Ts_Estimator",
     "M3U8_Parser",
     "M3U8_Codec",
     "M3U8_UrlFix"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -32,6 +32,9 @@ logging.info("[cyan]Decryption use: Cryptodomex")
 class M3U8_Decryption:
     """
     Class for decrypting M3U8 playlist content using AES with pycryptodomex.
+
+    A new cipher is built for every segment, so segments can be decrypted independently,
+    in any order and from several threads (Cryptodome releases the GIL while decrypting).
     """
     def __init__(self, key: bytes, iv: bytes, method: str) -> None:
         """
@@ -39,57 +42,88 @@ class M3U8_Decryption:
 
         Parameters:
             key (bytes): The encryption key.
-            iv (bytes): The initialization vector (IV).
+            iv (bytes): The initialization vector (IV), None to derive it from the media sequence number.
             method (str): The encryption method.
         """
         self.key = key
         self.iv = iv
         if "0x" in str(iv):
-            self.iv = bytes.fromhex(iv.replace("0x", ""))
+            self.iv = bytes.fromhex(iv.replace("0x", "").replace("0X", "").zfill(32))
         self.method = method
 
-        # Pre-create the cipher based on the encryption method
+        if self.method not in {"AES", "AES-128", "AES-128-CTR"}:
+            raise ValueError("Invalid or unsupported method")
+
+    def get_iv(self, sequence: int = None) -> bytes:
+        """
+        Return the IV of a segment: the explicit one from #EXT-X-KEY, otherwise
+        its media sequence number as a 16-byte big-endian integer (RFC 8216, 5.2).
+
+        Parameters:
+            sequence (int): Media sequence number of the segment.
+        """
+        if self.iv is not None:
+            return self.iv
+
+        return (sequence or 0).to_bytes(16, byteorder='big')
+
+    def new_cipher(self, sequence: int = None):
+        """
+        Build a fresh cipher for one segment.
+
+        Parameters:
+            sequence (int): Media sequence number of the segment.
+        """
         if self.method == "AES":
-            self.cipher = AES.new(self.key, AES.MODE_ECB)
+            return AES.new(self.key, AES.MODE_ECB)
         elif self.method == "AES-128":
-            self.cipher = AES.new(self.key[:16], AES.MODE_CBC, iv=self.iv)
-        elif self.method == "AES-128-CTR":
-            self.cipher = AES.new(self.key[:16], AES.MODE_CTR, nonce=self.iv)
+            return AES.new(self.key[:16], AES.MODE_CBC, iv=self.get_iv(sequence))
         else:
-            raise ValueError("Invalid or unsupported method")
+            return AES.new(self.key[:16], AES.MODE_CTR, nonce=b'', initial_value=self.get_iv(sequence))
 
-    def decrypt(self, ciphertext: bytes) -> bytes:
+    def decrypt(self, ciphertext: bytes, sequence: int = None) -> bytes:
         """
         Decrypt the ciphertext using the specified encryption method.
 
         Parameters:
             ciphertext (bytes): The encrypted content to decrypt.
+            sequence (int): Media sequence number of the segment.
 
         Returns:
             bytes: The decrypted content.
         """
-        #start = time.perf_counter_ns()
+        cipher = self.new_cipher(sequence)
 
         if self.method in {"AES", "AES-128"}:
-            decrypted_data = self.cipher.decrypt(ciphertext)
-            decrypted_content = unpad(decrypted_data, AES.block_size)
-        elif self.method == "AES-128-CTR":
-            decrypted_content = self.cipher.decrypt(ciphertext)
-        else:
-            raise ValueError("Invalid or unsupported method")
+            return unpad(cipher.decrypt(ciphertext), AES.block_size)
+        
+        return cipher.decrypt(ciphertext)
 
+    def decrypt_into(self, buffer: bytearray, sequence: int = None) -> memoryview:
         """
-        end = time.perf_counter_ns()
-
-        # Calculate the elapsed time with high precision
-        elapsed_nanoseconds = end - start
-        elapsed_milliseconds = elapsed_nanoseconds / 1_000_000
-        elapsed_seconds = elapsed_nanoseconds / 1_000_000_000
-
-        # Log performance metrics
-        logging.info("[Crypto Decryption Performance]")
-        logging.info(f"Method: {self.method}")
-        logging.info(f"Decryption Time: {elapsed_milliseconds:.4f} ms ({elapsed_seconds:.6f} s)")
-        logging.info(f"Decrypted Content Length: {len(decrypted_content)} bytes")
+        Decrypt a segment in place, without allocating a second copy of it.
+
+        Parameters:
+            buffer (bytearray): The encrypted content, overwritten with the plaintext.
+            sequence (int): Media sequence number of the segment.
+
+        Returns:
+            memoryview: View over `buffer` without the PKCS#7 padding.
         """
-        return decrypted_content
\ No newline at end of file
+        view = memoryview(buffer)
+        cipher = self.new_cipher(sequence)
+
+        if self.method in {"AES", "AES-128"}:
+            if len(view) == 0 or len(view) % AES.block_size != 0:
+                raise ValueError("Ciphertext length is not a multiple of the AES block size")
+
+            cipher.decrypt(view, output=view)
+
+            padding = view[-1]
+            if padding < 1 or padding > AES.block_size or view[-padding:].tobytes() != bytes([padding]) * padding:
+                raise ValueError("Padding is incorrect.")
+
+            return view[:len(view) - padding]
+
+        cipher.decrypt(view, output=view)
+        return view
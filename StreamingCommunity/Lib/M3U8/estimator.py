@@ -110,7 +110,7 @@ class M3U8_Ts_Estimator:
             logging.error("An unexpected error occurred: %s", e)
             return "Error"
     
-    def update_progress_bar(self, total_downloaded: int, progress_counter: tqdm) -> None:
+    def update_progress_bar(self, total_downloaded: int, progress_counter: tqdm, workers: int = None) -> None:
         try:
             self.add_ts_file(total_downloaded * self.total_segments)
             
@@ -137,6 +137,8 @@ class M3U8_Ts_Estimator:
                 f"{Colors.WHITE}, {Colors.CYAN}{average_internet_speed} {Colors.RED}{average_internet_unit} "
                 #f"{Colors.WHITE}, {Colors.GREEN}CRR {Colors.RED}{retry_count} "
             )
+            if workers is not None:
+                progress_str += f"{Colors.WHITE}, {Colors.GREEN}W {Colors.RED}{workers} "
             
             progress_counter.set_postfix_str(progress_str)
             
@@ -0,0 +1,103 @@
+# 18.10.26
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+# Logic class
+from .decryptor import M3U8_Decryption
+
+
+class M3U8_KeyCache:
+    """
+    Process-wide cache of HLS keys, so a key is fetched once and reused by every rendition
+    and episode that points to it.
+
+    Keys are cached by URI, decryptors by URI + IV + method. Concurrent requests for the same
+    URI wait for a single fetch instead of hitting the key server several times.
+    """
+    def __init__(self, fetch: Callable[[str], bytes], ttl: float = 3600):
+        """
+        Parameters:
+            - fetch (Callable): Function downloading the raw key bytes from a URI.
+            - ttl (float): Seconds a key stays valid in the cache.
+        """
+        self.fetch = fetch
+        self.ttl = ttl
+
+        self.lock = threading.Lock()
+        self.keys: Dict[str, Tuple[bytes, float]] = {}
+        self.decryptions: Dict[Tuple[str, Optional[str], str], Tuple[M3U8_Decryption, float]] = {}
+        self.uri_locks: Dict[str, threading.Lock] = {}
+
+    def get_key(self, uri: str) -> bytes:
+        """
+        Return the key at `uri`, fetching it only if missing or expired.
+        """
+        with self.lock:
+            entry = self.keys.get(uri)
+            if entry is not None and entry[1] > time.time():
+                return entry[0]
+            uri_lock = self.uri_locks.setdefault(uri, threading.Lock())
+
+        with uri_lock:
+            with self.lock:
+                entry = self.keys.get(uri)
+                if entry is not None and entry[1] > time.time():
+                    return entry[0]
+
+            try:
+                key = self.fetch(uri)
+            except Exception as e:
+                raise Exception(f"Failed to fetch key: {e}")
+
+            logging.info(f"Fetched HLS key: {uri}")
+            with self.lock:
+                self.keys[uri] = (key, time.time() + self.ttl)
+
+            return key
+
+    def get_decryption(self, uri: str, iv: Optional[str], method: str) -> M3U8_Decryption:
+        """
+        Return a decryptor for the key at `uri` with the given IV and method.
+        """
+        cache_key = (uri, iv, method)
+
+        with self.lock:
+            entry = self.decryptions.get(cache_key)
+            if entry is not None and entry[1] > time.time():
+                return entry[0]
+
+        decryption = M3U8_Decryption(self.get_key(uri), iv, method)
+        with self.lock:
+            self.decryptions[cache_key] = (decryption, self.keys[uri][1])
+
+        return decryption
+
+    def prefetch(self, uris: Iterable[str], max_workers: int = 4) -> None:
+        """
+        Fetch every distinct key in parallel, before the segments that need them start downloading.
+        """
+        pending = list(dict.fromkeys(uris))
+        if len(pending) <= 1:
+            for uri in pending:
+                self.get_key(uri)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            list(executor.map(self.get_key, pending))
+
+    def invalidate(self, uri: Optional[str] = None) -> None:
+        """Drop one key (and its decryptors), or the whole cache when `uri` is None."""
+        with self.lock:
+            if uri is None:
+                self.keys.clear()
+                self.decryptions.clear()
+                return
+
+            self.keys.pop(uri, None)
+            for cache_key in [k for k in self.decryptions if k[0] == uri]:
+                del self.decryptions[cache_key]
@@ -5,7 +5,6 @@ import logging
 
 
 # Internal utilities
-from m3u8 import loads
 from StreamingCommunity.Util.os import internet_manager
 
 
@@ -384,6 +383,8 @@ class M3U8_Parser:
         self.segments = []
         self.video_playlist = []
         self.keys = None
+        self.segment_keys = []
+        self.media_sequence = 0
         self.subtitle_playlist = []
         self.subtitle = []
         self.audio_playlist = []
@@ -402,6 +403,7 @@ class M3U8_Parser:
         Parameters:
             - m3u8_content (str): The content of the M3U8 file.
         """
+        from m3u8 import loads    # Only needed to parse a playlist, not for M3U8_Codec
         m3u8_obj = loads(raw_content, uri)
         
         self.__parse_video_info__(m3u8_obj)
@@ -523,15 +525,18 @@ class M3U8_Parser:
         except Exception as e:
             logging.error(f"Error parsing video info: {e}")
 
-    def __parse_encryption_keys__(self, obj) -> None:
+    def __parse_encryption_keys__(self, obj) -> dict:
         """
         Extracts encryption keys either from the M3U8 object or from individual segments.
 
         Parameters:
             - obj: Either the main M3U8 object or an individual segment.
+
+        Returns:
+            dict: The key in effect for `obj` ('method', 'iv', 'uri'), None if it is not encrypted.
         """
         try:
-            if hasattr(obj, 'key') and obj.key is not None:
+            if hasattr(obj, 'key') and obj.key is not None and str(obj.key.method).upper() != "NONE":
                 key_info = {
                     'method': obj.key.method,
                     'iv': obj.key.iv,
@@ -541,6 +546,8 @@ class M3U8_Parser:
                 if self.keys is None:
                     self.keys = key_info
 
+                return key_info
+
                 """
                 elif obj.key.uri not in self.keys:
                     if isinstance(self.keys, dict):
@@ -552,7 +559,8 @@ class M3U8_Parser:
 
         except Exception as e:
             logging.error(f"Error parsing encryption keys: {e}")
-            pass
+
+        return None
 
     def __parse_subtitles_and_audio__(self, m3u8_obj) -> None:
         """
@@ -592,22 +600,26 @@ class M3U8_Parser:
             - m3u8_obj: The M3U8 object containing segment data.
         """
         try:
+            self.media_sequence = getattr(m3u8_obj, 'media_sequence', None) or 0
+
             for segment in m3u8_obj.segments:
 
-                # Parse key
-                self.__parse_encryption_keys__(segment)
+                # Parse key (it can rotate between segments)
+                segment_key = self.__parse_encryption_keys__(segment)
                 
                 # Collect all index duration
                 self.duration += segment.duration
 
                 if "vtt" not in segment.uri:
                     self.segments.append(segment.uri)
+                    self.segment_keys.append(segment_key)
                 else:
                     self.subtitle.append(segment.uri)
             
             # Second check if there is key in main m3u8 obj
             if self.keys is None:
-                self.__parse_encryption_keys__(m3u8_obj)
+                playlist_key = self.__parse_encryption_keys__(m3u8_obj)
+                self.segment_keys = [playlist_key] * len(self.segments)
 
         except Exception as e:
             logging.error(f"Error parsing segments: {e}")
@@ -1,8 +1,10 @@
 # 09.08.25
 from __future__ import annotations
 
-import time
-import random
+import atexit
+import logging
+import threading
+import importlib.util
 from typing import Any, Dict, Optional, Union
 
 
@@ -13,6 +15,11 @@ import httpx
 # Logic class
 from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.headers import get_userAgent
+from StreamingCommunity.Util.retry import RetryPolicy, get_request_budget
+
+
+# Same pool sizing httpx uses when no limits are given
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
 
 # Defaults from config
@@ -53,6 +60,15 @@ def _get_proxies() -> Optional[Dict[str, str]]:
         return None
 
 
+def _resolve_proxy(proxies: Optional[Dict[str, str]]) -> Optional[str]:
+    """httpx takes a single proxy URL: use the 'https' entry of the config dict, or 'http' if that is the only one."""
+    if proxies is None:
+        proxies = _get_proxies()
+    if not proxies:
+        return None
+    return proxies.get("https") or proxies.get("http") or next(iter(proxies.values()))
+
+
 def _default_headers(extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     headers = {"User-Agent": get_userAgent()}
     if extra:
@@ -60,6 +76,14 @@ def _default_headers(extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     return headers
 
 
+def _resolve_http2(http2: bool) -> bool:
+    """HTTP/2 needs the optional 'h2' package, fall back to HTTP/1.1 when it is missing."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        logging.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+        return False
+    return http2
+
+
 def create_client(
     *,
     headers: Optional[Dict[str, str]] = None,
@@ -69,6 +93,7 @@ def create_client(
     proxies: Optional[Dict[str, str]] = None,
     http2: bool = False,
     follow_redirects: bool = True,
+    limits: Optional[httpx.Limits] = None,
 ) -> httpx.Client:
     """Factory for a configured httpx.Client."""
     return httpx.Client(
@@ -77,8 +102,9 @@ def create_client(
         timeout=timeout if timeout is not None else _get_timeout(),
         verify=_get_verify() if verify is None else verify,
         follow_redirects=follow_redirects,
-        http2=http2,
-        proxy=proxies if proxies is not None else _get_proxies(),
+        http2=_resolve_http2(http2),
+        proxy=_resolve_proxy(proxies),
+        limits=limits if limits is not None else _DEFAULT_LIMITS,
     )
 
 
@@ -91,6 +117,7 @@ def create_async_client(
     proxies: Optional[Dict[str, str]] = None,
     http2: bool = False,
     follow_redirects: bool = True,
+    limits: Optional[httpx.Limits] = None,
 ) -> httpx.AsyncClient:
     """Factory for a configured httpx.AsyncClient."""
     return httpx.AsyncClient(
@@ -99,17 +126,46 @@ def create_async_client(
         timeout=timeout if timeout is not None else _get_timeout(),
         verify=_get_verify() if verify is None else verify,
         follow_redirects=follow_redirects,
-        http2=http2,
-        proxies=proxies if proxies is not None else _get_proxies(),
+        http2=_resolve_http2(http2),
+        proxy=_resolve_proxy(proxies),
+        limits=limits if limits is not None else _DEFAULT_LIMITS,
     )
 
 
-def _sleep_with_backoff(attempt: int, base: float = 1.1, cap: float = 10.0) -> None:
-    """Exponential backoff with jitter."""
-    delay = min(base * (2 ** attempt), cap)
-    # Add small jitter to avoid thundering herd
-    delay += random.uniform(0.0, 0.25)
-    time.sleep(delay)
+# Shared pooled clients (one per key, e.g. per CDN host)
+_shared_clients: Dict[str, httpx.Client] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(key: str, **client_kwargs: Any) -> httpx.Client:
+    """
+    Return a long-lived pooled httpx.Client registered under `key`.
+
+    The client is built with `create_client(**client_kwargs)` on first use and then
+    reused by every caller asking for the same key, so keep-alive connections (and
+    HTTP/2 streams) are shared instead of re-handshaking for every request.
+    httpx.Client is thread-safe, so the same instance can serve a worker pool.
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None or client.is_closed:
+            client = create_client(**client_kwargs)
+            _shared_clients[key] = client
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close every shared client and drop its connection pool."""
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logging.error(f"Error closing shared client: {e}")
+        _shared_clients.clear()
+
+
+atexit.register(close_shared_clients)
 
 
 def fetch(
@@ -144,16 +200,16 @@ def fetch(
         http2=http2,
         follow_redirects=follow_redirects,
     ) as client:
-        for attempt in range(attempts):
-            try:
-                resp = client.request(method, url, params=params, data=data, json=json)
-                resp.raise_for_status()
-                return resp.content if return_content else resp.text
-            except Exception:
-                if attempt + 1 >= attempts:
-                    break
-                _sleep_with_backoff(attempt)
-        return None
+        def _request():
+            resp = client.request(method, url, params=params, data=data, json=json)
+            resp.raise_for_status()
+            return resp.content if return_content else resp.text
+
+        try:
+            return RetryPolicy(attempts, budget=get_request_budget()).call(_request)
+        except Exception as e:
+            logging.error(f"Request to {url} failed: {e}")
+            return None
 
 
 async def async_fetch(
@@ -188,14 +244,14 @@ async def async_fetch(
         http2=http2,
         follow_redirects=follow_redirects,
     ) as client:
-        for attempt in range(attempts):
-            try:
-                resp = await client.request(method, url, params=params, data=data, json=json)
-                resp.raise_for_status()
-                return resp.content if return_content else resp.text
-            except Exception:
-                if attempt + 1 >= attempts:
-                    break
-                # Use same backoff logic for async by sleeping in thread (short duration)
-                _sleep_with_backoff(attempt)
-        return None
\ No newline at end of file
+        async def _request():
+            resp = await client.request(method, url, params=params, data=data, json=json)
+            resp.raise_for_status()
+            return resp.content if return_content else resp.text
+
+        # Backoff waits with asyncio.sleep, other requests on the loop keep running
+        try:
+            return await RetryPolicy(attempts, budget=get_request_budget()).acall(_request)
+        except Exception as e:
+            logging.error(f"Request to {url} failed: {e}")
+            return None
@@ -0,0 +1,105 @@
+# 18.10.26
+
+import sys
+import logging
+import argparse
+import subprocess
+from typing import List, Tuple
+
+
+# External library
+from rich.console import Console
+from rich.table import Table
+
+
+# Variable
+console = Console()
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse the report written on stderr by 'python -X importtime'.
+
+    Parameters:
+        - output (str): The stderr of the profiled interpreter.
+
+    Returns:
+        list: (module, self_us, cumulative_us) for every imported module, in import order.
+    """
+    entries = []
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue    # Header line
+
+        entries.append((parts[2].strip(), self_us, cumulative_us))
+
+    return entries
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import `module` in a fresh interpreter with '-X importtime' and return the parsed report.
+
+    Parameters:
+        - module (str): Dotted name of the module to import.
+
+    Returns:
+        list: (module, self_us, cumulative_us) for every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        logging.error(f"Import of {module} failed: {result.stderr.strip().splitlines()[-1:]}")
+
+    return parse_importtime(result.stderr)
+
+
+def print_import_profile(module: str = 'StreamingCommunity.run', top: int = 25) -> None:
+    """
+    Print the modules that take the most time to import when loading `module`,
+    ordered by cumulative time (the module itself plus everything it imports).
+
+    Parameters:
+        - module (str): Dotted name of the module to profile.
+        - top (int): Number of rows to show.
+    """
+    entries = profile_imports(module)
+    if not entries:
+        console.print(f"[red]No import data for {module}")
+        return
+
+    total_us = sum(self_us for _, self_us, _ in entries)
+
+    table = Table(title=f"Import time of {module}", border_style="white")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right", style="yellow")
+
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: e[2], reverse=True)[:top]:
+        table.add_row(name, f"{self_us / 1000:.1f}", f"{cumulative_us / 1000:.1f}")
+
+    console.print(table)
+    console.print(f"[green]Total: [yellow]{total_us / 1000:.1f} ms[green] for [yellow]{len(entries)}[green] modules")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Report the slowest imports of a module (python -X importtime).')
+    parser.add_argument('module', nargs='?', default='StreamingCommunity.run', help='Module to profile')
+    parser.add_argument('--top', type=int, default=25, help='Number of modules to show')
+    args = parser.parse_args()
+
+    print_import_profile(args.module, args.top)
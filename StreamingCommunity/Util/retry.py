@@ -0,0 +1,184 @@
+# 18.10.26
+
+import time
+import random
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+
+# External library
+import httpx
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the successful requests, so a failing server is not hit
+    with a storm of retries from every worker at once.
+
+    Every success deposits `ratio` tokens (up to `max_tokens`), every retry withdraws one;
+    the bucket starts full so the first failures can always be retried.
+    """
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 20):
+        """
+        Parameters:
+            - ratio (float): Tokens earned by each successful request.
+            - max_tokens (float): Size of the bucket (retries allowed in a burst).
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self.lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take one token, return False when the budget is exhausted."""
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def parse_retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    """
+    Seconds to wait from a 'Retry-After' header (delay in seconds or HTTP date), None if missing.
+    """
+    if response is None:
+        return None
+
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, 'Retry-After' support and an optional retry budget.
+
+    The same policy drives blocking loops (`call`, `sleep`) and coroutines (`acall`, `asleep`),
+    where the wait never blocks the event loop.
+    """
+    def __init__(self, max_attempts: int, base: float = 1.1, cap: float = 10.0, jitter: float = 0.25,
+                 max_retry_after: float = 60.0, budget: Optional[RetryBudget] = None):
+        """
+        Parameters:
+            - max_attempts (int): Total attempts, first one included.
+            - base (float): Delay before the first retry, doubled on every attempt.
+            - cap (float): Max backoff delay in seconds.
+            - jitter (float): Random extra delay, as a fraction of the backoff.
+            - max_retry_after (float): Max seconds honored from a 'Retry-After' header.
+            - budget (RetryBudget): Shared budget limiting retries, None for no limit.
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+    def get_delay(self, attempt: int, error: Optional[BaseException] = None, response: Optional[httpx.Response] = None) -> float:
+        """
+        Seconds to wait before retrying after failed attempt number `attempt` (0-based).
+        A 'Retry-After' header on the response (or on the HTTPStatusError) takes precedence.
+        """
+        if response is None and isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+
+        retry_after = parse_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        delay = min(self.base * (2 ** attempt), self.cap)
+        return delay + random.uniform(0.0, delay * self.jitter)
+
+    def should_retry(self, attempt: int) -> bool:
+        """True if failed attempt `attempt` (0-based) may be retried under the attempts limit and the budget."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+
+        if self.budget is not None and not self.budget.withdraw():
+            logging.warning("Retry budget exhausted, giving up")
+            return False
+
+        return True
+
+    def record_success(self) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def sleep(self, attempt: int, error: Optional[BaseException] = None, response: Optional[httpx.Response] = None,
+              stop_event: Optional[threading.Event] = None) -> None:
+        """Wait before the next attempt; returns early if `stop_event` is set."""
+        delay = self.get_delay(attempt, error, response)
+        if stop_event is not None:
+            stop_event.wait(delay)
+        else:
+            time.sleep(delay)
+
+    async def asleep(self, attempt: int, error: Optional[BaseException] = None, response: Optional[httpx.Response] = None) -> None:
+        """Wait before the next attempt without blocking the event loop."""
+        await asyncio.sleep(self.get_delay(attempt, error, response))
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` until it returns without raising, retrying with backoff.
+        Re-raises the last error when no attempt is left.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = fn()
+                self.record_success()
+                return result
+
+            except Exception as e:
+                if not self.should_retry(attempt):
+                    raise
+                logging.info(f"Attempt {attempt + 1} failed: {e}")
+                self.sleep(attempt, e)
+                attempt += 1
+
+    async def acall(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of `call`, `fn` returns a new coroutine on every call."""
+        attempt = 0
+        while True:
+            try:
+                result = await fn()
+                self.record_success()
+                return result
+
+            except Exception as e:
+                if not self.should_retry(attempt):
+                    raise
+                logging.info(f"Attempt {attempt + 1} failed: {e}")
+                await self.asleep(attempt, e)
+                attempt += 1
+
+
+# Budget shared by the generic request helpers (fetch, async_fetch, HLSClient)
+_request_budget = RetryBudget()
+
+
+def get_request_budget() -> RetryBudget:
+    """Return the process-wide retry budget for page, playlist and key requests."""
+    return _request_budget
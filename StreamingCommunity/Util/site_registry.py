@@ -0,0 +1,131 @@
+# 18.10.26
+
+import os
+import sys
+import ast
+import glob
+import logging
+import importlib
+import threading
+from typing import Any, Dict, List, Optional
+
+
+# Variable
+SITE_PACKAGE = "StreamingCommunity.Api.Site"
+_METADATA_FIELDS = {
+    'indice': 'indice',
+    '_useFor': 'use_for',
+    '_priority': 'priority',
+    '_engineDownload': 'engine',
+    '_deprecate': 'deprecate',
+}
+_registry: Optional[List[Dict[str, Any]]] = None
+_registry_lock = threading.Lock()
+
+
+def get_site_dir() -> str:
+    """Folder containing one package per site (inside the PyInstaller bundle when frozen)."""
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.join(sys._MEIPASS, "StreamingCommunity")
+    else:
+        base_path = os.path.dirname(os.path.dirname(__file__))
+
+    return os.path.join(base_path, 'Api', 'Site')
+
+
+def _read_metadata(init_file: str) -> Dict[str, Any]:
+    """
+    Read the module-level constants (indice, _useFor, ...) of a site __init__.py
+    from its syntax tree, without importing the site and its dependencies.
+    """
+    with open(init_file, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=init_file)
+
+    metadata = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+            continue
+
+        field = _METADATA_FIELDS.get(node.targets[0].id)
+        if field is None:
+            continue
+
+        try:
+            metadata[field] = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError):
+            pass
+
+    return metadata
+
+
+def _read_metadata_from_module(module_name: str) -> Dict[str, Any]:
+    """Fallback for a site whose constants are not plain literals: import it and read the attributes."""
+    mod = importlib.import_module(f'{SITE_PACKAGE}.{module_name}')
+    return {field: getattr(mod, attr) for attr, field in _METADATA_FIELDS.items() if hasattr(mod, attr)}
+
+
+def _build_registry() -> List[Dict[str, Any]]:
+    sites = []
+
+    for init_file in glob.glob(os.path.join(get_site_dir(), '*', '__init__.py')):
+        module_name = os.path.basename(os.path.dirname(init_file))
+
+        try:
+            metadata = _read_metadata(init_file)
+            if 'indice' not in metadata or 'use_for' not in metadata:
+                metadata = _read_metadata_from_module(module_name)
+
+        except Exception as e:
+            logging.error(f"Failed to read site {module_name}: {e}")
+            continue
+
+        sites.append({
+            'name': module_name,
+            'indice': metadata.get('indice', 0),
+            'use_for': metadata.get('use_for', 'other'),
+            'priority': metadata.get('priority', 0),
+            'engine': metadata.get('engine'),
+            'deprecate': metadata.get('deprecate', False),
+        })
+
+    sites.sort(key=lambda site: site['indice'])
+    return sites
+
+
+def get_site_registry() -> List[Dict[str, Any]]:
+    """
+    Return every site (name, indice, use_for, priority, engine, deprecate) sorted by indice.
+    Built once per process from the site __init__.py files, no site module is imported.
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = _build_registry()
+            logging.info(f"Site registry: {[site['name'] for site in _registry]}")
+
+        return _registry
+
+
+class LazySearchFunction:
+    """
+    Stand-in for a site's `search` function that imports the site package only when first called,
+    so listing the sites in the menu does not load every site and its dependencies.
+    """
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self._function = None
+
+    def load(self):
+        """Import the site and return its real `search` function."""
+        if self._function is None:
+            mod = importlib.import_module(f'{SITE_PACKAGE}.{self.module_name}')
+            self._function = getattr(mod, 'search')
+
+        return self._function
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazySearchFunction {self.module_name}>"
@@ -1,10 +1,17 @@
 # 11.03.25
 
-from .run import main
-from .Lib.Downloader.HLS.downloader import HLS_Downloader
-from .Lib.Downloader.MP4.downloader import MP4_downloader
-from .Lib.Downloader.TOR.downloader import TOR_downloader
-from .Lib.Downloader.DASH.downloader import DASH_Downloader
+import importlib
+
+
+# Exported name -> module defining it, imported on first access so `import StreamingCommunity`
+# (and the console entry point) does not load every downloader and its dependencies
+_LAZY_EXPORTS = {
+    "main": ".run",
+    "HLS_Downloader": ".Lib.Downloader.HLS.downloader",
+    "MP4_downloader": ".Lib.Downloader.MP4.downloader",
+    "TOR_downloader": ".Lib.Downloader.TOR.downloader",
+    "DASH_Downloader": ".Lib.Downloader.DASH.downloader",
+}
 
 __all__ = [
     "main",
@@ -12,4 +19,18 @@ __all__ = [
     "MP4_downloader",
     "TOR_downloader",
     "DASH_Downloader"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,11 +1,9 @@
 # 17.03.25
 
-import os
-import sys
 import time
-import glob
+import queue
 import logging
-import importlib
+import threading
 
 
 # External library
@@ -17,6 +15,13 @@ from rich.progress import Progress
 
 # Internal utilities
 from StreamingCommunity.Util.message import start_message
+from StreamingCommunity.Util.config_json import config_manager
+from StreamingCommunity.Util.site_registry import get_site_registry, LazySearchFunction
+
+
+# Config
+SEARCH_TIMEOUT = config_manager.get_int('DEFAULT', 'global_search_timeout')
+SEARCH_WORKERS = config_manager.get_int('DEFAULT', 'global_search_workers')
 
 
 # Variable
@@ -24,73 +29,143 @@ console = Console()
 msg = Prompt()
 
 
-# !!! DA METTERE IN COMUNE CON QUELLA DI RUN
 def load_search_functions():
-    modules = []
+    """
+    Return the search function of every non deprecated, priority 0 site, sorted by index.
+    Sites come from the shared registry and are imported only when searched.
+    """
     loaded_functions = {}
-    excluded_sites = set()
 
-    # Find api home directory
-    if getattr(sys, 'frozen', False):  # Modalità PyInstaller
-        base_path = os.path.join(sys._MEIPASS, "StreamingCommunity")
-    else:
-        base_path = os.path.dirname(__file__)
+    for site in get_site_registry():
+        if site['priority'] != 0 or site['deprecate']:
+            continue
 
-    api_dir = os.path.join(base_path, 'Api', 'Site')
-    init_files = glob.glob(os.path.join(api_dir, '*', '__init__.py'))
+        logging.info(f"Load module name: {site['name']}")
+        loaded_functions[f"{site['name']}_search"] = (LazySearchFunction(site['name']), site['use_for'])
 
-    # Retrieve modules and their indices
-    for init_file in init_files:
+    return loaded_functions
 
-        # Get folder name as module name
-        module_name = os.path.basename(os.path.dirname(init_file))
 
-        # Se il modulo è nella lista da escludere, saltalo
-        if module_name in excluded_sites:
-            continue
+def search_site(func, alias: str, search_terms: str) -> list:
+    """
+    Run one site's search and return its results as dicts tagged with the source site.
 
-        logging.info(f"Load module name: {module_name}")
+    Parameters:
+        func (callable): The site's search function.
+        alias (str): Site alias, e.g. 'streamingcommunity_search'.
+        search_terms (str): The terms to search for.
 
-        try:
-            # Dynamically import the module
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
+    Returns:
+        list: One dict per media item, empty if nothing was found.
+    """
+    site_name = alias.split("_")[0].capitalize()
 
-            # Get 'indice' from the module
-            indice = getattr(mod, 'indice', 0)
-            use_for = getattr(mod, '_useFor', 'other')
-            priority = getattr(mod, '_priority', 0)
+    # Call the search function with get_onlyDatabase=True to get database object
+    database = func(search_terms, get_onlyDatabase=True)
+    if not database or not hasattr(database, 'media_list'):
+        return []
 
-            if priority == 0:
-                if not getattr(mod, '_deprecate'):
-                    modules.append((module_name, indice, use_for))
+    results = []
+    for element in database.media_list:
 
-        except Exception as e:
-            console.print(f"[red]Failed to import module {module_name}: {str(e)}")
+        # Convert element to dictionary if it's an object
+        item_dict = element.__dict__.copy() if hasattr(element, '__dict__') else {}
 
-    # Sort modules by 'indice'
-    modules.sort(key=lambda x: x[1])
+        # Add source information
+        item_dict['source'] = site_name
+        item_dict['source_alias'] = alias
+        results.append(item_dict)
 
-    # Load search functions in the sorted order
-    for module_name, _, use_for in modules:
+    return results
 
-        # Construct a unique alias for the module
-        module_alias = f'{module_name}_search'
 
+def _search_worker(jobs: queue.Queue, done: queue.Queue, search_terms: str, stop: threading.Event) -> None:
+    """Search the sites queued in `jobs` until it is empty or `stop` is set, putting (alias, results, error) on `done`."""
+    while not stop.is_set():
         try:
+            alias, func = jobs.get_nowait()
+        except queue.Empty:
+            return
 
-            # Dynamically import the module
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
+        try:
+            done.put((alias, search_site(func, alias, search_terms), None))
+        except Exception as e:
+            done.put((alias, None, e))
 
-            # Get the search function from the module (assuming the function is named 'search' and defined in __init__.py)
-            search_function = getattr(mod, 'search')
 
-            # Add the function to the loaded functions dictionary
-            loaded_functions[module_alias] = (search_function, use_for)
+def search_sites(search_functions: dict, selected_sites: list, search_terms: str) -> dict:
+    """
+    Query the selected sites concurrently, printing each site's results as soon as they arrive.
 
+    Every site gets the same deadline (SEARCH_TIMEOUT seconds from the start), so the whole search
+    takes as long as the slowest site that answers in time. Sites still running at the deadline are
+    reported and their results discarded; sites not started yet are skipped.
+
+    The searches run in daemon threads: a site that hangs keeps its thread until its own request
+    timeout, but never delays the menu or the exit of the program. Such a late search still
+    completes in the background, so it may refill that site's results list and the search cache.
+
+    Parameters:
+        search_functions (dict): Search function and category of every site, by alias.
+        selected_sites (list): Aliases of the sites to search.
+        search_terms (str): The terms to search for.
+
+    Returns:
+        dict: Results of every site that answered, by alias, in the order of `selected_sites`.
+    """
+    results_by_alias = {}
+
+    # Import the site modules here, one at a time, so the workers only do network I/O
+    funcs = {}
+    for alias in selected_sites:
+        func, _ = search_functions[alias]
+        try:
+            funcs[alias] = func.load() if isinstance(func, LazySearchFunction) else func
         except Exception as e:
-            console.print(f"[red]Failed to load search function from module {module_name}: {str(e)}")
+            console.print(f"[bold red]Error loading {alias.split('_')[0].capitalize()}:[/bold red] {str(e)}")
+
+    if not funcs:
+        return {}
+
+    jobs, done, stop = queue.Queue(), queue.Queue(), threading.Event()
+    for alias, func in funcs.items():
+        jobs.put((alias, func))
+
+    for _ in range(max(1, min(SEARCH_WORKERS, len(funcs)))):
+        threading.Thread(target=_search_worker, args=(jobs, done, search_terms, stop), name="global-search", daemon=True).start()
+
+    deadline = time.time() + SEARCH_TIMEOUT
+    pending = set(funcs)
+
+    with Progress() as progress:
+        search_task = progress.add_task(f"[cyan]Searching {len(funcs)} sites...", total=len(funcs))
+
+        while pending:
+            try:
+                alias, results, error = done.get(timeout=max(0, deadline - time.time()))
+            except queue.Empty:
+                break
+
+            pending.discard(alias)
+            site_name = alias.split("_")[0].capitalize()
+
+            if error is not None:
+                progress.console.print(f"[bold red]Error searching {site_name}:[/bold red] {str(error)}")
+
+            elif results:
+                results_by_alias[alias] = results
+                progress.console.print(f"[green]Found {len(results)} results from {site_name}")
+
+            progress.update(search_task, advance=1)
+
+        if pending:
+            stop.set()
+            skipped = [alias.split("_")[0].capitalize() for alias in funcs if alias in pending]
+            logging.warning(f"Global search timeout after {SEARCH_TIMEOUT}s, skipping: {skipped}")
+            progress.console.print(f"[yellow]No answer within {SEARCH_TIMEOUT}s from: {', '.join(skipped)}")
+
+    return {alias: results_by_alias[alias] for alias in selected_sites if alias in results_by_alias}
 
-    return loaded_functions
 
 def global_search(search_terms: str = None, selected_sites: list = None):
     """
@@ -104,7 +179,6 @@ def global_search(search_terms: str = None, selected_sites: list = None):
         dict: Consolidated search results from all searched sites.
     """
     search_functions = load_search_functions()
-    all_results = {}
     
     if search_terms is None:
         search_terms = msg.ask("\n[purple]Enter search terms for global search: ").strip()
@@ -159,42 +233,8 @@ def global_search(search_terms: str = None, selected_sites: list = None):
     console.print(f"\n[bold green]Searching for:[/bold green] [yellow]{search_terms}[/yellow]")
     console.print(f"[bold green]Searching across:[/bold green] {len(selected_sites)} sites \n")
     
-    with Progress() as progress:
-        search_task = progress.add_task("[cyan]Searching...", total=len(selected_sites))
-        
-        # Search each selected site
-        for alias in selected_sites:
-            site_name = alias.split("_")[0].capitalize()
-            progress.update(search_task, description=f"[cyan]Searching {site_name}...")
-            
-            func, _ = search_functions[alias]
-            try:
-                # Call the search function with get_onlyDatabase=True to get database object
-                database = func(search_terms, get_onlyDatabase=True)
-                
-                # Check if database has media_list attribute and it's not empty
-                if database and hasattr(database, 'media_list') and len(database.media_list) > 0:
-                    # Store media_list items with additional source information
-                    all_results[alias] = []
-                    for element in database.media_list:
-                        # Convert element to dictionary if it's an object
-                        if hasattr(element, '__dict__'):
-                            item_dict = element.__dict__.copy()
-                        else:
-                            item_dict = {}  # Fallback for non-object items
-                        
-                        # Add source information
-                        item_dict['source'] = site_name
-                        item_dict['source_alias'] = alias
-                        all_results[alias].append(item_dict)
-                        
-                    console.print(f"\n[green]Found {len(database.media_list)} results from {site_name}")
-
-            except Exception as e:
-                console.print(f"[bold red]Error searching {site_name}:[/bold red] {str(e)}")
-            
-            progress.update(search_task, advance=1)
-    
+    all_results = search_sites(search_functions, selected_sites, search_terms)
+
     # Display the consolidated results
     if all_results:
         all_media_items = []
@@ -3,11 +3,9 @@
 import os
 import sys
 import time
-import glob
 import logging
 import platform
 import argparse
-import importlib
 import threading
 import asyncio
 import subprocess
@@ -26,9 +24,8 @@ from StreamingCommunity.Util.message import start_message
 from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Util.os import os_summary, internet_manager, os_manager
 from StreamingCommunity.Util.logger import Logger
-from StreamingCommunity.Lib.TMBD import tmdb
-from StreamingCommunity.Upload.update import update as git_update
-from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance, TelegramSession
+from StreamingCommunity.Util.site_registry import get_site_registry, LazySearchFunction
+from StreamingCommunity.Util.import_profile import print_import_profile
 
 
 # Config
@@ -49,6 +46,12 @@ console = Console()
 msg = Prompt()
 
 
+def get_bot_instance():
+    """Return the Telegram bot, importing pyTelegramBotAPI only when the bot is enabled and used."""
+    from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance as _get_bot_instance
+    return _get_bot_instance()
+
+
 def run_function(func: Callable[..., None], close_console: bool = False, search_terms: str = None) -> None:
     """Run function once or indefinitely based on close_console flag."""
     if close_console:
@@ -59,37 +62,19 @@ def run_function(func: Callable[..., None], close_console: bool = False, search_
 
 
 def load_search_functions() -> Dict[str, Tuple]:
-    """Load and return all available search functions from site modules."""
+    """
+    Return the search function of every available site, sorted by index.
+    Sites come from the registry and are imported only when their search function is first called.
+    """
     loaded_functions = {}
     excluded_sites = {"cb01new", "guardaserie", "ilcorsaronero", "mostraguarda"} if TELEGRAM_BOT else set()
-    
-    # Determine base path
-    base_path = os.path.join(sys._MEIPASS, "StreamingCommunity") if getattr(sys, 'frozen', False) else os.path.dirname(__file__)
-    api_dir = os.path.join(base_path, 'Api', 'Site')
-    
-    # Get all modules with their indices and sort them
-    modules = []
-    for init_file in glob.glob(os.path.join(api_dir, '*', '__init__.py')):
-        module_name = os.path.basename(os.path.dirname(init_file))
-        
-        if module_name in excluded_sites:
+
+    for site in get_site_registry():
+        if site['name'] in excluded_sites or site['deprecate']:
             continue
-            
-        try:
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
-            if not getattr(mod, '_deprecate', False):
-                modules.append((module_name, getattr(mod, 'indice'), getattr(mod, '_useFor')))
-                logging.info(f"Load module name: {module_name}")
-        except Exception as e:
-            console.print(f"[red]Failed to import module {module_name}: {str(e)}")
-    
-    # Sort by index and load search functions
-    for module_name, _, use_for in sorted(modules, key=lambda x: x[1]):
-        try:
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
-            loaded_functions[f'{module_name}_search'] = (getattr(mod, 'search'), use_for)
-        except Exception as e:
-            console.print(f"[red]Failed to load search function from module {module_name}: {str(e)}")
+
+        logging.info(f"Load module name: {site['name']}")
+        loaded_functions[f"{site['name']}_search"] = (LazySearchFunction(site['name']), site['use_for'])
     
     return loaded_functions
 
@@ -110,12 +95,15 @@ def initialize():
     
     # Show trending content
     if SHOW_TRENDING:
+        from StreamingCommunity.Lib.TMBD import tmdb
+
         print()
         tmdb.display_trending_films()
         tmdb.display_trending_tv_shows()
     
     # Attempt GitHub update
     try:
+        from StreamingCommunity.Upload.update import update as git_update
         git_update()
     except Exception as e:
         console.log(f"[red]Error with loading github: {str(e)}")
@@ -341,14 +329,12 @@ def check_dns_and_exit_if_needed():
 def setup_argument_parser(search_functions):
     """Setup and return configured argument parser."""
     # Build help text
+    site_indices = {site['name']: site['indice'] for site in get_site_registry()}
     module_info = {}
     for alias, (_func, _use_for) in search_functions.items():
         module_name = alias.split("_")[0].lower()
-        try:
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
-            module_info[module_name] = int(getattr(mod, 'indice'))
-        except Exception:
-            continue
+        if module_name in site_indices:
+            module_info[module_name] = int(site_indices[module_name])
     
     available_names = ", ".join(sorted(module_info.keys()))
     available_indices = ", ".join([f"{idx}={name.capitalize()}" for name, idx in sorted(module_info.items(), key=lambda x: x[1])])
@@ -372,6 +358,7 @@ def setup_argument_parser(search_functions):
     parser.add_argument('-s', '--search', default=None, help='Search terms')
     parser.add_argument('--auto-first', action='store_true', help='Auto-download first result (use with --site and --search)')
     parser.add_argument('--site', type=str, help='Site by name or index')
+    parser.add_argument('--profile-imports', action='store_true', help='Print the slowest modules imported at startup and exit')
     
     return parser
 
@@ -412,16 +399,18 @@ def build_function_mappings(search_functions):
     choice_labels = {}
     module_name_to_function = {}
     
+    site_indices = {site['name']: site['indice'] for site in get_site_registry()}
+
     for alias, (func, use_for) in search_functions.items():
         module_name = alias.split("_")[0]
-        try:
-            mod = importlib.import_module(f'StreamingCommunity.Api.Site.{module_name}')
-            site_index = str(getattr(mod, 'indice'))
-            input_to_function[site_index] = func
-            choice_labels[site_index] = (module_name.capitalize(), use_for.lower())
-            module_name_to_function[module_name.lower()] = func
-        except Exception as e:
-            console.print(f"[red]Error mapping module {module_name}: {str(e)}")
+        if module_name not in site_indices:
+            console.print(f"[red]Error mapping module {module_name}: not in the site registry")
+            continue
+
+        site_index = str(site_indices[module_name])
+        input_to_function[site_index] = func
+        choice_labels[site_index] = (module_name.capitalize(), use_for.lower())
+        module_name_to_function[module_name.lower()] = func
     
     return input_to_function, choice_labels, module_name_to_function
 
@@ -499,6 +488,10 @@ def get_user_site_selection(args, choice_labels):
 
 
 def main(script_id=0):
+    if '--profile-imports' in sys.argv[1:]:
+        print_import_profile(__name__)
+        return
+
     if TELEGRAM_BOT:
         get_bot_instance().send_message(f"Avviato script {script_id}", None)
 
@@ -541,6 +534,8 @@ def main(script_id=0):
             else:
                 force_exit()
                 if TELEGRAM_BOT:
+                    from StreamingCommunity.TelegramHelp.telegram_bot import TelegramSession
+
                     get_bot_instance().send_message("Chiusura in corso", None)
                     script_id = TelegramSession.get_session()
                     if script_id != "unknown":
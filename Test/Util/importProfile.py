@@ -0,0 +1,39 @@
+import os
+import sys
+import subprocess
+import unittest
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.Util.import_profile import parse_importtime
+
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3400 |      15200 |   rich.console
+import time:       800 |      16000 | StreamingCommunity.run
+"""
+
+
+class TestImportProfile(unittest.TestCase):
+    def test_parse_importtime(self):
+        entries = parse_importtime(SAMPLE)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(entries[1], ("rich.console", 3400, 15200))
+        self.assertEqual(entries[-1][0], "StreamingCommunity.run")
+
+    def test_package_import_is_lazy(self):
+        code = (
+            "import sys, StreamingCommunity; "
+            "print(any(m.startswith('StreamingCommunity.Lib.Downloader.') for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=src_path)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
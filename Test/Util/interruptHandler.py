@@ -0,0 +1,91 @@
+import os
+import sys
+import signal
+import tempfile
+import unittest
+from unittest import mock
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.Lib.Downloader import scheduler
+from StreamingCommunity.Lib.Downloader.HLS.segments import M3U8_Segments, M3U8_Segments_Async
+
+
+SEGMENTS = ["https://cdn.example/seg/0.ts", "https://cdn.example/seg/1.ts", "https://cdn.example/seg/2.ts"]
+
+
+def original_handler(signum, frame):
+    pass
+
+
+class TestInterruptHandlerRestore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saved_handler = signal.signal(signal.SIGINT, original_handler)
+
+    def tearDown(self):
+        signal.signal(signal.SIGINT, self.saved_handler)
+        self.tmp.cleanup()
+
+    def _new_downloader(self, segments_class, tmp_folder=None):
+        downloader = segments_class(url=SEGMENTS[0], tmp_folder=tmp_folder or self.tmp.name, is_index_url=False)
+        downloader.segments = list(SEGMENTS)
+        return downloader
+
+    def test_threaded_download_restores_handler(self):
+        downloader = self._new_downloader(M3U8_Segments)
+
+        def fake_download(ts_url, index, progress_bar):
+            self.assertIsNot(signal.getsignal(signal.SIGINT), original_handler)
+            downloader._finish_segment(index, b"ts", 2, progress_bar)
+
+        with mock.patch.object(downloader, '_get_http_client', return_value=None), \
+                mock.patch.object(downloader, 'download_segment', side_effect=fake_download):
+            result = downloader.download_streams("Video", "video")
+
+        self.assertFalse(result['stopped'])
+        self.assertIs(signal.getsignal(signal.SIGINT), original_handler)
+
+    def _run_async_download(self, tmp_folder):
+        downloader = self._new_downloader(M3U8_Segments_Async, tmp_folder)
+
+        async def fake_fetch(client, ts_url, index, progress_bar):
+            self.assertIsNot(signal.getsignal(signal.SIGINT), original_handler)
+            downloader.downloaded_segments.add(index)
+            return b"ts"
+
+        with mock.patch.object(downloader, '_fetch_segment', side_effect=fake_fetch):
+            return downloader.download_streams("Video", "video")
+
+    def test_async_download_restores_handler(self):
+        result = self._run_async_download(self.tmp.name)
+
+        self.assertFalse(result['stopped'])
+        self.assertIs(signal.getsignal(signal.SIGINT), original_handler)
+
+    def test_failed_download_restores_handler(self):
+        downloader = self._new_downloader(M3U8_Segments_Async)
+
+        with mock.patch.object(downloader, '_download_all', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                downloader.download_streams("Video", "video")
+
+        self.assertIs(signal.getsignal(signal.SIGINT), original_handler)
+
+    def test_episodes_after_download_keep_handler(self):
+        def download_episode(i_episode):
+            result = self._run_async_download(os.path.join(self.tmp.name, str(i_episode)))
+            return "", result['stopped']
+
+        with mock.patch.object(scheduler, 'MAX_PARALLEL_EPISODES', 1):
+            scheduler.download_episodes([0, 1], download_episode)
+
+        self.assertIs(signal.getsignal(signal.SIGINT), original_handler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,9 +23,10 @@ class TestLoadSearchFunctions(unittest.TestCase):
             # Verify that at least some modules were loaded
             self.assertTrue(len(loaded_functions) > 0, "No modules were loaded")
             
-            # Print successfully loaded modules
+            # Import every site (search functions are loaded lazily) and print them
             print("\nSuccessfully loaded modules:")
-            for module_name, (_, use_for) in loaded_functions.items():
+            for module_name, (search_function, use_for) in loaded_functions.items():
+                self.assertTrue(callable(search_function.load()), f"{module_name} has no search function")
                 print(f"- {module_name} (type: {use_for})")
             
             print(f"\nTotal modules loaded: {len(loaded_functions)}")
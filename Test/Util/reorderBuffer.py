@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import unittest
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.Lib.Downloader.reorder import SegmentReorderBuffer
+
+
+class TestSegmentReorderBuffer(unittest.TestCase):
+    def test_writes_in_order(self):
+        buffer = SegmentReorderBuffer(max_segments=10, max_bytes=1024)
+        buffer.put(1, b"b")
+        buffer.put(2, b"c")
+        self.assertEqual(buffer.pop_ready(), [])
+
+        buffer.put(0, b"a")
+        self.assertEqual(buffer.pop_ready(), [(0, b"a"), (1, b"b"), (2, b"c")])
+        self.assertEqual(buffer.expected_index, 3)
+
+    def test_failed_segment_is_skipped(self):
+        buffer = SegmentReorderBuffer(max_segments=10, max_bytes=1024)
+        buffer.put(1, b"b")
+        buffer.put(0, None)
+        self.assertEqual(buffer.pop_ready(), [(0, None), (1, b"b")])
+
+    def test_window_blocks_scheduling(self):
+        buffer = SegmentReorderBuffer(max_segments=3, max_bytes=1024)
+        self.assertTrue(buffer.has_space(2))
+        self.assertFalse(buffer.has_space(3))
+
+        buffer.put(0, b"a")
+        buffer.pop_ready()
+        self.assertTrue(buffer.has_space(3))
+
+    def test_byte_cap_blocks_without_spill(self):
+        buffer = SegmentReorderBuffer(max_segments=100, max_bytes=4)
+        buffer.put(1, b"1234")
+        self.assertFalse(buffer.has_space(2))
+        self.assertTrue(buffer.has_space(0))
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = SegmentReorderBuffer(max_segments=100, max_bytes=4, spill_dir=tmp)
+            buffer.put(1, b"1234")
+            buffer.put(2, b"5678")
+            self.assertTrue(buffer.has_space(3))
+            self.assertEqual(buffer.n_spilled, 1)
+            self.assertLessEqual(buffer.peak_bytes, 4)
+
+            buffer.put(0, b"0")
+            self.assertEqual(buffer.pop_ready(), [(0, b"0"), (1, b"1234"), (2, b"5678")])
+
+            buffer.close()
+            self.assertFalse(os.path.exists(os.path.join(tmp, "reorder.spill")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import asyncio
+import unittest
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+import httpx
+from StreamingCommunity.Util.retry import RetryBudget, RetryPolicy
+
+
+def _status_error(status_code, headers=None):
+    request = httpx.Request("GET", "https://cdn/segment.ts")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(5, base=1.0, cap=4.0, jitter=0.25)
+        self.assertTrue(1.0 <= policy.get_delay(0) <= 1.25)
+        self.assertTrue(4.0 <= policy.get_delay(10) <= 5.0)
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(5, max_retry_after=30)
+        self.assertEqual(policy.get_delay(0, _status_error(429, {'Retry-After': '7'})), 7.0)
+        self.assertEqual(policy.get_delay(0, _status_error(503, {'Retry-After': '600'})), 30)
+
+    def test_call_retries_until_success(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _status_error(500)
+            return "ok"
+
+        policy = RetryPolicy(3, base=0.001, cap=0.001)
+        self.assertEqual(policy.call(flaky), "ok")
+        self.assertEqual(len(calls), 3)
+
+    def test_acall_raises_after_last_attempt(self):
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise _status_error(502)
+
+        policy = RetryPolicy(2, base=0.001, cap=0.001)
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(policy.acall(failing))
+        self.assertEqual(len(calls), 2)
+
+    def test_budget_stops_retries(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+        policy = RetryPolicy(10, budget=budget)
+
+        self.assertTrue(policy.should_retry(0))
+        self.assertFalse(policy.should_retry(1))
+
+        policy.record_success()
+        policy.record_success()
+        self.assertTrue(policy.should_retry(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
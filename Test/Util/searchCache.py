@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.Api.Template.search_cache import SearchCache
+
+
+ITEMS = [{'id': 1, 'name': 'Interstellar', 'type': 'movie'}]
+
+
+class TestSearchCache(unittest.TestCase):
+    def test_query_is_normalized(self):
+        cache = SearchCache(ttl=60)
+        cache.set("site", "Interstellar ", "https://site.tv", ITEMS)
+        self.assertEqual(cache.get("site", "  interstellar", "https://site.tv"), ITEMS)
+        self.assertIsNone(cache.get("other", "interstellar", "https://site.tv"))
+
+    def test_domain_change_invalidates(self):
+        cache = SearchCache(ttl=60)
+        cache.set("site", "interstellar", "https://site.tv", ITEMS)
+        self.assertIsNone(cache.get("site", "interstellar", "https://site.new"))
+        self.assertIsNone(cache.get("site", "interstellar", "https://site.tv"))
+
+    def test_ttl_and_lru(self):
+        cache = SearchCache(ttl=0.05, max_entries=1)
+        cache.set("site", "a", "u", ITEMS)
+        cache.set("site", "b", "u", ITEMS)
+        self.assertIsNone(cache.get("site", "a", "u"))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("site", "b", "u"))
+
+    def test_disk_store_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "cache.sqlite3")
+            first = SearchCache(ttl=60, db_path=db_path)
+            first.set("site", "interstellar", "u", ITEMS)
+            first.db.close()
+
+            second = SearchCache(ttl=60, db_path=db_path)
+            self.assertEqual(second.get("site", "interstellar", "u"), ITEMS)
+            second.db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
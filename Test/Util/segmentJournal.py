@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import unittest
+
+
+# Fix path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.Lib.Downloader.journal import SegmentJournal
+
+
+class TestSegmentJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.tmp.name, "0.ts")
+        self.signature = SegmentJournal.signature(["https://cdn/a/0.ts?token=1", "https://cdn/a/1.ts", "https://cdn/a/2.ts"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_run(self, chunks, trailing=b""):
+        journal = SegmentJournal(self.tmp.name)
+        journal.load(self.signature, self.output_path)
+        journal.open(self.signature)
+
+        with open(self.output_path, 'wb') as f:
+            for index, data in enumerate(chunks):
+                f.write(data)
+                f.flush()
+                journal.record(index, len(data))
+            f.write(trailing)
+
+        journal.close()
+
+    def test_resume_truncates_partial_write(self):
+        self._write_run([b"aaa", b"bb"], trailing=b"partial")
+
+        journal = SegmentJournal(self.tmp.name)
+        self.assertEqual(journal.load(self.signature, self.output_path), 2)
+        self.assertEqual(os.path.getsize(self.output_path), 5)
+
+    def test_signature_ignores_query_string(self):
+        other = SegmentJournal.signature(["https://cdn/a/0.ts?token=2", "https://cdn/a/1.ts", "https://cdn/a/2.ts"])
+        self.assertEqual(self.signature, other)
+
+    def test_other_playlist_starts_over(self):
+        self._write_run([b"aaa"])
+
+        journal = SegmentJournal(self.tmp.name)
+        self.assertEqual(journal.load(SegmentJournal.signature(["https://cdn/b/0.ts"]), self.output_path), 0)
+
+    def test_complete_mark(self):
+        journal = SegmentJournal(self.tmp.name)
+        journal.open(self.signature)
+        self.assertFalse(SegmentJournal.is_complete(self.tmp.name))
+
+        journal.close(complete=True)
+        self.assertTrue(SegmentJournal.is_complete(self.tmp.name))
+
+
+if __name__ == '__main__':
+    unittest.main()